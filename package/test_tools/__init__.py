@@ -5,13 +5,16 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 from test_tools.__private import (
+    account_state_cache,
     cleanup_policy,
     constants,
     exceptions,
     paths_to_executables,
+    replay_cache,
     wax_wrapper,
 )
 from test_tools.__private.account import Account, PrivateKey, PublicKey
+from test_tools.__private.account_set import AccountSet
 from test_tools.__private.alternate_chain_specs import AlternateChainSpecs, HardforkSchedule, InitialVesting
 from test_tools.__private.block_log import BlockLog
 from test_tools.__private.process.node_arguments import NodeArguments
@@ -29,6 +32,7 @@ from test_tools.__private.user_handles import RemoteNodeHandle as RemoteNode
 from test_tools.__private.user_handles import WalletHandle as Wallet
 from test_tools.__private.user_handles import WitnessNodeHandle as WitnessNode
 from test_tools.__private.user_handles import context
+from test_tools.__private.wallet.async_wallet import AsyncWallet
 from wax.helpy import Hf26Asset as Asset
 from wax.helpy import OffsetTimeControl, SpeedUpRateTimeControl, StartTimeControl, Time, TimeFormats
 
@@ -36,9 +40,12 @@ __version__ = "0.0.0"
 
 __all__ = [
     "Account",
+    "AccountSet",
+    "account_state_cache",
     "AlternateChainSpecs",
     "ApiNode",
     "Asset",
+    "AsyncWallet",
     "BlockLog",
     "FullApiNode",
     "HardforkSchedule",
@@ -66,6 +73,7 @@ __all__ = [
     "exceptions",
     "logger",
     "paths_to_executables",
+    "replay_cache",
 ]
 
 if TYPE_CHECKING:
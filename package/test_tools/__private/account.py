@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from schemas.fields.basic import PrivateKey as PrivateKeyType
 from schemas.fields.basic import PublicKey as PublicKeyType
 from test_tools.__private.key_generator import KeyGenerator, KeyGeneratorItem
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @dataclass
 class SafeAccount:
@@ -58,12 +62,21 @@ class Account:
 
     @staticmethod
     def create_multiple(
-        number_of_accounts: int, name_base: str = "account", *, secret: str = "secret"
+        number_of_accounts: int, name_base: str = "account", *, secret: str = "secret", parallel: bool = False
     ) -> list[Account]:
-        return [
-            Account(generated, secret=secret)
-            for generated in KeyGenerator.generate_keys(name_base, number_of_accounts=number_of_accounts, secret=secret)
-        ]
+        """
+        Creates accounts named `name_base-0`, `name_base-1`, ... with generated keys.
+
+        :param parallel: If set, keys are generated by all CPU cores (see `KeyGenerator.generate_keys_in_parallel`).
+            Recommended for hundreds of thousands of accounts.
+        """
+        if parallel:
+            generated_keys: Iterable[KeyGeneratorItem] = KeyGenerator.generate_keys_in_parallel(
+                name_base, number_of_accounts=number_of_accounts, secret=secret
+            )
+        else:
+            generated_keys = KeyGenerator.generate_keys(name_base, number_of_accounts=number_of_accounts, secret=secret)
+        return [Account(generated, secret=secret) for generated in generated_keys]
 
     def __generate_keys(self) -> None:
         keys = KeyGenerator.generate_keys(self.__name, secret=self.__secret)[0]
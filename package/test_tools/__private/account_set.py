@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from test_tools.__private.account import Account
+from test_tools.__private.key_generator import KeyGenerator, KeyGeneratorItem
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class _PackedStrings:
+    """Strings stored one after another in single buffer. Offsets of string `i` are `offsets[i]` and `offsets[i+1]`."""
+
+    def __init__(self, data: bytes | bytearray | None = None, offsets: array[int] | None = None) -> None:
+        self.data = bytearray() if data is None else data
+        self.offsets = array("I", [0]) if offsets is None else offsets
+
+    def append(self, value: str) -> None:
+        self.data += value.encode("ascii")
+        self.offsets.append(len(self.data))
+
+    def get(self, index: int) -> str:
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("ascii")
+
+    def iterate(self, start: int, stop: int) -> Iterator[str]:
+        view = memoryview(self.data)
+        offsets = self.offsets
+        for index in range(start, stop):
+            yield str(view[offsets[index] : offsets[index + 1]], "ascii")
+
+    def compacted(self, start: int, stop: int) -> _PackedStrings:
+        """Returns copy holding only strings from `start` to `stop`."""
+        base = self.offsets[start]
+        return _PackedStrings(
+            bytes(self.data[base : self.offsets[stop]]),
+            array("I", (offset - base for offset in self.offsets[start : stop + 1])),
+        )
+
+    def get_size_in_bytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class AccountSet(Sequence[Account]):
+    """
+    Memory-efficient, immutable sequence of accounts with keys, e.g. created with `Wallet.create_accounts`.
+
+    Names and keys of all accounts are stored in contiguous buffers, instead of separate objects for each account, so
+    million of accounts takes about 125 MB instead of gigabytes taken by list of `Account` objects. `Account` objects
+    are created only when accessed with index or iteration.
+
+    Slicing doesn't copy data, slices share buffers with original set. Slice is compacted only when pickled, e.g.
+    when passed to worker process, so each worker receives only its own chunk of accounts.
+    """
+
+    def __init__(self, accounts: Iterable[Account | KeyGeneratorItem] = (), *, secret: str = "secret") -> None:
+        """
+        Creates set of given accounts.
+
+        :param accounts: Accounts or generated keys. Keys of accounts, which weren't generated yet, are generated here.
+        :param secret: Secret used to generate keys of accounts. All accounts must use the same one.
+        """
+        self.__secret = secret
+        self.__names = _PackedStrings()
+        self.__private_keys = _PackedStrings()
+        self.__public_keys = _PackedStrings()
+        for account in accounts:
+            self.__append(account)
+        self.__start = 0
+        self.__stop = len(self.__names.offsets) - 1
+
+    @classmethod
+    def create(
+        cls, number_of_accounts: int, name_base: str = "account", *, secret: str = "secret", parallel: bool = False
+    ) -> AccountSet:
+        """
+        Creates accounts named `name_base-0`, `name_base-1`, ... with generated keys.
+
+        :param parallel: If set, keys are generated by all CPU cores (see `KeyGenerator.generate_keys_in_parallel`).
+            Recommended for hundreds of thousands of accounts, as keys are not held in memory twice then.
+        """
+        if parallel:
+            generated_keys: Iterable[KeyGeneratorItem] = KeyGenerator.generate_keys_in_parallel(
+                name_base, number_of_accounts=number_of_accounts, secret=secret
+            )
+        else:
+            generated_keys = KeyGenerator.generate_keys(name_base, number_of_accounts=number_of_accounts, secret=secret)
+        return cls(generated_keys, secret=secret)
+
+    @property
+    def secret(self) -> str:
+        return self.__secret
+
+    def names(self) -> Iterator[str]:
+        """Yields names of accounts, without creating `Account` objects."""
+        return self.__names.iterate(self.__start, self.__stop)
+
+    def private_keys(self) -> Iterator[str]:
+        """Yields private keys of accounts, without creating `Account` objects."""
+        return self.__private_keys.iterate(self.__start, self.__stop)
+
+    def public_keys(self) -> Iterator[str]:
+        """Yields public keys of accounts, without creating `Account` objects."""
+        return self.__public_keys.iterate(self.__start, self.__stop)
+
+    def chunks(self, size: int) -> Iterator[AccountSet]:
+        """Splits set into consecutive slices of `size` accounts (last one can be smaller). Data is not copied."""
+        assert size >= 1
+        for start in range(0, len(self), size):
+            yield self[start : start + size]
+
+    def get_size_in_bytes(self) -> int:
+        """Returns size of buffers shared by this set (whole original set, when called on slice)."""
+        return sum(column.get_size_in_bytes() for column in (self.__names, self.__private_keys, self.__public_keys))
+
+    @overload
+    def __getitem__(self, index: int) -> Account: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> AccountSet: ...
+
+    def __getitem__(self, index: int | slice) -> Account | AccountSet:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return AccountSet((self[i] for i in range(start, stop, step)), secret=self.__secret)
+            return self.__create_view(self.__start + start, self.__start + max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("AccountSet index out of range")
+
+        index += self.__start
+        generated = KeyGeneratorItem.from_keys(
+            self.__names.get(index), (self.__private_keys.get(index), self.__public_keys.get(index))
+        )
+        return Account(generated, secret=self.__secret)
+
+    def __iter__(self) -> Iterator[Account]:
+        for name, private_key, public_key in zip(self.names(), self.private_keys(), self.public_keys(), strict=True):
+            yield Account(KeyGeneratorItem.from_keys(name, (private_key, public_key)), secret=self.__secret)
+
+    def __len__(self) -> int:
+        return self.__stop - self.__start
+
+    def __repr__(self) -> str:
+        return f"AccountSet({len(self)} accounts)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "secret": self.__secret,
+            "names": self.__names.compacted(self.__start, self.__stop),
+            "private_keys": self.__private_keys.compacted(self.__start, self.__stop),
+            "public_keys": self.__public_keys.compacted(self.__start, self.__stop),
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__secret = state["secret"]
+        self.__names = state["names"]
+        self.__private_keys = state["private_keys"]
+        self.__public_keys = state["public_keys"]
+        self.__start = 0
+        self.__stop = len(self.__names.offsets) - 1
+
+    def __append(self, account: Account | KeyGeneratorItem) -> None:
+        if isinstance(account, Account):
+            if account.secret != self.__secret:
+                raise ValueError(f"Account {account.name} uses other secret than set ({self.__secret!r})")
+            name = account.name
+        else:
+            name = account.account_name
+
+        self.__names.append(str(name))
+        self.__private_keys.append(str(account.private_key))
+        self.__public_keys.append(str(account.public_key))
+
+    def __create_view(self, start: int, stop: int) -> AccountSet:
+        view = AccountSet.__new__(AccountSet)
+        view.__secret = self.__secret
+        view.__names = self.__names
+        view.__private_keys = self.__private_keys
+        view.__public_keys = self.__public_keys
+        view.__start = start
+        view.__stop = stop
+        return view
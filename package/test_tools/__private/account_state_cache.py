@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from loguru import logger
+
+from test_tools.__private.account_set import AccountSet
+from test_tools.__private.block_log import BlockLog
+from test_tools.__private.process.node_process import NodeProcess
+from test_tools.__private.snapshot import Snapshot
+from test_tools.__private.wallet.constants import ACCOUNT_PER_TRANSACTION
+
+if TYPE_CHECKING:
+    from test_tools.__private.alternate_chain_specs import AlternateChainSpecs
+    from test_tools.__private.node import Node
+    from test_tools.__private.user_handles.handles.node_handles.runnable_node_handle import RunnableNodeHandle
+    from test_tools.__private.wallet.wallet import Wallet
+    from wax.helpy import Hf26Asset as Asset
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: Final[str] = "TEST_TOOLS_ACCOUNT_STATE_CACHE_DIRECTORY"
+SNAPSHOT_NAME: Final[str] = "preloaded_accounts"
+PARALLEL_KEY_GENERATION_THRESHOLD: Final[int] = 10_000
+
+__directory: Path | None = (
+    Path(os.environ[CACHE_DIRECTORY_ENVIRONMENT_VARIABLE])
+    if CACHE_DIRECTORY_ENVIRONMENT_VARIABLE in os.environ
+    else None
+)
+
+
+@dataclass(frozen=True)
+class PreloadedAccounts:
+    """Snapshot of blockchain state with created accounts, ready to be loaded by nodes."""
+
+    snapshot: Snapshot
+    accounts: AccountSet
+    alternate_chain_specs: AlternateChainSpecs | None
+
+    def run_node(self, node: RunnableNodeHandle, **kwargs: Any) -> None:
+        """Runs node from the snapshot, with the same alternate chain specs, which were used to create accounts."""
+        node.run(load_snapshot_from=self.snapshot, alternate_chain_specs=self.alternate_chain_specs, **kwargs)
+
+
+def set_directory(directory: Path | str | None) -> None:
+    """
+    Enables cache of snapshots with preloaded accounts, stored in `directory`, or disables it when `None` is passed.
+
+    Cache can be also enabled with `TEST_TOOLS_ACCOUNT_STATE_CACHE_DIRECTORY` environment variable. Cache is shared by
+    all processes using the same directory, so it can be reused by consecutive test runs.
+    """
+    global __directory  # noqa: PLW0603
+    __directory = None if directory is None else Path(directory).absolute()
+
+
+def get_directory() -> Path | None:
+    return __directory
+
+
+def calculate_key(
+    *,
+    number_of_accounts: int,
+    name_base: str,
+    secret: str,
+    hives: Asset.TestT | None,
+    hbds: Asset.TbdT | None,
+    vests: Asset.TestT | None,
+    alternate_chain_specs: AlternateChainSpecs | None,
+    build_commit_hash: str,
+) -> str:
+    """Calculates key identifying state with accounts created with given parameters by given hived build."""
+    inputs = {
+        "number_of_accounts": number_of_accounts,
+        "name_base": name_base,
+        "secret": secret,
+        "hives": None if hives is None else hives.as_legacy(),
+        "hbds": None if hbds is None else hbds.as_legacy(),
+        "vests": None if vests is None else vests.as_legacy(),
+        "alternate_chain_specs": (
+            None if alternate_chain_specs is None else json.loads(alternate_chain_specs.json(exclude_none=True))
+        ),
+        "build_commit_hash": build_commit_hash,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def preload_accounts(
+    number_of_accounts: int,
+    name_base: str = "account",
+    *,
+    secret: str = "secret",
+    hives: Asset.TestT | None = None,
+    hbds: Asset.TbdT | None = None,
+    vests: Asset.TestT | None = None,
+    alternate_chain_specs: AlternateChainSpecs | None = None,
+) -> PreloadedAccounts:
+    """
+    Returns snapshot of state with accounts `name_base-0`, `name_base-1`, ... funded with given amounts.
+
+    Accounts are created once by init node, which snapshot is stored in cache (see `set_directory`). Next requests
+    with the same parameters, served by the same hived build, only load it, which takes seconds instead of minutes
+    of block production needed to create hundreds of thousands of accounts. When cache is disabled, accounts are
+    created each time.
+
+    :param hives: Amount transferred to each account. Transfers are skipped, when `None` is passed.
+    :param hbds: Amount transferred to each account. Transfers are skipped, when `None` is passed.
+    :param vests: Amount of HIVE powered up to each account. Power ups are skipped, when `None` is passed.
+    :param alternate_chain_specs: Specs used by init node, which creates accounts. Nodes loading the snapshot should
+        be run with the same specs (see `PreloadedAccounts.run_node`).
+    """
+    from test_tools.__private.init_node import InitNode
+
+    key = calculate_key(
+        number_of_accounts=number_of_accounts,
+        name_base=name_base,
+        secret=secret,
+        hives=hives,
+        hbds=hbds,
+        vests=vests,
+        alternate_chain_specs=alternate_chain_specs,
+        build_commit_hash=__get_build_commit_hash(),
+    )
+
+    accounts = AccountSet.create(
+        number_of_accounts,
+        name_base,
+        secret=secret,
+        parallel=number_of_accounts >= PARALLEL_KEY_GENERATION_THRESHOLD,
+    )
+    directory = get_directory()
+    entry = None if directory is None else directory / key
+    if entry is not None and entry.exists():
+        logger.info(f"Preloaded accounts taken from {entry}")
+        snapshot = Snapshot(entry / "snapshot" / SNAPSHOT_NAME, BlockLog(entry / "blockchain"))
+    else:
+        node = InitNode(network=None)
+        __create_accounts(
+            node, accounts, hives=hives, hbds=hbds, vests=vests, alternate_chain_specs=alternate_chain_specs
+        )
+        snapshot = node.dump_snapshot(name=SNAPSHOT_NAME, close=True)
+        if entry is not None:
+            __store(snapshot, entry)
+
+    return PreloadedAccounts(snapshot=snapshot, accounts=accounts, alternate_chain_specs=alternate_chain_specs)
+
+
+def __get_build_commit_hash() -> str:
+    """Returns commit hash of hived build, the same as used by replay cache, without creating node."""
+    with tempfile.TemporaryDirectory() as directory:
+        return NodeProcess(directory, logger).get_build_commit_hash()
+
+
+def __create_accounts(
+    node: Node,
+    accounts: AccountSet,
+    *,
+    hives: Asset.TestT | None,
+    hbds: Asset.TbdT | None,
+    vests: Asset.TestT | None,
+    alternate_chain_specs: AlternateChainSpecs | None,
+) -> None:
+    from test_tools.__private.wallet.wallet import Wallet
+
+    node.run(alternate_chain_specs=alternate_chain_specs)
+    wallet = Wallet(attach_to=node)
+    try:
+        wallet.create_accounts(accounts, import_keys=False)
+        __fund(node, wallet, accounts, hives=hives, hbds=hbds, vests=vests)
+    finally:
+        wallet.close()
+
+    # Snapshot is dumped from state at last irreversible block.
+    node.wait_for_irreversible_block()
+
+
+def __fund(
+    node: Node,
+    wallet: Wallet,
+    accounts: AccountSet,
+    *,
+    hives: Asset.TestT | None,
+    hbds: Asset.TbdT | None,
+    vests: Asset.TestT | None,
+) -> None:
+    """Funds accounts with transactions broadcast without waiting, then confirms their inclusion all at once."""
+    from test_tools.__private.wallet.create_accounts import InclusionTracker
+    from test_tools.__private.wallet.inclusion_scanner import BLOCK_INTERVAL
+
+    if hives is None and hbds is None and vests is None:
+        return
+
+    tracker = InclusionTracker(node)
+    operations_per_account = sum(amount is not None for amount in (hives, hbds, vests))
+    for chunk in accounts.chunks(ACCOUNT_PER_TRANSACTION // operations_per_account):
+        with wallet.in_single_transaction(blocking=False) as transaction:
+            for name in chunk.names():
+                if hives is not None:
+                    wallet.api.transfer("initminer", name, hives, "memo")
+                if hbds is not None:
+                    wallet.api.transfer("initminer", name, hbds, "memo")
+                if vests is not None:
+                    wallet.api.transfer_to_vesting("initminer", name, vests)
+
+        response = transaction.get_response()
+        assert response is not None
+        tracker.track(response.transaction_id, chunk, response.expiration)
+
+    while len(tracker) > 0:
+        time.sleep(BLOCK_INTERVAL)
+        if expired := tracker.scan():
+            raise RuntimeError(f"Funding of {sum(len(chunk) for chunk in expired)} accounts was not included in blocks")
+
+
+def __store(snapshot: Snapshot, entry: Path) -> None:
+    """Saves snapshot with its block log in cache `entry`."""
+    # Entry is filled under temporary name first, so other processes never see partially copied state.
+    temporary_entry = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    temporary_entry.mkdir(parents=True)
+    snapshot.copy_to(temporary_entry)
+    try:
+        temporary_entry.rename(entry)
+    except OSError:  # stored in the meantime by other process
+        shutil.rmtree(temporary_entry)
+        return
+    logger.info(f"Preloaded accounts stored in {entry}")
@@ -41,6 +41,10 @@ class BaseNode(UserHandleImplementation, HivedTemplate[Settings]):
     def is_running(self) -> bool:
         return True
 
+    def get_run_id(self) -> int:
+        """Returns number, which changes each time node is restarted. Allows to invalidate data cached per node run."""
+        return 0
+
     def _logger_extras(self) -> dict[str, Any]:
         return {**super()._logger_extras(), "name": self.get_name()}
 
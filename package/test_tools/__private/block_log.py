@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import bisect
+import concurrent.futures
 import contextlib
 import json
-import shutil
+import math
+import os
 import subprocess
 import typing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar, Final, Literal, overload
+from typing import Any, ClassVar, Final, Literal, overload
+
+from loguru import logger
 
 from schemas.apis.block_api.fundaments_of_responses import (
     BlockLogUtilSignedBlockBaseTransaction,
@@ -14,16 +20,40 @@ from schemas.apis.block_api.fundaments_of_responses import (
 )
 from schemas.errors import ValidationError
 from test_tools.__private import paths_to_executables
-from test_tools.__private.exceptions import BlockLogError, BlockLogUtilError, MissingBlockLogArtifactsError
+from test_tools.__private.block_log_reader import (
+    BLOCKS_IN_SPLIT_BLOCK_LOG_FILE,
+    POSITION_SIZE,
+    BlockLogFileReader,
+    do_artifacts_match_block_file,
+    get_first_block_number_of_part,
+)
+from test_tools.__private.exceptions import (
+    BlockLogError,
+    BlockLogUtilError,
+    MissingBlockLogArtifactsError,
+    UnsupportedBlockLogFormatError,
+)
+from test_tools.__private.utilities.file_copying import CopyStrategy, copy_file, copy_file_prefix
 from wax.helpy._interfaces.time import Time, TimeFormats
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
     from datetime import datetime
 
 BlockLogUtilResultTransaction = BlockLogUtilSignedBlockBaseTransaction
 BlockLogUtilResultTransactionLegacy = BlockLogUtilSignedBlockBaseTransactionLegacy
 
 
+@dataclass(frozen=True)
+class IndexedBlockFile:
+    first_block_number: int
+    last_block_number: float
+    block_file: Path
+
+    def contains(self, block_number: int) -> bool:
+        return self.first_block_number <= block_number <= self.last_block_number
+
+
 class BlockLog:
     MONO_BLOCK_FILE_NAME: ClassVar[str] = "block_log"
     MONO_ARTIFACTS_FILE_NAME: ClassVar[str] = "block_log.artifacts"
@@ -40,6 +70,10 @@ class BlockLog:
         else:
             self.__is_split = mode == "split"
 
+        self.__index: list[IndexedBlockFile] | None = None
+        self.__indexed_files_state: list[tuple[Path, int, int]] = []
+        self.__readers: dict[Path, BlockLogFileReader | None] = {}
+
     def __auto_determine_mode(self) -> bool:
         """Determine which 'split' mode to use based on files existence."""
         split_files = BlockLog.get_existing_block_files(True, self.__path)
@@ -105,6 +139,7 @@ class BlockLog:
         destination: Path | str,
         *,
         artifacts: Literal["required", "optional", "excluded"] = "excluded",
+        copy_strategy: CopyStrategy = "auto",
     ) -> BlockLog:
         """
         Copies block log and its artifacts (if requested via `artifacts` parameter) to specified `destination`.
@@ -121,9 +156,14 @@ class BlockLog:
             - "required" -- Artifacts are always copied. Missing artifacts are treated as error.
             - "optional" -- Artifacts are copied if exists. This is not a problem when artifacts are missing.
             - "excluded" -- Artifacts are never copied.
+        :param copy_strategy: Decides how content of files is transferred. By default, files are cloned (copy-on-write)
+            when filesystem supports it and copied otherwise. Hardlinks ("hardlink") can be used only when neither
+            source nor copied block log will be modified, e.g. for replays stopped before producing new blocks. See
+            `CopyStrategy` for details.
         :return: Copy of source block log.
         """
         assert self.__path.exists(), f"Given block log path of '{self.__path}' does not exist."
+        self.close()
         destination = Path(destination)
         destination = destination if destination.is_dir() else destination.parent
 
@@ -133,12 +173,16 @@ class BlockLog:
         if artifacts not in artifacts_allowed_values:
             raise ValueError(f"{artifacts=}, but supported values are: {', '.join(artifacts_allowed_values)}.")
 
+        copy_strategy_allowed_values = typing.get_args(CopyStrategy)
+        if copy_strategy not in copy_strategy_allowed_values:
+            raise ValueError(f"{copy_strategy=}, but supported values are: {', '.join(copy_strategy_allowed_values)}.")
+
         if artifacts != "excluded":
             file_list = self.artifact_files
             if file_list:
                 for file in file_list:
                     if not self.__same_copying_destination(file, destination):
-                        shutil.copy(file, destination)
+                        copy_file(file, destination, copy_strategy)
             elif artifacts == "required":
                 self.__raise_missing_artifacts_error(self.path)
             else:
@@ -146,7 +190,7 @@ class BlockLog:
 
         for file in self.block_files:
             if not self.__same_copying_destination(file, destination):
-                shutil.copy(file, destination)
+                copy_file(file, destination, copy_strategy)
         return BlockLog(destination, "split" if self.__is_split else "monolithic")
 
     def __same_copying_destination(self, file: Path, destination: Path) -> bool:
@@ -159,29 +203,60 @@ class BlockLog:
             - `output_directory` / block_log,
             - `output_directory` / block_log.artifacts.
 
+        Source block log isn't copied as a whole. Only files with blocks up to `block_number` are written to
+        `output_directory` and file containing this block is cut just after it (end of block is read from artifacts).
+        Artifacts of cut file are generated again. block_log_util truncation is used only when block log can't be
+        read natively.
+
         :param output_directory: In this directory truncated `block_log` and `block_log.artifacts` will be stored.
         :param block_number: Limit number of blocks in the output block log.
         :return: Truncated block log.
         """
-        copied = self.copy_to(Path(output_directory))
-        for file in reversed(copied.block_files):
-            process = subprocess.run(
-                [
-                    paths_to_executables.get_path_of("block_log_util"),
-                    f"--block-log={Path(file).absolute()}",
-                    f"--block-number={block_number}",
-                    "--truncate",
-                    "--force",
-                ],
-                check=False,
-            )
-            if process.returncode == 0:
-                return BlockLog(Path(output_directory), "split" if self.__is_split else "monolithic")
+        output_directory = Path(output_directory)
+        output_directory.mkdir(parents=True, exist_ok=True)
+        truncated = self.__get_block_file_of(block_number).block_file
 
-            file.unlink()
+        for file in self.block_files:
+            if file < truncated and not self.__same_copying_destination(file, output_directory):
+                copy_file(file, output_directory / file.name)
+                if self.__are_artifacts_up_to_date(file):
+                    copy_file(self.get_artifacts_file(file), output_directory)
+
+        # Remains of previous content of output directory (or of source block log, when truncated in place).
+        for output_file in BlockLog.get_existing_block_files(self.__is_split, output_directory):
+            if output_file.name > truncated.name:
+                output_file.unlink()
+                self.get_artifacts_file(output_file).unlink(missing_ok=True)
+
+        reader = self.__get_reader(truncated)
+        entry = None if reader is None else reader.get_entry(block_number)
+        # Files are mapped again, when read after truncation, as they might be changed.
+        self.close()
+        if entry is None or self.__same_copying_destination(truncated, output_directory):
+            self.__truncate_using_block_log_util(truncated, output_directory, block_number)
+        else:
+            output_file = output_directory / truncated.name
+            self.get_artifacts_file(output_file).unlink(missing_ok=True)
+            copy_file_prefix(truncated, output_file, entry.position + entry.size + POSITION_SIZE)
+            self.__generate_artifacts_for(output_file)
 
-        split_str = "split" if self.__is_split else "monolithic"
-        raise BlockLogUtilError(f"No file of {split_str} block log in {self.__path} could be sussessfully truncated.")
+        return BlockLog(output_directory, "split" if self.__is_split else "monolithic")
+
+    def __truncate_using_block_log_util(self, block_file: Path, output_directory: Path, block_number: int) -> None:
+        output_file = copy_file(block_file, output_directory)
+        process = subprocess.run(
+            [
+                paths_to_executables.get_path_of("block_log_util"),
+                f"--block-log={output_file.absolute()}",
+                f"--block-number={block_number}",
+                "--truncate",
+                "--force",
+            ],
+            check=False,
+        )
+        if process.returncode != 0:
+            output_file.unlink()
+            raise BlockLogUtilError(f"Block log file {block_file} could not be successfully truncated.")
 
     def __run_and_get_output(self, *args: str) -> str:
         process = subprocess.run(
@@ -194,78 +269,231 @@ class BlockLog:
             )
         return process.stdout.decode().strip()
 
-    def generate_artifacts(self) -> None:
-        """Generate artifacts file(s)."""
+    def generate_artifacts(self, *, parallel: bool = False, max_workers: int | None = None) -> None:
+        """
+        Generate artifacts file(s).
+
+        :param parallel: If set, artifacts of block log files are generated concurrently by up to `max_workers`
+            block_log_util processes and files, which already have up-to-date artifacts, are skipped. Progress is
+            reported to the logger.
+        :param max_workers: Limit of concurrently running block_log_util processes. Number of CPUs by default.
+        """
         file_list = self.block_files
-        for file in file_list:
-            block_log_arg = ["--block-log", str(file)]
-            self.__run_and_get_output("--generate-artifacts", *block_log_arg)
+        if not parallel:
+            for file in file_list:
+                self.__generate_artifacts_for(file)
+            return
+
+        outdated = [file for file in file_list if not self.__are_artifacts_up_to_date(file)]
+        logger.info(f"Generating artifacts for {len(outdated)} of {len(file_list)} block log files in {self.__path}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {executor.submit(self.__generate_artifacts_for, file): file for file in outdated}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                future.result()
+                logger.info(f"Generated artifacts for {futures[future].name} ({done}/{len(outdated)})")
+
+    def __generate_artifacts_for(self, block_file: Path) -> None:
+        self.__run_and_get_output("--generate-artifacts", "--block-log", str(block_file))
+
+    def __are_artifacts_up_to_date(self, block_file: Path) -> bool:
+        artifacts_file = self.get_artifacts_file(block_file)
+        if not artifacts_file.exists():
+            return False
+
+        return artifacts_file.stat().st_mtime_ns >= block_file.stat().st_mtime_ns and do_artifacts_match_block_file(
+            block_file, artifacts_file, self.__get_first_block_number(block_file)
+        )
+
+    @staticmethod
+    def get_artifacts_file(block_file: Path) -> Path:
+        """Returns path of artifacts file, which belongs to given block log file (monolithic or part of split)."""
+        return block_file.with_name(f"{block_file.name}.artifacts")
+
+    def __get_first_block_number(self, block_file: Path) -> int:
+        if not self.__is_split:
+            return 1
+        return get_first_block_number_of_part(int(block_file.suffix.lstrip(".")))
+
+    def __get_index(self) -> list[IndexedBlockFile]:
+        """
+        Returns index of block log files with ranges of blocks stored in them.
+
+        Index is built once and rebuilt only when set of block log files, their modification times or sizes change.
+        """
+        files_state = []
+        for file in self.__block_files_force():
+            stat = file.stat()
+            files_state.append((file, stat.st_mtime_ns, stat.st_size))
+        if self.__index is None or files_state != self.__indexed_files_state:
+            self.close()
+            self.__indexed_files_state = files_state
+            self.__index = [self.__index_block_file(file) for file, *_ in files_state]
+        return self.__index
+
+    def __index_block_file(self, block_file: Path) -> IndexedBlockFile:
+        first_block_number = self.__get_first_block_number(block_file)
+        reader = self.__get_reader(block_file)
+        if reader is not None:
+            last_block_number: float = reader.head_block_number
+        elif self.__is_split:
+            last_block_number = first_block_number + BLOCKS_IN_SPLIT_BLOCK_LOG_FILE - 1
+        else:
+            last_block_number = math.inf  # unknown without block_log_util
+        return IndexedBlockFile(first_block_number, last_block_number, block_file)
+
+    def __get_block_file_of(self, block_number: int) -> IndexedBlockFile:
+        index = self.__get_index()
+        position = bisect.bisect_right(index, block_number, key=lambda indexed: indexed.first_block_number) - 1
+        if position < 0 or not index[position].contains(block_number):
+            raise BlockLogUtilError(f"Block {block_number} not found in {self.__path}")
+        return index[position]
+
+    def __get_reader(self, block_file: Path) -> BlockLogFileReader | None:
+        """Returns cached reader of given file or None, when file can't be read natively."""
+        if block_file not in self.__readers:
+            try:
+                self.__readers[block_file] = self.__open_reader(block_file)
+            except UnsupportedBlockLogFormatError:
+                self.__readers[block_file] = None
+        return self.__readers[block_file]
+
+    def __open_reader(self, block_file: Path) -> BlockLogFileReader:
+        artifacts_file = self.get_artifacts_file(block_file)
+        if not artifacts_file.exists():
+            self.__generate_artifacts_for(block_file)
+        return BlockLogFileReader(block_file, artifacts_file, self.__get_first_block_number(block_file))
+
+    def close(self) -> None:
+        """
+        Unmaps block log files read natively. They are mapped again when needed.
+
+        Should be called, when block log files are going to be modified or removed, or when block log is no longer used.
+        """
+        for reader in self.__readers.values():
+            if reader is not None:
+                reader.close()
+        self.__readers.clear()
+        self.__index = None
+
+    @staticmethod
+    def __parse_block(block: dict[str, Any]) -> BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy:
+        try:
+            return BlockLogUtilResultTransaction.parse_builtins(block)
+        except ValidationError:
+            return BlockLogUtilResultTransactionLegacy.parse_builtins(block)
 
     def get_head_block_number(self) -> int:
         """
         Get number of head block in block_log.
 
-        Note: This method works correctly only for block logs with a length of at least 30 blocks.
+        Note: block_log_util is used only when block log can't be read natively. In such case this method works
+        correctly only for block logs with a length of at least 30 blocks.
         """
-        block_files = self.__block_files_force()
-        artifacts_list = self.artifact_files
-        if not artifacts_list:
-            self.generate_artifacts()
-        block_log_arg = ["--block-log", str(block_files[-1])]
-        return int(self.__run_and_get_output("--get-head-block-number", *block_log_arg))
+        last_indexed = self.__get_index()[-1]
+        reader = self.__get_reader(last_indexed.block_file)
+        if reader is not None:
+            return reader.head_block_number
+
+        return int(self.__run_and_get_output("--get-head-block-number", "--block-log", str(last_indexed.block_file)))
 
     def get_block(self, block_number: int) -> BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy:
         """
         Returns a block from block_log.
 
-        :param block_number: Number of block to return
+        Block is read directly from block log file, which contains it. When block log can't be read natively (e.g.
+        block is compressed with hived built-in dictionary) block_log_util is used as a fallback.
 
-        Note: This method works correctly only for block logs with a length of at least 30 blocks.
+        :param block_number: Number of block to return
         """
-        artifacts_list = self.artifact_files
-        if not artifacts_list:
-            self.generate_artifacts()
+        block_file = self.__get_block_file_of(block_number).block_file
+        reader = self.__get_reader(block_file)
+        if reader is not None:
+            with contextlib.suppress(UnsupportedBlockLogFormatError):
+                return self.__parse_block(reader.get_block(block_number))
+
+        return self.__get_block_using_block_log_util(block_file, block_number)
+
+    def __get_block_using_block_log_util(
+        self, block_file: Path, block_number: int
+    ) -> BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy:
         expected_str: Final[str] = "block_id"
 
-        block_files = self.__block_files_force()
-        block_number_arg = ["--block-number", f"{block_number}"]
-        output: str = ""
-        for log in block_files:
-            block_log_arg = ["--block-log", str(log)]
-            with contextlib.suppress(BlockLogUtilError):
-                output = self.__run_and_get_output("--get-block", *block_log_arg, *block_number_arg).replace("'", '"')
-            if expected_str in output:
+        output = self.__run_and_get_output(
+            "--get-block", "--block-log", str(block_file), "--block-number", f"{block_number}"
+        ).replace("'", '"')
+        if expected_str not in output:
+            raise BlockLogUtilError(f"Block {block_number} not found or response malformed: `{output}`")
+        return self.__parse_block(json.loads(output))
+
+    def iter_blocks(
+        self, start: int = 1, stop: int | None = None
+    ) -> Iterator[BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy]:
+        """
+        Yields blocks with numbers from range [`start`, `stop`) in ascending order.
+
+        Blocks are streamed from memory-mapped block log files, so even millions of blocks can be scanned in constant
+        memory. Blocks, which are not stored in block log, are skipped.
+
+        :param start: Number of the first block to yield.
+        :param stop: Number of the block after the last one to yield. By default, all blocks up to head are yielded.
+        """
+        stop_at: float = math.inf if stop is None else stop
+        for indexed in self.__get_index():
+            if indexed.first_block_number >= stop_at or indexed.last_block_number < start:
+                continue
+
+            reader = self.__get_reader(indexed.block_file)
+            if reader is None:
+                yield from self.__iter_blocks_using_block_log_util(indexed.block_file, start, stop_at)
+                continue
+
+            block_number = max(start, reader.first_block_number)
+            while block_number < stop_at and reader.contains(block_number):
                 try:
-                    return BlockLogUtilResultTransaction.parse_builtins(json.loads(output))
-                except ValidationError:
-                    return BlockLogUtilResultTransactionLegacy.parse_builtins(json.loads(output))
-        raise BlockLogUtilError(f"Block {block_number} not found or response malformed: `{output}`")
+                    yield self.__parse_block(reader.get_block(block_number))
+                except UnsupportedBlockLogFormatError:
+                    yield self.__get_block_using_block_log_util(indexed.block_file, block_number)
+                block_number += 1
+
+    def __iter_blocks_using_block_log_util(
+        self, block_file: Path, start: int, stop: float
+    ) -> Iterator[BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy]:
+        head_block_number = int(self.__run_and_get_output("--get-head-block-number", "--block-log", str(block_file)))
+        block_number = max(start, self.__get_first_block_number(block_file))
+        while block_number < stop and block_number <= head_block_number:
+            yield self.__get_block_using_block_log_util(block_file, block_number)
+            block_number += 1
+
+    def get_block_range(
+        self, start: int, stop: int
+    ) -> list[BlockLogUtilResultTransaction | BlockLogUtilResultTransactionLegacy]:
+        """
+        Returns blocks with numbers from range [`start`, `stop`).
+
+        All blocks are held in memory, use `iter_blocks` for long ranges.
+        """
+        return list(self.iter_blocks(start, stop))
 
     def get_block_ids(self, block_number: int) -> str:
         """
         Returns a block_ID from block_log.
 
         :param block_number: ID of block to return
-
-        Note: This method works correctly only for block logs with a length of at least 30 blocks.
         """
         expected_str: Final[str] = "block_id: "
 
-        artifacts_list = self.artifact_files
-        if not artifacts_list:
-            self.generate_artifacts()
-
-        output = ""
-        block_files = self.__block_files_force()
-        for file in block_files:
-            with contextlib.suppress(BlockLogUtilError):
-                output = self.__run_and_get_output(
-                    "--get-block-ids", "-n", f"{block_number}", "--block-log", str(file)
-                ).replace("'", '"')
-            if expected_str in output:
-                return output[len(expected_str) :]
-
-        raise BlockLogUtilError(f"Block not found or response malformed: `{output}`")
+        block_file = self.__get_block_file_of(block_number).block_file
+        reader = self.__get_reader(block_file)
+        if reader is not None:
+            with contextlib.suppress(UnsupportedBlockLogFormatError):
+                return reader.get_block_id(block_number)
+
+        output = self.__run_and_get_output(
+            "--get-block-ids", "-n", f"{block_number}", "--block-log", str(block_file)
+        ).replace("'", '"')
+        if expected_str not in output:
+            raise BlockLogUtilError(f"Block not found or response malformed: `{output}`")
+        return output[len(expected_str) :]
 
     @overload
     def get_head_block_time(
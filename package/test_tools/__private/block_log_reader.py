@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Final
+
+from test_tools.__private.exceptions import BlockLogError, UnsupportedBlockLogFormatError
+from test_tools.__private.wax_wrapper import (
+    deserialize_transaction,
+    get_public_key_from_signature,
+    serialize_transaction,
+)
+from wax.exceptions import WaxError
+
+try:
+    import zstandard  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # optional dependency, without it compressed blocks are read by block_log_util (see `BlockLog`)
+    zstandard = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+BLOCKS_IN_SPLIT_BLOCK_LOG_FILE: Final[int] = 1_000_000
+
+POSITION_SIZE: Final[int] = 8
+BLOCK_ID_SIZE: Final[int] = 20
+SIGNATURE_SIZE: Final[int] = 65
+MAX_TRANSACTION_SIZE: Final[int] = 64 * 1024
+"""Same as HIVE_MAX_TRANSACTION_SIZE, no transaction in block can be longer."""
+ARTIFACT_CHUNK_SIZE: Final[int] = POSITION_SIZE + BLOCK_ID_SIZE
+"""Each artifacts chunk holds block position (with flags in the highest bits) followed by block id."""
+
+POSITION_MASK: Final[int] = 0x0000_FFFF_FFFF_FFFF
+COMPRESSED_FLAG: Final[int] = 1 << 63
+DICTIONARY_FLAG: Final[int] = 1 << 56
+
+BLOCK_HEADER_EXTENSION_TYPES: Final[tuple[str, ...]] = ("void_t", "version", "hardfork_version_vote")
+
+
+def get_block_number_from_block_id(block_id: bytes) -> int:
+    return int.from_bytes(block_id[:4], "big")
+
+
+def get_first_block_number_of_part(part_number: int) -> int:
+    return (part_number - 1) * BLOCKS_IN_SPLIT_BLOCK_LOG_FILE + 1
+
+
+def get_part_number_of_block(block_number: int) -> int:
+    return (block_number - 1) // BLOCKS_IN_SPLIT_BLOCK_LOG_FILE + 1
+
+
+def do_artifacts_match_block_file(block_file: Path, artifacts_file: Path, first_block_number: int = 1) -> bool:
+    """
+    Checks whether artifacts describe all blocks of block log file, reading only few bytes of both files.
+
+    Last chunk of artifacts has to point at the head block of block log file and artifacts have to be long enough to
+    hold chunks of all blocks from `first_block_number` to the head one (so truncated or stale artifacts are rejected).
+    """
+    artifacts_size = artifacts_file.stat().st_size
+    if block_file.stat().st_size < POSITION_SIZE or artifacts_size < ARTIFACT_CHUNK_SIZE:
+        return False
+
+    with block_file.open("rb") as file:
+        file.seek(-POSITION_SIZE, 2)
+        (head_position_with_flags,) = struct.unpack("<Q", file.read(POSITION_SIZE))
+
+    with artifacts_file.open("rb") as file:
+        file.seek(-ARTIFACT_CHUNK_SIZE, 2)
+        (position_with_flags,) = struct.unpack("<Q", file.read(POSITION_SIZE))
+        head_block_number = get_block_number_from_block_id(file.read(BLOCK_ID_SIZE))
+        expected_size = (head_block_number - first_block_number + 1) * ARTIFACT_CHUNK_SIZE
+        if position_with_flags != head_position_with_flags or expected_size <= 0 or artifacts_size < expected_size:
+            return False
+
+        file.seek(artifacts_size - expected_size + POSITION_SIZE)
+        return get_block_number_from_block_id(file.read(BLOCK_ID_SIZE)) == first_block_number
+
+
+@dataclass(frozen=True)
+class BlockLogEntry:
+    block_number: int
+    block_id: str
+    position: int
+    size: int
+    is_compressed: bool
+    dictionary_number: int | None
+
+    @classmethod
+    def from_position_with_flags(
+        cls, block_number: int, block_id: bytes, position_with_flags: int, end_position: int
+    ) -> BlockLogEntry:
+        position = position_with_flags & POSITION_MASK
+        has_dictionary = bool(position_with_flags & DICTIONARY_FLAG)
+        return cls(
+            block_number=block_number,
+            block_id=block_id.hex(),
+            position=position,
+            size=end_position - position,
+            is_compressed=bool(position_with_flags & COMPRESSED_FLAG),
+            dictionary_number=((position_with_flags >> 48) & 0xFF) if has_dictionary else None,
+        )
+
+
+class _BinaryStream:
+    def __init__(self, data: bytes) -> None:
+        self.__data = data
+        self.offset = 0
+
+    def read(self, size: int) -> bytes:
+        if self.offset + size > len(self.__data):
+            raise UnsupportedBlockLogFormatError("Unexpected end of serialized block")
+        chunk = self.__data[self.offset : self.offset + size]
+        self.offset += size
+        return chunk
+
+    def read_uint32(self) -> int:
+        return int(struct.unpack("<I", self.read(4))[0])
+
+    def read_varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.read(1)[0]
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def read_string(self) -> str:
+        return self.read(self.read_varint()).decode()
+
+    def peek(self, size: int) -> bytes:
+        """Returns up to `size` next bytes, without moving offset."""
+        return self.__data[self.offset : self.offset + size]
+
+    def is_exhausted(self) -> bool:
+        return self.offset == len(self.__data)
+
+
+def _serialize_time(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _serialize_version(version: int) -> str:
+    return f"{version >> 24}.{(version >> 16) & 0xFF}.{version & 0xFFFF}"
+
+
+def _read_block_header_extension(stream: _BinaryStream) -> dict[str, Any]:
+    extension_type = stream.read_varint()
+    if extension_type >= len(BLOCK_HEADER_EXTENSION_TYPES):
+        raise UnsupportedBlockLogFormatError(f"Unknown block header extension type: {extension_type}")
+
+    value: Any = {}
+    if extension_type == BLOCK_HEADER_EXTENSION_TYPES.index("version"):
+        value = _serialize_version(stream.read_uint32())
+    elif extension_type == BLOCK_HEADER_EXTENSION_TYPES.index("hardfork_version_vote"):
+        value = {
+            "hf_version": _serialize_version(stream.read_uint32()),
+            "hf_time": _serialize_time(stream.read_uint32()),
+        }
+    return {"type": BLOCK_HEADER_EXTENSION_TYPES[extension_type], "value": value}
+
+
+def _read_transaction(stream: _BinaryStream) -> dict[str, Any]:
+    """
+    Reads single transaction from the stream.
+
+    Serialized transactions have no length prefix, so length of the transaction is determined by serializing it again.
+    Re-serialized form must be the same as the original one, otherwise the block uses serialization not supported by
+    this reader (e.g. legacy assets).
+    """
+    try:
+        transaction_json = deserialize_transaction(stream.peek(MAX_TRANSACTION_SIZE).hex())
+        serialized = serialize_transaction(transaction_json)
+    except WaxError as error:
+        raise UnsupportedBlockLogFormatError(f"Transaction can't be deserialized with wax: {error}") from error
+    if stream.read(len(serialized) // 2).hex() != serialized:
+        raise UnsupportedBlockLogFormatError("Transaction re-serialization does not match the block log content")
+    return dict(json.loads(transaction_json))
+
+
+def decode_signed_block(serialized_block: bytes, block_id: str) -> dict[str, Any]:
+    """Decodes binary form of signed block to the same form, which is printed by `block_log_util --get-block`."""
+    stream = _BinaryStream(serialized_block)
+    previous = stream.read(BLOCK_ID_SIZE).hex()
+    timestamp = _serialize_time(stream.read_uint32())
+    witness = stream.read_string()
+    transaction_merkle_root = stream.read(BLOCK_ID_SIZE).hex()
+    extensions = [_read_block_header_extension(stream) for _ in range(stream.read_varint())]
+    header_size = stream.offset
+    witness_signature = stream.read(SIGNATURE_SIZE)
+
+    signed_header = serialized_block[: stream.offset]
+    if hashlib.sha224(signed_header).digest()[4:BLOCK_ID_SIZE] != bytes.fromhex(block_id)[4:]:
+        raise UnsupportedBlockLogFormatError(f"Block id {block_id} does not match content of the block")
+
+    transactions = [_read_transaction(stream) for _ in range(stream.read_varint())]
+    if not stream.is_exhausted():
+        raise UnsupportedBlockLogFormatError(f"Unexpected trailing data in block {block_id}")
+
+    return {
+        "previous": previous,
+        "timestamp": timestamp,
+        "witness": witness,
+        "transaction_merkle_root": transaction_merkle_root,
+        "extensions": extensions,
+        "witness_signature": witness_signature.hex(),
+        "transactions": transactions,
+        "block_id": block_id,
+        "signing_key": get_public_key_from_signature(
+            hashlib.sha256(serialized_block[:header_size]).hexdigest(), witness_signature.hex()
+        ),
+    }
+
+
+class BlockLogFileReader:
+    """
+    Reads blocks directly from a single block log file and its artifacts, without spawning block_log_util.
+
+    Single file is either monolithic block log or one part of split block log. Both block log and artifacts files are
+    memory-mapped, so only pages containing requested blocks are loaded.
+    """
+
+    def __init__(self, block_file: Path, artifacts_file: Path, first_block_number: int = 1) -> None:
+        self.__block_file = block_file
+        self.__artifacts_file = artifacts_file
+        self.__first_block_number = first_block_number
+        self.__blocks = self.__map(block_file)
+        try:
+            self.__artifacts = self.__map(artifacts_file)
+        except BlockLogError:
+            self.__blocks.close()
+            raise
+
+        try:
+            self.__head_block_number = get_block_number_from_block_id(self.__artifacts[-BLOCK_ID_SIZE:])
+            self.__validate()
+        except BlockLogError:
+            self.close()
+            raise
+
+    @staticmethod
+    def __map(path: Path) -> mmap.mmap:
+        with path.open("rb") as file:
+            if file.seek(0, 2) < ARTIFACT_CHUNK_SIZE:
+                raise BlockLogError(f"File {path} is too short to contain any block")
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __validate(self) -> None:
+        number_of_chunks = self.__head_block_number - self.__first_block_number + 1
+        if number_of_chunks <= 0 or number_of_chunks * ARTIFACT_CHUNK_SIZE > len(self.__artifacts):
+            raise UnsupportedBlockLogFormatError(f"Unrecognized content of artifacts file {self.__artifacts_file}")
+
+        (head_position_with_flags,) = struct.unpack_from("<Q", self.__blocks, len(self.__blocks) - POSITION_SIZE)
+        if head_position_with_flags != self.__read_chunk(self.__head_block_number)[0]:
+            raise UnsupportedBlockLogFormatError(
+                f"Artifacts file {self.__artifacts_file} does not match block log {self.__block_file}"
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, _: type[BaseException] | None, __: BaseException | None, ___: TracebackType | None) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.__blocks.close()
+        self.__artifacts.close()
+
+    @property
+    def block_file(self) -> Path:
+        return self.__block_file
+
+    @property
+    def first_block_number(self) -> int:
+        return self.__first_block_number
+
+    @property
+    def head_block_number(self) -> int:
+        return self.__head_block_number
+
+    def contains(self, block_number: int) -> bool:
+        return self.__first_block_number <= block_number <= self.__head_block_number
+
+    def __read_chunk(self, block_number: int) -> tuple[int, bytes]:
+        chunk_position = len(self.__artifacts) - (self.__head_block_number - block_number + 1) * ARTIFACT_CHUNK_SIZE
+        (position_with_flags,) = struct.unpack_from("<Q", self.__artifacts, chunk_position)
+        block_id = self.__artifacts[chunk_position + POSITION_SIZE : chunk_position + ARTIFACT_CHUNK_SIZE]
+        return position_with_flags, block_id
+
+    def get_entry(self, block_number: int) -> BlockLogEntry:
+        if not self.contains(block_number):
+            raise BlockLogError(
+                f"Block {block_number} is not stored in {self.__block_file} (contains blocks "
+                f"{self.__first_block_number}..{self.__head_block_number})"
+            )
+
+        position_with_flags, block_id = self.__read_chunk(block_number)
+        if get_block_number_from_block_id(block_id) != block_number:
+            raise UnsupportedBlockLogFormatError(f"Unrecognized content of artifacts file {self.__artifacts_file}")
+
+        if block_number == self.__head_block_number:
+            end_position = len(self.__blocks) - POSITION_SIZE
+        else:
+            end_position = (self.__read_chunk(block_number + 1)[0] & POSITION_MASK) - POSITION_SIZE
+        return BlockLogEntry.from_position_with_flags(block_number, block_id, position_with_flags, end_position)
+
+    def get_block_id(self, block_number: int) -> str:
+        return self.get_entry(block_number).block_id
+
+    def read_serialized_block(self, entry: BlockLogEntry) -> bytes:
+        data = self.__blocks[entry.position : entry.position + entry.size]
+        if not entry.is_compressed:
+            return data
+
+        if entry.dictionary_number is not None:
+            raise UnsupportedBlockLogFormatError(
+                f"Block {entry.block_number} is compressed with hived built-in dictionary {entry.dictionary_number}"
+            )
+        if zstandard is None:
+            raise UnsupportedBlockLogFormatError(
+                f"Block {entry.block_number} is compressed, `zstandard` package is required to read it"
+            )
+        return bytes(zstandard.ZstdDecompressor().decompressobj().decompress(data))
+
+    def get_block(self, block_number: int) -> dict[str, Any]:
+        entry = self.get_entry(block_number)
+        return decode_signed_block(self.read_serialized_block(entry), entry.block_id)
+
+    def iter_blocks(self, start: int, stop: int) -> Iterator[dict[str, Any]]:
+        """Yields decoded blocks with numbers from range [start, stop), limited to blocks stored in this file."""
+        for block_number in range(max(start, self.__first_block_number), min(stop, self.__head_block_number + 1)):
+            yield self.get_block(block_number)
@@ -49,6 +49,14 @@ class BlockLogUtilError(BlockLogError):
     pass
 
 
+class UnsupportedBlockLogFormatError(BlockLogError):
+    """Raised when block log files can't be read natively and block_log_util has to be used instead."""
+
+
+class SnapshotError(TestToolsError):
+    """Raised when snapshot files are missing or don't match their manifest."""
+
+
 class AccountNotExistError(WalletError):
     """Raised when the account with the specified name does not exist on the blockchain."""
 
@@ -83,6 +91,10 @@ class MethodDeprecatedInBeekeeperWalletError(WalletError):
     """Raised when the called method is deprecated in the Beekeeper wallet. Use OldWallet or a similar method from another API."""
 
 
+class TransactionExpiredError(WalletError):
+    """Raised when the broadcast transaction expired before it was included in block."""
+
+
 class PrivateKeyInMemoError(WalletError):
     """Raised when a private key is found in the memo field."""
 
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from beekeepy.handle.remote import AppStatusProbeSyncApiCollection
+from beekeepy.handle.remote import AppStatusProbeAsyncApiCollection, AppStatusProbeSyncApiCollection
 
 from test_tools.__private.hived.api.account_by_key_api import SyncAccountByKeyApi
 from test_tools.__private.hived.api.account_history_api import SyncAccountHistoryApi
-from test_tools.__private.hived.api.block_api import SyncBlockApi
+from test_tools.__private.hived.api.block_api import AsyncBlockApi, SyncBlockApi
 from test_tools.__private.hived.api.condenser_api import SyncCondenserApi
-from test_tools.__private.hived.api.database_api import SyncDatabaseApi
+from test_tools.__private.hived.api.database_api import AsyncDatabaseApi, SyncDatabaseApi
 from test_tools.__private.hived.api.debug_node_api import SyncDebugNodeApi
 from test_tools.__private.hived.api.jsonrpc import SyncJsonrpc
 from test_tools.__private.hived.api.market_history_api import SyncMarketHistoryApi
@@ -17,11 +17,14 @@ from test_tools.__private.hived.api.network_broadcast_api import SyncNetworkBroa
 from test_tools.__private.hived.api.network_node_api import SyncNetworkNodeApi
 from test_tools.__private.hived.api.rc_api import SyncRcApi
 from test_tools.__private.hived.api.reputation_api import SyncReputationApi
-from test_tools.__private.hived.api.transaction_status_api import SyncTransactionStatusApi
-from test_tools.__private.hived.api.wallet_bridge_api import SyncWalletBridgeApi
+from test_tools.__private.hived.api.transaction_status_api import (
+    AsyncTransactionStatusApi,
+    SyncTransactionStatusApi,
+)
+from test_tools.__private.hived.api.wallet_bridge_api import AsyncWalletBridgeApi, SyncWalletBridgeApi
 
 if TYPE_CHECKING:
-    from beekeepy.handle.remote import SyncSendable
+    from beekeepy.handle.remote import AsyncSendable, SyncSendable
 
 
 class HivedSyncApiCollection(AppStatusProbeSyncApiCollection):
@@ -58,3 +61,19 @@ class HivedSyncApiCollection(AppStatusProbeSyncApiCollection):
         self.transaction_status_api = self.transaction_status
         self.wallet_bridge_api = self.wallet_bridge
         self.metadata_api = self.metadata
+
+
+class HivedAsyncApiCollection(AppStatusProbeAsyncApiCollection):
+    """Asynchronous versions of apis used by `AsyncWallet` (only endpoints it needs)."""
+
+    def __init__(self, owner: AsyncSendable) -> None:
+        super().__init__(owner)
+        self.block = AsyncBlockApi(owner=self._owner)
+        self.database = AsyncDatabaseApi(owner=self._owner)
+        self.transaction_status = AsyncTransactionStatusApi(owner=self._owner)
+        self.wallet_bridge = AsyncWalletBridgeApi(owner=self._owner)
+
+        self.block_api = self.block
+        self.database_api = self.database
+        self.transaction_status_api = self.transaction_status
+        self.wallet_bridge_api = self.wallet_bridge
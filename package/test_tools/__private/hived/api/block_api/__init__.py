@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .async_api import BlockApi as AsyncBlockApi
 from .sync_api import BlockApi as SyncBlockApi
 
-__all__ = ["SyncBlockApi"]
+__all__ = ["AsyncBlockApi", "SyncBlockApi"]
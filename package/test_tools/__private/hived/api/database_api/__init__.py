@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .async_api import DatabaseApi as AsyncDatabaseApi
 from .sync_api import DatabaseApi as SyncDatabaseApi
 
-__all__ = ["SyncDatabaseApi"]
+__all__ = ["AsyncDatabaseApi", "SyncDatabaseApi"]
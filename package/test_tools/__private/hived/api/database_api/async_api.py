@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from beekeepy.handle.remote import AbstractAsyncApi
+
+from schemas.apis import database_api
+from test_tools.__private.hived.api.database_api.common import DatabaseApiCommons
+
+
+class DatabaseApi(AbstractAsyncApi, DatabaseApiCommons):
+    api = AbstractAsyncApi.endpoint_jsonrpc
+
+    @api
+    async def find_accounts(
+        self, *, accounts: list[str], delayed_votes_active: bool | None = None
+    ) -> database_api.FindAccounts:
+        raise NotImplementedError
+
+    @api
+    async def get_config(self) -> database_api.GetConfig:
+        raise NotImplementedError
+
+    @api
+    async def get_dynamic_global_properties(
+        self,
+    ) -> database_api.GetDynamicGlobalProperties:
+        raise NotImplementedError
+
+    @api
+    async def get_version(self) -> database_api.GetVersion:
+        raise NotImplementedError
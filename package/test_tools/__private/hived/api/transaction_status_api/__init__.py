@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .async_api import TransactionStatusApi as AsyncTransactionStatusApi
 from .sync_api import TransactionStatusApi as SyncTransactionStatusApi
 
-__all__ = ["SyncTransactionStatusApi"]
+__all__ = ["AsyncTransactionStatusApi", "SyncTransactionStatusApi"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .async_api import WalletBridgeApi as AsyncWalletBridgeApi
 from .sync_api import WalletBridgeApi as SyncWalletBridgeApi
 
-__all__ = ["SyncWalletBridgeApi"]
+__all__ = ["AsyncWalletBridgeApi", "SyncWalletBridgeApi"]
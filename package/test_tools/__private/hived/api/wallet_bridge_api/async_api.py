@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from beekeepy.handle.remote import AbstractAsyncApi, ApiArgumentSerialization
+
+from schemas.apis import wallet_bridge_api
+from schemas.transaction import Transaction
+from test_tools.__private.hived.api.wallet_bridge_api.common import WalletBridgeApiCommons
+
+
+class WalletBridgeApi(AbstractAsyncApi, WalletBridgeApiCommons):
+    api = AbstractAsyncApi.endpoint_jsonrpc
+
+    def argument_serialization(self) -> ApiArgumentSerialization:
+        return ApiArgumentSerialization.DOUBLE_ARRAY
+
+    @api
+    async def get_accounts(self, accounts: list[str], /) -> wallet_bridge_api.GetAccounts:
+        raise NotImplementedError
+
+    @api
+    async def get_witness(self, witness: str, /) -> wallet_bridge_api.GetWitness:
+        raise NotImplementedError
+
+    @api
+    async def broadcast_transaction_synchronous(
+        self, transaction: Transaction, /
+    ) -> wallet_bridge_api.BroadcastTransactionSynchronous:
+        raise NotImplementedError
+
+    @api
+    async def broadcast_transaction(self, transaction: Transaction, /) -> wallet_bridge_api.BroadcastTransaction:
+        raise NotImplementedError
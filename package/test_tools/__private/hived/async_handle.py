@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Generic
+
+from beekeepy.handle.remote import AbstractAsyncHandle, AsyncBatchHandle, RemoteHandleSettings, RemoteSettingsT
+
+from test_tools.__private.hived.api.api_collection import HivedAsyncApiCollection
+from test_tools.__private.hived.common_helpers import HiveHandleCommonHelpers
+
+
+class AsyncHivedTemplate(
+    AbstractAsyncHandle[RemoteSettingsT, HivedAsyncApiCollection], HiveHandleCommonHelpers, Generic[RemoteSettingsT]
+):
+    """Asynchronous handle of hived, all requests are sent through single HTTP session."""
+
+    def _construct_api(self) -> HivedAsyncApiCollection:
+        return HivedAsyncApiCollection(owner=self)
+
+    def _target_service(self) -> str:
+        return self._hived_target_service_name()
+
+    async def get_dynamic_global_properties(self) -> HiveHandleCommonHelpers.GetDynamicGlobalPropertiesT:
+        return await self.api.database.get_dynamic_global_properties()
+
+    async def batch(self, *, delay_error_on_data_access: bool = False) -> AsyncBatchHandle[HivedAsyncApiCollection]:
+        return AsyncBatchHandle(
+            url=self.http_endpoint,
+            overseer=self._overseer,
+            api=lambda o: HivedAsyncApiCollection(o),
+            delay_error_on_data_access=delay_error_on_data_access,
+        )
+
+
+AsyncHived = AsyncHivedTemplate[RemoteHandleSettings]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_MAX_SIZE: Final[int] = 100_000
+
+Keys = tuple[str, str]
+"""Private and public key of an account."""
+
+
+class KeyCache:
+    """
+    Thread-safe LRU cache of keys generated for `(secret, account name)` pairs.
+
+    Optionally cache is backed by sqlite database, so keys generated once are reused by next processes. Database isn't
+    limited in size, `max_size` limits only number of keys held in memory.
+    """
+
+    def __init__(self, *, max_size: int = DEFAULT_MAX_SIZE, database: Path | str | None = None) -> None:
+        self.__max_size = max_size
+        self.__keys: OrderedDict[tuple[str, str], Keys] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__database: sqlite3.Connection | None = None
+        self.set_database(database)
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    def set_max_size(self, max_size: int) -> None:
+        with self.__lock:
+            self.__max_size = max_size
+            self.__evict()
+
+    def set_database(self, database: Path | str | None) -> None:
+        """Enables storing keys in sqlite database file `database` or disables it, when `None` is passed."""
+        with self.__lock:
+            if self.__database is not None:
+                self.__database.close()
+                self.__database = None
+
+            if database is not None:
+                Path(database).parent.mkdir(parents=True, exist_ok=True)
+                self.__database = sqlite3.connect(database, check_same_thread=False, isolation_level=None)
+                self.__database.execute(
+                    "CREATE TABLE IF NOT EXISTS keys ("
+                    "secret TEXT, account_name TEXT, private_key TEXT, public_key TEXT, "
+                    "PRIMARY KEY (secret, account_name))"
+                )
+
+    def get(self, secret: str, account_name: str) -> Keys | None:
+        with self.__lock:
+            keys = self.__keys.get((secret, account_name))
+            if keys is not None:
+                self.__keys.move_to_end((secret, account_name))
+                return keys
+
+            if self.__database is None:
+                return None
+
+            row = self.__database.execute(
+                "SELECT private_key, public_key FROM keys WHERE secret = ? AND account_name = ?",
+                (secret, account_name),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.__keys[(secret, account_name)] = (row[0], row[1])
+            self.__evict()
+            return row[0], row[1]
+
+    def put(self, secret: str, keys: Iterable[tuple[str, Keys]]) -> None:
+        """Stores keys given as pairs of account name and its keys."""
+        keys = list(keys)
+        with self.__lock:
+            for account_name, account_keys in keys:
+                self.__keys[(secret, account_name)] = account_keys
+                self.__keys.move_to_end((secret, account_name))
+            self.__evict()
+
+            if self.__database is not None:
+                self.__database.executemany(
+                    "INSERT OR REPLACE INTO keys VALUES (?, ?, ?, ?)",
+                    [(secret, account_name, *account_keys) for account_name, account_keys in keys],
+                )
+
+    def clear(self) -> None:
+        """Removes keys held in memory. Keys stored in database are kept."""
+        with self.__lock:
+            self.__keys.clear()
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __evict(self) -> None:
+        while len(self.__keys) > self.__max_size:
+            self.__keys.popitem(last=False)
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import ast
+import json
+import multiprocessing
+import os
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, ClassVar, Final, Literal
 
 from schemas.fields.basic import AccountName, PrivateKey, PublicKey
 from test_tools.__private import paths_to_executables
+from test_tools.__private.key_cache import KeyCache
+from test_tools.__private.wax_wrapper import generate_dev_keys
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
+    from test_tools.__private.key_cache import Keys
+
+KeyGeneratorBackend = Literal["wax", "get_dev_key"]
+
+KEY_CACHE_DATABASE_ENVIRONMENT_VARIABLE: Final[str] = "TEST_TOOLS_KEY_CACHE_DATABASE"
+DEFAULT_PARALLEL_CHUNK_SIZE: Final[int] = 10_000
+INITMINER_KEYS: Final[tuple[str, str]] = (
+    "5JNHfZYKGaomSFvd4NUdQ9qMcEAC43kujbfjueTHpVapX1Kzq2n",
+    "STM6LLegbAgLAy28EHrffBVuANFWcFgmqRMW13wBmTExqFE9SCkg4",
+)
+
 
 @dataclass
 class KeyGeneratorItem:
@@ -18,8 +39,112 @@ class KeyGeneratorItem:
     public_key: PublicKey
     account_name: AccountName
 
+    @classmethod
+    def from_keys(cls, account_name: str, keys: Keys) -> KeyGeneratorItem:
+        return cls(
+            private_key=PrivateKey(keys[0]), public_key=PublicKey(keys[1]), account_name=AccountName(account_name)
+        )
+
+
+class _LookupCoalescer:
+    """
+    Generates keys of accounts requested concurrently by many threads with as few get_dev_key runs as possible.
+
+    First thread, which requests keys, runs get_dev_key. Requests made in the meantime by other threads are queued and
+    handled together by the next get_dev_key run (single run for each secret).
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__futures: dict[tuple[str, str], Future[Keys]] = {}
+        self.__queue: list[tuple[str, str]] = []
+        self.__is_generating = False
+
+    def lookup(self, secret: str, account_names: Sequence[str], executable_path: Path | None) -> list[Keys]:
+        with self.__lock:
+            futures = []
+            for account_name in account_names:
+                key = (secret, account_name)
+                if key not in self.__futures:
+                    self.__futures[key] = Future()
+                    self.__queue.append(key)
+                futures.append(self.__futures[key])
+
+            is_leader = not self.__is_generating
+            self.__is_generating = True
+
+        if is_leader:
+            self.__generate_queued(executable_path)
+        return [future.result() for future in futures]
+
+    def __generate_queued(self, executable_path: Path | None) -> None:
+        while True:
+            with self.__lock:
+                queue, self.__queue = self.__queue, []
+                if not queue:
+                    self.__is_generating = False
+                    return
+
+            account_names_by_secret: dict[str, list[str]] = {}
+            for secret, account_name in queue:
+                account_names_by_secret.setdefault(secret, []).append(account_name)
+
+            for secret, account_names in account_names_by_secret.items():
+                try:
+                    items = KeyGenerator.run_key_generator(
+                        account_names, secret=secret, executable_path=executable_path
+                    )
+                    keys = [(str(item.account_name), (str(item.private_key), str(item.public_key))) for item in items]
+                    KeyGenerator.cache.put(secret, keys)
+                except BaseException as exception:  # noqa: BLE001  # passed to all waiting threads
+                    self.__resolve(secret, account_names, exception=exception)
+                else:
+                    self.__resolve(secret, account_names, keys=dict(keys))
+
+    def __resolve(
+        self,
+        secret: str,
+        account_names: list[str],
+        *,
+        keys: dict[str, Keys] | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        with self.__lock:
+            futures = [self.__futures.pop((secret, account_name)) for account_name in account_names]
+
+        for account_name, future in zip(account_names, futures, strict=True):
+            if keys is not None and account_name in keys:
+                future.set_result(keys[account_name])
+            else:
+                future.set_exception(exception or KeyError(f"get_dev_key returned no keys for {account_name}"))
+
+
+def _generate_key_range(
+    account_name: str, secret: str, start: int, stop: int, executable_path: Path | None
+) -> list[tuple[str, str, str]]:
+    """Generates keys of accounts from `account_name-start` to `account_name-(stop-1)`. Run by parallel workers."""
+    if executable_path is None:
+        names = [f"{account_name}-{index}" for index in range(start, stop)]
+        items = KeyGenerator.derive_keys(names, secret=secret)
+    else:
+        items = KeyGenerator.run_key_generator(
+            [f"{account_name}-{start}:{stop}"], secret=secret, executable_path=executable_path
+        )
+    return [(str(item.account_name), str(item.private_key), str(item.public_key)) for item in items]
+
 
 class KeyGenerator:
+    cache: ClassVar[KeyCache] = KeyCache(database=os.environ.get(KEY_CACHE_DATABASE_ENVIRONMENT_VARIABLE))
+    """Process-wide cache of generated keys. Database can be set also with `TEST_TOOLS_KEY_CACHE_DATABASE`."""
+
+    backend: ClassVar[KeyGeneratorBackend] = "wax"
+    """
+    Decides how keys are generated. By default ("wax") keys are derived in process, the same way as get_dev_key does.
+    With "get_dev_key" executable is run. Executable is also used always, when `executable_path` is passed explicitly.
+    """
+
+    __lookups: ClassVar[_LookupCoalescer] = _LookupCoalescer()
+
     @staticmethod
     def generate_keys(
         account_name: str,
@@ -32,22 +157,146 @@ class KeyGenerator:
 
         if account_name == "initminer":
             assert number_of_accounts == 1
-            return [
-                KeyGeneratorItem(
-                    private_key=PrivateKey("5JNHfZYKGaomSFvd4NUdQ9qMcEAC43kujbfjueTHpVapX1Kzq2n"),
-                    public_key=PublicKey("STM6LLegbAgLAy28EHrffBVuANFWcFgmqRMW13wBmTExqFE9SCkg4"),
-                    account_name=AccountName(account_name),
-                )
-            ]
+            return [KeyGeneratorItem.from_keys(account_name, INITMINER_KEYS)]
 
-        if executable_path is None:
+        if number_of_accounts == 1:
+            return KeyGenerator.generate_keys_for([account_name], secret=secret, executable_path=executable_path)
+
+        account_names = [f"{account_name}-{index}" for index in range(number_of_accounts)]
+        cached = [
+            KeyGeneratorItem.from_keys(name, keys)
+            for name in account_names
+            if (keys := KeyGenerator.cache.get(secret, name)) is not None
+        ]
+        if len(cached) == number_of_accounts:
+            return cached
+
+        if KeyGenerator.__uses_executable(executable_path):
+            items = KeyGenerator.run_key_generator(
+                [f"{account_name}-0:{number_of_accounts}"], secret=secret, executable_path=executable_path
+            )
+        else:
+            items = KeyGenerator.derive_keys(account_names, secret=secret)
+        KeyGenerator.cache.put(secret, ((str(item.account_name), KeyGenerator.__as_keys(item)) for item in items))
+        return items
+
+    @staticmethod
+    def generate_keys_in_parallel(
+        account_name: str,
+        *,
+        number_of_accounts: int,
+        secret: str = "secret",
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+        executable_path: Path | None = None,
+    ) -> Iterator[KeyGeneratorItem]:
+        """
+        Yields keys of accounts `account_name-0`, `account_name-1`, ... in order, generated by many workers at once.
+
+        Range of accounts is split into chunks of `chunk_size` accounts, which are handled by pool of `max_workers`
+        processes (or threads running get_dev_key, when executable is used). Only up to two chunks per worker are
+        generated ahead of consumer, so memory usage doesn't depend on `number_of_accounts`. Keys are not cached.
+        """
+        assert number_of_accounts >= 1
+        assert chunk_size >= 1
+
+        uses_executable = KeyGenerator.__uses_executable(executable_path)
+        if uses_executable and executable_path is None:
             executable_path = paths_to_executables.get_path_of("get_dev_key")
 
-        if number_of_accounts != 1:
-            account_name += f"-0:{number_of_accounts}"
+        max_workers = max_workers or os.cpu_count() or 1
+        chunks = (
+            (start, min(start + chunk_size, number_of_accounts)) for start in range(0, number_of_accounts, chunk_size)
+        )
+        executor: Executor
+        if uses_executable:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            # Workers are spawned, because forking of multithreaded process (e.g. with running wallets) is unsafe.
+            executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+        def submit(start: int, stop: int) -> Future[list[tuple[str, str, str]]]:
+            return executor.submit(_generate_key_range, account_name, secret, start, stop, executable_path)
+
+        try:
+            pending = deque(submit(start, stop) for start, stop in islice(chunks, 2 * max_workers))
+            while pending:
+                keys = pending.popleft().result()
+                pending.extend(submit(start, stop) for start, stop in islice(chunks, 1))
+                for name, private_key, public_key in keys:
+                    yield KeyGeneratorItem.from_keys(name, (private_key, public_key))
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def generate_keys_for(
+        account_names: Sequence[str],
+        *,
+        secret: str = "secret",
+        executable_path: Path | None = None,
+    ) -> list[KeyGeneratorItem]:
+        """
+        Returns keys of accounts with given names, in the same order.
+
+        Keys are taken from process-wide cache (`KeyGenerator.cache`). Missing ones are derived in process or, when
+        get_dev_key executable is used, generated with single run, shared with lookups made concurrently by other
+        threads.
+        """
+        keys: dict[str, Keys] = {"initminer": INITMINER_KEYS}
+        missing = []
+        for account_name in dict.fromkeys(account_names):
+            if account_name in keys:
+                continue
+
+            cached = KeyGenerator.cache.get(secret, account_name)
+            if cached is None:
+                missing.append(account_name)
+            else:
+                keys[account_name] = cached
+
+        if missing and KeyGenerator.__uses_executable(executable_path):
+            generated = KeyGenerator.__lookups.lookup(secret, missing, executable_path)
+            keys.update(zip(missing, generated, strict=True))
+        elif missing:
+            derived = KeyGenerator.derive_keys(missing, secret=secret)
+            KeyGenerator.cache.put(secret, ((str(item.account_name), KeyGenerator.__as_keys(item)) for item in derived))
+            keys.update((str(item.account_name), KeyGenerator.__as_keys(item)) for item in derived)
+
+        return [KeyGeneratorItem.from_keys(account_name, keys[account_name]) for account_name in account_names]
+
+    @staticmethod
+    def derive_keys(account_names: Sequence[str], *, secret: str = "secret") -> list[KeyGeneratorItem]:
+        """Derives keys of accounts in process, bypassing cache. Keys are identical to generated by get_dev_key."""
+        return [
+            KeyGeneratorItem.from_keys(account_name, (keys.wif_private_key, keys.associated_public_key))
+            for account_name, keys in zip(account_names, generate_dev_keys(secret, account_names), strict=True)
+        ]
+
+    @staticmethod
+    def __uses_executable(executable_path: Path | None) -> bool:
+        return executable_path is not None or KeyGenerator.backend == "get_dev_key"
+
+    @staticmethod
+    def __as_keys(item: KeyGeneratorItem) -> Keys:
+        return str(item.private_key), str(item.public_key)
+
+    @staticmethod
+    def run_key_generator(
+        arguments: Sequence[str], *, secret: str = "secret", executable_path: Path | None = None
+    ) -> list[KeyGeneratorItem]:
+        """
+        Runs get_dev_key once for all `arguments` (account names or ranges like `account-0:10`), bypassing cache.
+
+        :return: Keys of all accounts in order of `arguments`.
+        """
+        if executable_path is None:
+            executable_path = paths_to_executables.get_path_of("get_dev_key")
 
-        output = subprocess.check_output([str(executable_path), secret, account_name]).decode("utf-8")
-        parsed_output = ast.literal_eval(output)
+        output = subprocess.check_output([str(executable_path), secret, *arguments]).decode("utf-8")
+        try:
+            parsed_output = json.loads(output)
+        except json.JSONDecodeError:
+            parsed_output = ast.literal_eval(output)
         assert isinstance(parsed_output, list)
         return [
             KeyGeneratorItem(
@@ -15,7 +15,7 @@ from beekeepy.handle.runnable import RunnableHandle
 from beekeepy.interfaces import AnyUrl, HttpUrl, P2PUrl, Stopwatch, WsUrl
 from beekeepy.settings import RunnableHandleSettings as Settings
 
-from test_tools.__private import cleanup_policy, paths_to_executables
+from test_tools.__private import cleanup_policy, paths_to_executables, replay_cache
 from test_tools.__private.base_node import BaseNode
 from test_tools.__private.block_log import BlockLog
 from test_tools.__private.constants import CleanupPolicy
@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from test_tools.__private.executable_info import ExecutableInfo
     from test_tools.__private.user_handles.handles.network_handle import NetworkHandle
     from test_tools.__private.user_handles.handles.node_handles.node_handle_base import NodeHandleBase as NodeHandle
+    from test_tools.__private.utilities.file_copying import CopyStrategy
     from test_tools.__private.wallet.wallet import Wallet
 
 
@@ -76,6 +77,7 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         self._time_speedup_rate: float = 1.0
 
         self.__is_testnet: bool | None = None
+        self.__run_id = 0
 
     @property
     def config(self) -> NodeConfig:
@@ -200,11 +202,13 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
 
         self.logger.info("Snapshot dumped")
 
-        return Snapshot(
+        snapshot = Snapshot(
             self.directory / "snapshot" / name,
             self.block_log,
             self,
         )
+        snapshot.get_manifest()  # written once here, then reused by comparisons and incremental copying
+        return snapshot
 
     def __ensure_that_plugin_required_for_snapshot_is_included(self) -> None:
         plugin_required_for_snapshots = "state_snapshot"
@@ -229,6 +233,7 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         process_startup_timeout: float | None = None,
     ) -> None:
         process_startup_timeout = process_startup_timeout or self.settings.initialization_timeout.total_seconds()
+        self.__run_id += 1
         args = with_arguments or NodeArguments()
         args.data_dir = self.directory
         with self.__process.restore_arguments(with_arguments):
@@ -265,6 +270,7 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         alternate_chain_specs: AlternateChainSpecs | None = None,
         explicit_blocking: bool = False,
         max_retries: int = 1,
+        copy_strategy: CopyStrategy = "auto",
     ) -> None:
         """
         Runs node.
@@ -277,6 +283,8 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         :param environment_variables: Additional environment variables passed to node run environment. If variable name
                                       is already defined, its value will be overwritten with one provided by this
                                       parameter.
+        :param copy_strategy: Decides how block log and snapshot files are copied to node directory when
+                              `replay_from` or `load_snapshot_from` is used. See `BlockLog.copy_to` for details.
         """
         # Store parameters for restart() to inherit
         self._last_timeout = timeout
@@ -305,8 +313,9 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
                 log_message = f"Running {self}"
 
                 additional_arguments = parsed_arguments or self.arguments.copy()
+                snapshot: Snapshot | None = None
                 if load_snapshot_from is not None:
-                    self.__handle_loading_snapshot(load_snapshot_from, additional_arguments)
+                    snapshot = self.__handle_loading_snapshot(load_snapshot_from, additional_arguments, copy_strategy)
                     log_message += ", loading snapshot"
 
                 if exit_at_block is not None and stop_at_block is not None:
@@ -321,9 +330,22 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
                     if self.__alternate_chain_specs is not None:
                         destination = self.__alternate_chain_specs.export_to_file(self.directory).absolute()
                         additional_arguments.alternate_chain_spec = destination
+                is_replaying = False
+                replay_cache_key: str | None = None
                 if replay_from is not None:
-                    self.__handle_replay(replay_from, additional_arguments)
-                    log_message += ", replaying"
+                    replay_source = self.__convert_to_block_log(replay_from)
+                    replay_cache_key = self.__get_replay_cache_key(replay_source, snapshot, additional_arguments)
+                    if replay_cache_key is not None and replay_cache.restore(
+                        replay_cache_key, self.directory, copy_strategy
+                    ):
+                        additional_arguments.load_snapshot = None
+                        additional_arguments.force_replay = None
+                        replay_cache_key = None
+                        log_message += ", restoring replayed state from cache"
+                    else:
+                        self.__handle_replay(replay_source, additional_arguments, copy_strategy)
+                        is_replaying = True
+                        log_message += ", replaying"
 
                 local_environment_variables = environment_variables or dict(os.environ)
 
@@ -391,11 +413,14 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
                     )
                 self.logger.info(f"Waiting for process start of {self.get_name()} took {sw.seconds_delta :.2f} seconds")
 
-                if replay_from is not None and not blocking:
+                if is_replaying and not blocking:
                     self.__wait_for_replay_finish()
 
                 self.__produced_files = True
 
+                if replay_cache_key is not None and exit_before_synchronization_final:
+                    replay_cache.store(replay_cache_key, self.directory)
+
                 if not blocking:
                     self.logger.info("Waiting for synchronization...")
                     with Stopwatch() as sw:
@@ -446,8 +471,11 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         """Override this method to hook just before starting node process."""
 
     def __handle_loading_snapshot(
-        self, snapshot_source: str | Path | Snapshot, additional_arguments: NodeArguments
-    ) -> None:
+        self,
+        snapshot_source: str | Path | Snapshot,
+        additional_arguments: NodeArguments,
+        copy_strategy: CopyStrategy,
+    ) -> Snapshot:
         if not isinstance(snapshot_source, Snapshot):
             snapshot_source = Path(snapshot_source)
             snapshot_source = Snapshot(
@@ -457,7 +485,8 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
 
         self.__ensure_that_plugin_required_for_snapshot_is_included()
         additional_arguments.load_snapshot = snapshot_source.name
-        snapshot_source.copy_to(self.directory)
+        snapshot_source.copy_to(self.directory, copy_strategy=copy_strategy)
+        return snapshot_source
 
     def __convert_to_node_arguments(self, arguments: NodeArguments | list[str] | None) -> NodeArguments:
         if arguments is None:
@@ -468,33 +497,57 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
 
         return NodeArguments.parse_cli_input(arguments)
 
-    def __handle_replay(self, replay_source: BlockLog | Path | str, additional_arguments: NodeArguments) -> None:
-        if not isinstance(replay_source, BlockLog):
-            """
-            TODO: When setting of initial values of node config is restored, change the code below as follows.
+    def __convert_to_block_log(self, replay_source: BlockLog | Path | str) -> BlockLog:
+        if isinstance(replay_source, BlockLog):
+            return replay_source
 
-            assert self.config.block_log_split is not None, "Should have been set on init!"
-            replay_source = BlockLog(
-                replay_source,
-                "monolithic" if self.config.block_log_split == -1 else "split",
-            )
-            """
-            replay_source = BlockLog(
-                replay_source,
-                "split"
-                if self.config.block_log_split is None
-                else "monolithic"
-                if self.config.block_log_split == -1
-                else "split",
-            )
+        """
+        TODO: When setting of initial values of node config is restored, change the code below as follows.
 
+        assert self.config.block_log_split is not None, "Should have been set on init!"
+        return BlockLog(
+            replay_source,
+            "monolithic" if self.config.block_log_split == -1 else "split",
+        )
+        """
+        return BlockLog(
+            replay_source,
+            "split"
+            if self.config.block_log_split is None
+            else "monolithic"
+            if self.config.block_log_split == -1
+            else "split",
+        )
+
+    def __get_replay_cache_key(
+        self, replay_source: BlockLog, snapshot: Snapshot | None, additional_arguments: NodeArguments
+    ) -> str | None:
+        """Returns None when replayed state can't be cached, see `replay_cache` module for details."""
+        if (
+            replay_cache.get_directory() is None
+            or additional_arguments.exit_at_block is not None
+            or not replay_cache.is_supported(self.config, additional_arguments)
+        ):
+            return None
+
+        return replay_cache.calculate_key(
+            block_log=replay_source,
+            snapshot=snapshot,
+            build_commit_hash=self.__process.get_build_commit_hash(),
+            config=self.config,
+            arguments=additional_arguments,
+        )
+
+    def __handle_replay(
+        self, replay_source: BlockLog, additional_arguments: NodeArguments, copy_strategy: CopyStrategy
+    ) -> None:
         additional_arguments.replay_blockchain = True
 
         block_log_directory = self.directory.joinpath("blockchain")
         if block_log_directory.exists() and additional_arguments.force_replay is True:
             shutil.rmtree(block_log_directory)
         block_log_directory.mkdir(exist_ok=True)
-        replay_source.copy_to(block_log_directory, artifacts="optional")
+        replay_source.copy_to(block_log_directory, artifacts="optional", copy_strategy=copy_strategy)
 
     def __log_run_summary(self) -> None:
         if self.is_running():
@@ -788,6 +841,9 @@ class Node(RunnableHandle[NodeProcess, NodeConfig, NodeArguments, Settings], Bas
         if timeout < 0:
             raise TimeoutError(f"Timeout must be greater than or equal to 0, but is: {timeout :.4f}")
 
+    def get_run_id(self) -> int:
+        return self.__run_id
+
     def is_testnet(self) -> bool:
         if self.__is_testnet is None:
             self.__is_testnet = (self.get_version()["version"]["node_type"]) == "testnet"
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from loguru import logger
+
+from test_tools.__private.utilities.file_copying import copy_tree
+from test_tools.__private.utilities.file_hashing import hash_file
+
+if TYPE_CHECKING:
+    from test_tools.__private.block_log import BlockLog
+    from test_tools.__private.process.node_arguments import NodeArguments
+    from test_tools.__private.process.node_config import NodeConfig
+    from test_tools.__private.snapshot import Snapshot
+    from test_tools.__private.utilities.file_copying import CopyStrategy
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE: Final[str] = "TEST_TOOLS_REPLAY_CACHE_DIRECTORY"
+
+# Entries which don't affect content of replayed state. Skipping them allows to share cached state between nodes, which
+# e.g. listen on different ports.
+STATE_INDEPENDENT_ENTRIES: Final[frozenset[str]] = frozenset(
+    {
+        "alternate_chain_spec",  # replaced with digest of its content
+        "data_dir",
+        "exit_before_sync",
+        "force_replay",
+        "load_snapshot",  # replaced with digest of snapshot content
+        "log_appender",
+        "log_console_appender",
+        "log_file_appender",
+        "log_json_rpc",
+        "log_logger",
+        "p2p_endpoint",
+        "p2p_max_connections",
+        "p2p_parameters",
+        "p2p_seed_node",
+        "replay_blockchain",
+        "rpc_endpoint",
+        "seed_node",
+        "webserver_http_endpoint",
+        "webserver_https_certificate_file_name",
+        "webserver_https_endpoint",
+        "webserver_https_key_file_name",
+        "webserver_thread_pool_size",
+        "webserver_unix_endpoint",
+        "webserver_ws_deflate",
+        "webserver_ws_endpoint",
+    }
+)
+
+# Replayed state is cached only when all of it is stored in node's blockchain directory.
+STATE_LOCATION_ENTRIES: Final[tuple[str, ...]] = ("shared_file_dir", "account_history_rocksdb_path")
+
+__directory: Path | None = (
+    Path(os.environ[CACHE_DIRECTORY_ENVIRONMENT_VARIABLE])
+    if CACHE_DIRECTORY_ENVIRONMENT_VARIABLE in os.environ
+    else None
+)
+
+
+def set_directory(directory: Path | str | None) -> None:
+    """
+    Enables cache of replayed node states, stored in `directory`, or disables it when `None` is passed.
+
+    Cache can be also enabled with `TEST_TOOLS_REPLAY_CACHE_DIRECTORY` environment variable. Cache is shared by all
+    processes using the same directory, so it can be reused by consecutive test runs.
+    """
+    global __directory  # noqa: PLW0603
+    __directory = None if directory is None else Path(directory).absolute()
+
+
+def get_directory() -> Path | None:
+    return __directory
+
+
+def is_supported(config: NodeConfig, arguments: NodeArguments) -> bool:
+    return all(config[entry] is None and arguments[entry] is None for entry in STATE_LOCATION_ENTRIES)
+
+
+def calculate_key(
+    *,
+    block_log: BlockLog,
+    snapshot: Snapshot | None,
+    build_commit_hash: str,
+    config: NodeConfig,
+    arguments: NodeArguments,
+) -> str:
+    """
+    Calculates key identifying state of node replayed with given inputs.
+
+    Block log is identified by id of its head block. Each block id covers content of the block and id of previous
+    block, so head block id identifies content of whole block log, without reading it.
+    """
+    inputs = {
+        "block_log": block_log.get_block_ids(block_log.get_head_block_number()),
+        "snapshot": None if snapshot is None else snapshot.get_file_digests(),
+        "build_commit_hash": build_commit_hash,
+        "alternate_chain_spec": (
+            None if arguments.alternate_chain_spec is None else hash_file(arguments.alternate_chain_spec)
+        ),
+        "config": __get_state_dependent_entries(config.dict()),
+        "arguments": __get_state_dependent_entries(arguments.dict()),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def restore(key: str, node_directory: Path, copy_strategy: CopyStrategy) -> bool:
+    """Replaces blockchain directory of node with cached one. Returns False if there is no state cached for `key`."""
+    entry = __get_entry_path(key)
+    if entry is None or not entry.exists():
+        return False
+
+    block_log_directory = node_directory / "blockchain"
+    if block_log_directory.exists():
+        shutil.rmtree(block_log_directory)
+
+    # Node modifies its state, so cached files can't be shared with hardlinks.
+    copy_tree(entry, block_log_directory, "auto" if copy_strategy == "hardlink" else copy_strategy)
+    logger.info(f"Replayed state restored from {entry}")
+    return True
+
+
+def store(key: str, node_directory: Path) -> None:
+    """Saves blockchain directory of node, which is not run, in cache."""
+    entry = __get_entry_path(key)
+    if entry is None or entry.exists():
+        return
+
+    # Entry is filled under temporary name first, so other processes never see partially copied state.
+    temporary_entry = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    temporary_entry.parent.mkdir(parents=True, exist_ok=True)
+    copy_tree(node_directory / "blockchain", temporary_entry, "auto")
+    try:
+        temporary_entry.rename(entry)
+    except OSError:  # stored in the meantime by other process
+        shutil.rmtree(temporary_entry)
+        return
+    logger.info(f"Replayed state stored in {entry}")
+
+
+def __get_entry_path(key: str) -> Path | None:
+    directory = get_directory()
+    return None if directory is None else directory / key
+
+
+def __get_state_dependent_entries(entries: dict[str, object]) -> dict[str, object]:
+    return {
+        name: value
+        for name, value in entries.items()
+        if name not in STATE_INDEPENDENT_ENTRIES and value is not None and value != []
+    }
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
-import filecmp
-import hashlib
+import concurrent.futures
 import json
-import shutil
+import os
 import warnings
-from typing import TYPE_CHECKING
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Final
 
 from loguru import logger
 
+from test_tools.__private.exceptions import SnapshotError
+from test_tools.__private.utilities.file_copying import copy_file
+from test_tools.__private.utilities.file_hashing import hash_file
+
 if TYPE_CHECKING:
     from pathlib import Path
 
     from test_tools.__private.block_log import BlockLog
     from test_tools.__private.node import Node
+    from test_tools.__private.utilities.file_copying import CopyStrategy
+
+
+MANIFEST_FILE_SUFFIX: Final[str] = ".manifest.json"
+
+
+@dataclass(frozen=True)
+class SnapshotFileInfo:
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    def is_up_to_date(self, path: Path) -> bool:
+        stat = path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
 
 
 class Snapshot:
@@ -31,23 +50,71 @@ class Snapshot:
             with snapshot_state_path.open(encoding="utf-8") as state_file:
                 self.state = json.load(state_file)
 
-    def copy_to(self, node_directory: Path) -> None:
+    def copy_to(self, node_directory: Path, *, copy_strategy: CopyStrategy = "auto") -> None:
+        """
+        Copies snapshot with its block log to `node_directory`, so node run there can load the snapshot.
+
+        Copying is incremental. When `node_directory` already holds a snapshot with the same name (e.g. older snapshot
+        of the same node), only missing or changed files are copied and files absent in this snapshot are removed.
+        Copies are verified against sizes from manifest and manifest of copied snapshot is written with digests of
+        source files, so files aren't read again.
+
+        :param node_directory: Directory of node, which will load the snapshot.
+        :param copy_strategy: Decides how content of files is transferred, see `BlockLog.copy_to` for details.
+        """
         block_log_directory = node_directory / "blockchain"
         block_log_directory.mkdir(exist_ok=True)
 
-        self.__block_log.copy_to(block_log_directory, artifacts="optional")
+        self.__block_log.copy_to(block_log_directory, artifacts="optional", copy_strategy=copy_strategy)
 
         destination_snapshot_path = node_directory / "snapshot" / self.name
         if self.__snapshot_path != destination_snapshot_path:
-            if not destination_snapshot_path.parent.exists():
-                destination_snapshot_path.parent.mkdir()
-            shutil.copytree(self.__snapshot_path, destination_snapshot_path)
+            self.__synchronize_to(destination_snapshot_path, copy_strategy)
         else:
             warnings.warn(
                 f"Copying from {self.__snapshot_path} to {destination_snapshot_path} did not occurred, because it already exists",
                 stacklevel=1,
             )
 
+    def __synchronize_to(self, destination_snapshot_path: Path, copy_strategy: CopyStrategy) -> None:
+        source_manifest = self.get_manifest()
+        destination_manifest_path = self.__get_manifest_path_of(destination_snapshot_path)
+        old_manifest = self.__load_manifest(destination_manifest_path)
+        destination_manifest: dict[str, SnapshotFileInfo] = {}
+
+        if destination_snapshot_path.exists():
+            for path in destination_snapshot_path.rglob("*"):
+                if path.is_file() and path.relative_to(destination_snapshot_path).as_posix() not in source_manifest:
+                    path.unlink()
+
+        copied = 0
+        for file, info in source_manifest.items():
+            destination = destination_snapshot_path / file
+            old_info = old_manifest.get(file)
+            if (
+                old_info is not None
+                and old_info.sha256 == info.sha256
+                and destination.exists()
+                and old_info.is_up_to_date(destination)
+            ):
+                destination_manifest[file] = old_info
+                continue
+
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            copy_file(self.__snapshot_path / file, destination, copy_strategy)
+            stat = destination.stat()
+            if stat.st_size != info.size:
+                raise SnapshotError(f"Copy of {self.__snapshot_path / file} is corrupted: size differs from manifest")
+            destination_manifest[file] = SnapshotFileInfo(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=info.sha256
+            )
+            copied += 1
+
+        self.__save_manifest(destination_manifest_path, destination_manifest)
+        logger.info(
+            f"Copied {copied} of {len(source_manifest)} files of {self.__snapshot_path} to {destination_snapshot_path}"
+        )
+
     def get_path(self) -> Path:
         return self.__snapshot_path
 
@@ -59,22 +126,117 @@ class Snapshot:
         optional_creator_info = "" if self.__creator is None else f" from {self.__creator}"
         return f"<Snapshot{optional_creator_info}: path={self.__snapshot_path}>"
 
+    @property
+    def manifest_path(self) -> Path:
+        """Manifest is stored next to snapshot directory, so it is never treated as a part of snapshot by hived."""
+        return self.__get_manifest_path_of(self.__snapshot_path)
+
+    @staticmethod
+    def __get_manifest_path_of(snapshot_path: Path) -> Path:
+        return snapshot_path.with_name(f"{snapshot_path.name}{MANIFEST_FILE_SUFFIX}")
+
+    def get_files(self, pattern: str = "*") -> list[str]:
+        """Returns sorted paths (relative to snapshot directory) of snapshot files matching `pattern`."""
+        return sorted(
+            path.relative_to(self.__snapshot_path).as_posix()
+            for path in self.__snapshot_path.rglob(pattern)
+            if path.is_file()
+        )
+
+    def get_manifest(self, pattern: str = "*", *, max_workers: int | None = None) -> dict[str, SnapshotFileInfo]:
+        """
+        Returns sizes and sha256 digests of snapshot files matching `pattern`, keyed by relative paths.
+
+        Digests are cached in manifest (see `manifest_path`) and file is hashed again only when its size or
+        modification time changes. Files are hashed concurrently by up to `max_workers` threads.
+        """
+        manifest = self.__load_manifest(self.manifest_path)
+        files = self.get_files(pattern)
+        outdated = [
+            file
+            for file in files
+            if file not in manifest or not manifest[file].is_up_to_date(self.__snapshot_path / file)
+        ]
+        if outdated:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                for file, info in zip(outdated, executor.map(self.__hash, outdated), strict=True):
+                    manifest[file] = info
+            self.__save_manifest(self.manifest_path, manifest)
+
+        return {file: manifest[file] for file in files}
+
+    def get_file_digests(self, pattern: str = "*", *, max_workers: int | None = None) -> dict[str, str]:
+        """Returns sha256 digests of snapshot files matching `pattern`, see `get_manifest` for details."""
+        return {file: info.sha256 for file, info in self.get_manifest(pattern, max_workers=max_workers).items()}
+
+    def __hash(self, file: str) -> SnapshotFileInfo:
+        path = self.__snapshot_path / file
+        stat = path.stat()
+        return SnapshotFileInfo(size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=hash_file(path))
+
+    @staticmethod
+    def __load_manifest(manifest_path: Path) -> dict[str, SnapshotFileInfo]:
+        if not manifest_path.exists():
+            return {}
+
+        with manifest_path.open(encoding="utf-8") as manifest_file:
+            files = json.load(manifest_file)["files"]
+        return {file: SnapshotFileInfo(**info) for file, info in files.items()}
+
+    @staticmethod
+    def __save_manifest(manifest_path: Path, manifest: dict[str, SnapshotFileInfo]) -> None:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        with temporary_path.open("w", encoding="utf-8") as manifest_file:
+            json.dump({"files": {file: asdict(info) for file, info in sorted(manifest.items())}}, manifest_file)
+        temporary_path.replace(manifest_path)
+
     def __eq__(self, other: object) -> bool:
+        """
+        Compares content of snapshots SST files.
+
+        Sizes of files are compared first, so most of different snapshots are detected without reading files. Then
+        files are compared one by one and comparison stops at the first pair with different digests. Digests up to date
+        in manifests of both snapshots are reused and calculated ones are stored there, so comparing the same snapshot
+        many times costs single reading of its files.
+        """
         assert isinstance(other, Snapshot)
 
-        my_files = sorted(self.get_path().rglob("*.sst"))
-        others_files = sorted(other.get_path().rglob("*.sst"))
+        my_files = self.get_files("*.sst")
+        others_files = other.get_files("*.sst")
 
         if len(my_files) != len(others_files):
             return False
 
-        is_same = True
-        for mine, others in zip(my_files, others_files, strict=False):
-            files_are_same = filecmp.cmp(mine, others, shallow=False)
-            if not files_are_same:
-                logger.warning(
-                    f"files not same {mine.as_posix()} != {others.as_posix()}: {hashlib.md5(mine.read_bytes()).hexdigest()} != {hashlib.md5(others.read_bytes()).hexdigest()}"
-                )
-                is_same = False
-
-        return is_same
+        file_pairs = list(zip(my_files, others_files, strict=True))
+        for mine, others in file_pairs:
+            if (self.get_path() / mine).stat().st_size != (other.get_path() / others).stat().st_size:
+                logger.warning(f"files not same {self.get_path() / mine} != {other.get_path() / others}: sizes differ")
+                return False
+
+        my_manifest = self.__load_manifest(self.manifest_path)
+        others_manifest = other.__load_manifest(other.manifest_path)
+        manifests_before_comparison = (dict(my_manifest), dict(others_manifest))
+        try:
+            for mine, others in file_pairs:
+                my_digest = self.__get_up_to_date_info(mine, my_manifest).sha256
+                others_digest = other.__get_up_to_date_info(others, others_manifest).sha256
+                if my_digest != others_digest:
+                    logger.warning(
+                        f"files not same {self.get_path() / mine} != {other.get_path() / others}: "
+                        f"{my_digest} != {others_digest}"
+                    )
+                    return False
+            return True
+        finally:
+            if my_manifest != manifests_before_comparison[0]:
+                self.__save_manifest(self.manifest_path, my_manifest)
+            if others_manifest != manifests_before_comparison[1]:
+                other.__save_manifest(other.manifest_path, others_manifest)
+
+    def __get_up_to_date_info(self, file: str, manifest: dict[str, SnapshotFileInfo]) -> SnapshotFileInfo:
+        """Returns info of file from `manifest`, hashing file and updating `manifest`, when info is missing or outdated."""
+        info = manifest.get(file)
+        if info is None or not info.is_up_to_date(self.__snapshot_path / file):
+            info = manifest[file] = self.__hash(file)
+        return info
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from test_tools.__private.process.node_config import NodeConfig
     from test_tools.__private.process.node_process import HivedVersionOutput
     from test_tools.__private.snapshot import Snapshot
+    from test_tools.__private.utilities.file_copying import CopyStrategy
     from wax.helpy._interfaces.time import TimeControl
 
 
@@ -95,6 +96,7 @@ class RunnableNodeHandle(NodeHandleBase):
         alternate_chain_specs: AlternateChainSpecs | None = None,
         explicit_blocking: bool = False,
         max_retries: int = 1,
+        copy_strategy: CopyStrategy = "auto",
     ) -> None:
         """
         Starts node synchronously. By default, program execution is blocked until node enters live mode (see `wait_for_live` parameter for details).
@@ -136,6 +138,11 @@ class RunnableNodeHandle(NodeHandleBase):
             instance of hived, even if it's not passed directly.
         :param max_retries:
             Number of times to retry node startup in case of transient errors.
+        :param copy_strategy:
+            Decides how files from `load_snapshot_from` and `replay_from` are copied into node's directory. By default
+            ("auto") files are cloned with copy-on-write, when filesystem supports it, and copied otherwise. With
+            "hardlink" files are shared with the source, so use it only when neither source, nor node modifies them
+            (e.g. node exits before producing new blocks). With "copy" content of files is always copied.
         """
         return self.__implementation.run(
             load_snapshot_from=load_snapshot_from,
@@ -151,6 +158,7 @@ class RunnableNodeHandle(NodeHandleBase):
             alternate_chain_specs=alternate_chain_specs,
             explicit_blocking=explicit_blocking,
             max_retries=max_retries,
+            copy_strategy=copy_strategy,
         )
 
     def restart(
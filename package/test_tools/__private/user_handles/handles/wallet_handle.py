@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, overload
 
 from test_tools.__private.node import Node
 from test_tools.__private.remote_node import RemoteNode
@@ -11,13 +11,22 @@ from test_tools.__private.user_handles.handles.node_handles.remote_node_handle i
 from test_tools.__private.wallet.wallet import Wallet
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
     from pathlib import Path
 
     from schemas.fields.hex import Hex
     from schemas.operations import Hf26Operations
     from test_tools.__private.account import Account
+    from test_tools.__private.account_set import AccountSet
     from test_tools.__private.type_annotations.any_node import AnyNode
-    from test_tools.__private.wallet.constants import TransactionSerializationTypes, WalletResponse, WalletResponseBase
+    from test_tools.__private.wallet.constants import (
+        SignerTypes,
+        SimpleTransaction,
+        TransactionSerializationTypes,
+        WalletResponse,
+        WalletResponseBase,
+    )
     from test_tools.__private.wallet.single_transaction_context import SingleTransactionContext
     from wax.helpy import Hf26Asset as Asset
 
@@ -29,6 +38,8 @@ class WalletHandle(Handle):
         preconfigure: bool = True,
         chain_id: Hex | str = "default",
         transaction_serialization: TransactionSerializationTypes = "hf26",
+        signer: SignerTypes = "beekeeper",
+        validate_transactions: bool = True,
     ):
         """
         Prepare environment for wallet based on instance of beekeeper and wax, runs beekeeper instance, beekeeper session and wallet and made preconfigurations for test usage.
@@ -38,6 +49,11 @@ class WalletHandle(Handle):
         :param preconfigure: If set to True, after run wallet initminer's keys imported.
         :param chain_id: If set to "default", wallet use chain_id from node, else use typed chain_id.
         :param transaction_serialization: Set type of transaction serialization- hf26 or legacy. Default: hf26. Legacy serialization may not work correctly with the testnet.
+        :param signer: If set to "beekeeper", transactions are signed by beekeeper. If set to "local", they are signed in
+            process, with private keys imported to wallet held in memory, which is faster, but intended only for test
+            keys (signing isn't constant-time). Default: beekeeper.
+        :param validate_transactions: If set to False, signed transactions aren't validated locally before broadcast, but
+            only by node, which saves time when many transactions are sent. Default: True.
         """
         if isinstance(attach_to, NodeHandleBase | RemoteNodeHandle):
             attach_to = get_implementation(attach_to, Node | RemoteNode)  # type: ignore[arg-type]
@@ -48,6 +64,8 @@ class WalletHandle(Handle):
                 preconfigure=preconfigure,
                 chain_id=chain_id,
                 transaction_serialization=transaction_serialization,
+                signer=signer,
+                validate_transactions=validate_transactions,
             )
         )
 
@@ -90,6 +108,41 @@ class WalletHandle(Handle):
         """
         return self.__implementation.send(operations=operations, broadcast=broadcast, blocking=blocking)
 
+    def build_many(
+        self, operations: Iterable[Hf26Operations], *, ops_per_tx: int = 1, max_workers: int | None = None
+    ) -> list[SimpleTransaction]:
+        """
+        Builds independently signed transactions with `ops_per_tx` operations each, without broadcasting them.
+
+        Operations are split in order, so the last transaction can have fewer of them. All transactions refer to the
+        same head block, fetched once. Signing keys are determined once per transaction shape (e.g. once for all
+        transfers from the same account), then transactions are signed. Transactions with identical operations are
+        identical too and node rejects duplicates, so operations should differ, e.g. in memo.
+
+        :param operations: Operations to put into transactions, in order.
+        :param ops_per_tx: Number of operations in single transaction.
+        :param max_workers: Limit of threads sending signing requests to beekeeper. Number of CPUs by default. Not used
+            by wallet with local signer, which signs sequentially, as concurrent signing in process isn't faster.
+        :return: Signed transactions, ready to be broadcast (e.g. with `submit_transaction`).
+        """
+        return self.__implementation.build_many(operations, ops_per_tx=ops_per_tx, max_workers=max_workers)
+
+    def submit_transaction(self, transaction: SimpleTransaction) -> Future[WalletResponse]:
+        """
+        Broadcasts signed transaction without waiting until it is included in block.
+
+        Inclusion of all submitted transactions is tracked together, by scanning new blocks once per block interval, so
+        thousands of them can be waited for with a few requests per block, e.g.:
+
+            futures = [wallet.submit_transaction(transaction) for transaction in wallet.build_many(operations)]
+            responses = [future.result() for future in futures]
+
+        :param transaction: Signed transaction, e.g. built with `build_many`.
+        :return: Future resolved with response containing number of block including transaction and its position in
+            this block. Raises `TransactionExpiredError` when transaction expires before being included.
+        """
+        return self.__implementation.submit_transaction(transaction)
+
     def run(self, preconfigure: bool = True) -> None:
         """
         Runs beekeeper instance, beekeeper session and wallet. Also makes preconfigurations for test usage.
@@ -110,22 +163,42 @@ class WalletHandle(Handle):
         """Returns True if wallet is running, otherwise False."""
         return self.__implementation.is_running()
 
+    @overload
+    def create_accounts(
+        self, number_of_accounts: int, name_base: str = ..., *, secret: str = ..., import_keys: bool = ...
+    ) -> list[Account]: ...
+
+    @overload
     def create_accounts(
-        self, number_of_accounts: int, name_base: str = "account", *, secret: str = "secret", import_keys: bool = True
-    ) -> list[Account]:
+        self, number_of_accounts: AccountSet, name_base: str = ..., *, secret: str = ..., import_keys: bool = ...
+    ) -> AccountSet: ...
+
+    def create_accounts(
+        self,
+        number_of_accounts: int | AccountSet,
+        name_base: str = "account",
+        *,
+        secret: str = "secret",
+        import_keys: bool = True,
+    ) -> list[Account] | AccountSet:
         """
         Creates accounts in blockchain.
 
-        :param number_of_accounts: Number of accounts to create.
+        :param number_of_accounts: Number of accounts to create or `AccountSet` with accounts to create. Prefer
+                                   `AccountSet` (see `AccountSet.create`) for hundreds of thousands of accounts, as it
+                                   takes a fraction of memory needed by list of accounts.
         :param name_base: All account names are generated as "<name_base>-<index>",
-                          e.g.: account-0, account-1, account-2 and so on...
-        :param secret: Text using as seed for account keys generation.
+                          e.g.: account-0, account-1, account-2 and so on... Ignored when `AccountSet` is passed.
+        :param secret: Text using as seed for account keys generation. Ignored when `AccountSet` is passed.
         :param import_keys: If set to true, imports created accounts' private keys. These keys are needed if you want to
                             create and sign transactions with previously created accounts.
-        :return: List of created accounts.
+        :return: List of created accounts or passed `AccountSet`.
         """
         return self.__implementation.create_accounts(
-            number_of_accounts, name_base, secret=secret, import_keys=import_keys
+            number_of_accounts,
+            name_base,
+            secret=secret,
+            import_keys=import_keys,
         )
 
     def list_accounts(self) -> list[str]:
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import os
+import shutil
+from pathlib import Path
+from typing import Final, Literal
+
+CopyStrategy = Literal["auto", "hardlink", "copy"]
+"""
+Decides how file content is transferred during copying. Allowed values:
+    - "auto" -- File is cloned with reflink (copy-on-write, supported e.g. by btrfs and xfs), so data blocks are shared
+        until one of files is modified. When filesystem doesn't support reflinks, file is copied.
+    - "hardlink" -- Destination becomes a hardlink to the source file, so it is the same file. It is intended only for
+        read-only inputs, because modification of any of them modifies both. When hardlink can't be created (e.g.
+        files are placed on different filesystems), "auto" strategy is used.
+    - "copy" -- File content is always copied.
+"""
+
+FICLONE: Final[int] = 0x40049409  # from linux/fs.h
+COPYING_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+def copy_file(source: Path | str, destination: Path | str, strategy: CopyStrategy = "auto") -> Path:
+    """
+    Copies file in the same way as `shutil.copy` does, but avoids copying of file content if `strategy` allows.
+
+    :param source: Path of file to copy.
+    :param destination: Path of destination file or directory, where file will be placed.
+    :param strategy: How file content is transferred, see `CopyStrategy` for details.
+    :return: Path of destination file.
+    """
+    source = Path(source)
+    destination = Path(destination)
+    if destination.is_dir():
+        destination = destination / source.name
+
+    if destination.exists():
+        if destination.samefile(source):
+            return destination
+        # Never write to existing destination, it might be a hardlink to another file.
+        destination.unlink()
+
+    if strategy == "hardlink":
+        with contextlib.suppress(OSError):
+            os.link(source, destination)
+            return destination
+        strategy = "auto"
+
+    if strategy == "auto" and __clone(source, destination):
+        shutil.copymode(source, destination)
+        return destination
+
+    return Path(shutil.copy(source, destination))
+
+
+def copy_tree(source: Path | str, destination: Path | str, strategy: CopyStrategy = "auto") -> Path:
+    """Copies directory tree in the same way as `shutil.copytree` does, but files are copied with `copy_file`."""
+
+    def copy_function(source_file: str, destination_file: str) -> Path:
+        return copy_file(source_file, destination_file, strategy)
+
+    return Path(shutil.copytree(source, destination, copy_function=copy_function))
+
+
+def __clone(source: Path, destination: Path) -> bool:
+    try:
+        with source.open("rb") as source_file, destination.open("wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def copy_file_prefix(source: Path, destination: Path, size: int) -> None:
+    """
+    Copies first `size` bytes of `source` file to `destination` file.
+
+    Data is transferred by kernel (`os.copy_file_range`), which shares data blocks of both files, when filesystem
+    supports it. Otherwise, data is copied in chunks.
+    """
+    destination.unlink(missing_ok=True)  # never write to existing destination, it might be a hardlink to another file
+    with source.open("rb") as source_file, destination.open("wb") as destination_file:
+        copied = 0
+        with contextlib.suppress(OSError):
+            while copied < size:
+                chunk_size = os.copy_file_range(source_file.fileno(), destination_file.fileno(), size - copied)
+                if chunk_size == 0:
+                    break
+                copied += chunk_size
+
+        source_file.seek(copied)
+        destination_file.seek(copied)
+        while copied < size and (chunk := source_file.read(min(COPYING_CHUNK_SIZE, size - copied))):
+            destination_file.write(chunk)
+            copied += len(chunk)
+
+    if copied != size:
+        raise ValueError(f"{source} is shorter than {size} bytes")
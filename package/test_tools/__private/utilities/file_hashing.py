@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HASHING_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Returns hex sha256 digest of file content. File is read in chunks, so it is never loaded to memory at once."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(HASHING_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
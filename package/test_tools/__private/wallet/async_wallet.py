@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from beekeepy.communication import StrictOverseer
+from beekeepy.exceptions import ErrorInResponseError
+from beekeepy.handle.remote import RemoteHandleSettings
+
+from schemas.fields.hive_int import HiveInt
+from test_tools.__private import exceptions
+from test_tools.__private.hived.async_handle import AsyncHived
+from test_tools.__private.user_handles.get_implementation import get_implementation
+from test_tools.__private.wallet.constants import SimpleTransaction, WalletResponse, WalletResponseBase
+from test_tools.__private.wallet.inclusion_scanner import BLOCK_INTERVAL, InclusionScanner
+from test_tools.__private.wallet.tapos_provider import TaposProvider
+from test_tools.__private.wallet.wallet import Wallet
+from test_tools.__private.wax_wrapper import calculate_legacy_transaction_id, calculate_transaction_id
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from schemas.operations import Hf26Operations
+    from test_tools.__private.user_handles.handles.wallet_handle import WalletHandle
+
+
+class InclusionWatcher:
+    """
+    Waits for inclusion of many transactions at once, with single task scanning new blocks once per block interval.
+
+    Each scan needs one call for head block and one call per up to 1000 new blocks, regardless of number of watched
+    transactions (see `InclusionScanner`). Task runs only when there are watched transactions.
+    """
+
+    def __init__(self, node: AsyncHived, *, scan_interval: float = BLOCK_INTERVAL) -> None:
+        self.__node = node
+        self.__scan_interval = scan_interval
+        self.__scanner: InclusionScanner[asyncio.Future[tuple[int, int]]] = InclusionScanner()
+        self.__task: asyncio.Task[None] | None = None
+
+    def watch(
+        self, transaction_id: str, expiration: datetime, *, head_block_number: int
+    ) -> asyncio.Future[tuple[int, int]]:
+        """
+        Starts waiting for transaction. Must be called before it is broadcast, so it can't be missed in scanned blocks.
+
+        :param head_block_number: Number of head block known before transaction was broadcast (e.g. its TaPoS block).
+        :return: Future resolved with number of block including transaction and its position in this block. Raises
+            `TransactionExpiredError` when transaction expires before being included.
+        """
+        future: asyncio.Future[tuple[int, int]] = asyncio.get_running_loop().create_future()
+        self.__scanner.add(transaction_id, expiration, future, head_block_number=head_block_number)
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run())
+        return future
+
+    def forget(self, transaction_id: str) -> None:
+        """Stops waiting for transaction, e.g. when its broadcast failed."""
+        if (future := self.__scanner.remove(transaction_id)) is not None:
+            future.cancel()
+
+    async def close(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+        for future in self.__scanner.remove_all():
+            future.cancel()
+
+    def __len__(self) -> int:
+        return len(self.__scanner)
+
+    async def __run(self) -> None:
+        try:
+            while len(self.__scanner) > 0:
+                await asyncio.sleep(self.__scan_interval)
+                await self.__scan()
+        except Exception as error:  # noqa: BLE001
+            for future in self.__scanner.remove_all():
+                if not future.done():
+                    future.set_exception(error)
+        finally:
+            self.__task = None
+            # Scanning starts again from head block of next watched transaction.
+            for future in self.__scanner.remove_all():
+                future.cancel()
+
+    async def __scan(self) -> None:
+        gdpo = await self.__node.api.database.get_dynamic_global_properties()
+        while (block_range := self.__scanner.get_block_range_to_scan(gdpo.head_block_number)) is not None:
+            response = await self.__node.api.block.get_block_range(
+                starting_block_num=block_range[0], count=block_range[1]
+            )
+            if not response.blocks:
+                break
+            for future, block_number, transaction_number in self.__scanner.add_scanned_blocks(response.blocks):
+                if not future.done():
+                    future.set_result((block_number, transaction_number))
+
+        for transaction_id, expiration, future in self.__scanner.pop_expired(gdpo.time):
+            if not future.done():
+                future.set_exception(
+                    exceptions.TransactionExpiredError(f"Transaction {transaction_id} expired at {expiration}")
+                )
+
+
+class AsyncWallet:
+    """
+    Asynchronous interface of `Wallet`, which allows to broadcast hundreds of transactions at once from single thread.
+
+    Requests are sent through single HTTP session and transactions waiting for inclusion are confirmed together, by
+    scanning new blocks once per block interval (see `InclusionWatcher`), instead of holding one request per
+    transaction open until its inclusion:
+
+        async with tt.AsyncWallet(wallet) as async_wallet:
+            responses = await asyncio.gather(*(async_wallet.send([operation]) for operation in operations))
+
+    Transactions are signed by wrapped wallet with its keys, one at a time in worker thread, so event loop isn't
+    blocked meanwhile.
+    """
+
+    def __init__(self, wallet: WalletHandle) -> None:
+        self.__wallet = get_implementation(wallet, Wallet)
+        self.__node = AsyncHived(
+            settings=RemoteHandleSettings(
+                http_endpoint=self.__wallet._force_connected_node.get_http_endpoint(),
+                period_between_retries=timedelta(seconds=0.5),
+                max_retries=8,
+                overseer=StrictOverseer,
+            )
+        )
+        self.__watcher = InclusionWatcher(self.__node)
+        self.__signing_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stops waiting for inclusion of transactions and closes HTTP session."""
+        await self.__watcher.close()
+        self.__node.teardown()
+
+    async def send(
+        self, operations: list[Hf26Operations], *, broadcast: bool = True, blocking: bool = True
+    ) -> WalletResponseBase | WalletResponse:
+        """
+        Builds transaction with given operations, signs and broadcasts it.
+
+        :param blocking: If set, waits until transaction is included in block and returns `WalletResponse` with its
+            position, otherwise returns `WalletResponseBase` right after broadcast.
+        """
+        # Reference is shared with other wallets of this node and refreshed at most once per block interval, so it
+        # rarely needs request, but when it does, it's fetched in worker thread to not block event loop.
+        reference = await asyncio.to_thread(TaposProvider.for_node(self.__wallet._force_connected_node).get)
+        transaction = SimpleTransaction(
+            ref_block_num=HiveInt(reference.ref_block_num),
+            ref_block_prefix=HiveInt(reference.ref_block_prefix),
+            expiration=reference.head_block_time + self.__wallet._transaction_expiration_offset,
+            extensions=[],
+            signatures=[],
+            operations=[],
+        )
+        for operation in operations:
+            transaction.add_operation(operation)
+
+        async with self.__signing_lock:
+            transaction = await asyncio.to_thread(self.__wallet.complex_transaction_sign, transaction)
+
+        return await self.__broadcast(
+            transaction, head_block_number=reference.head_block_number, broadcast=broadcast, blocking=blocking
+        )
+
+    async def broadcast_transaction(
+        self, transaction: SimpleTransaction, *, blocking: bool = True
+    ) -> WalletResponseBase | WalletResponse:
+        """Broadcasts already signed transaction (see `send` for meaning of `blocking`)."""
+        gdpo = await self.__node.api.database.get_dynamic_global_properties()
+        return await self.__broadcast(
+            transaction, head_block_number=gdpo.head_block_number, broadcast=True, blocking=blocking
+        )
+
+    async def __broadcast(
+        self, transaction: SimpleTransaction, *, head_block_number: int, broadcast: bool, blocking: bool
+    ) -> WalletResponseBase | WalletResponse:
+        transaction_id = (
+            calculate_transaction_id(transaction)
+            if self.__wallet._transaction_serialization == "hf26"
+            else calculate_legacy_transaction_id(transaction)
+        )
+        transaction_fields: dict[str, Any] = {
+            "transaction_id": transaction_id,
+            "ref_block_num": transaction.ref_block_num,
+            "ref_block_prefix": transaction.ref_block_prefix,
+            "expiration": transaction.expiration,
+            "extensions": transaction.extensions,
+            "signatures": transaction.signatures,
+            "operations": transaction.operations,
+        }
+        if not broadcast:
+            return WalletResponseBase(**transaction_fields)
+
+        inclusion = (
+            self.__watcher.watch(transaction_id, transaction.expiration, head_block_number=head_block_number)
+            if blocking
+            else None
+        )
+        try:
+            await self.__node.api.wallet_bridge.broadcast_transaction(transaction)
+        except BaseException as error:
+            self.__watcher.forget(transaction_id)
+            if isinstance(error, ErrorInResponseError):
+                self.__wallet._authority_cache.forget_signing_keys(transaction)
+            raise
+        self.__wallet._authority_cache.confirm_signing_keys(transaction)
+        self.__wallet._authority_cache.observe(transaction)
+
+        if inclusion is None:
+            return WalletResponseBase(**transaction_fields)
+
+        block_num, transaction_num = await inclusion
+        return WalletResponse(**transaction_fields, block_num=block_num, transaction_num=transaction_num)
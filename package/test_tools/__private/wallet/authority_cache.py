@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, TypeAlias
+
+from schemas.fields.basic import AccountName
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from schemas.transaction import Transaction
+    from test_tools.__private.wax_wrapper import wax_authorities
+
+    TransactionShape: TypeAlias = tuple[tuple[str, tuple[tuple[str, Any], ...]], ...]
+
+AUTHORITY_CHANGING_OPERATIONS: Final[frozenset[str]] = frozenset(
+    {
+        "account_update_operation",
+        "account_update2_operation",
+        "recover_account_operation",
+        "reset_account_operation",
+        "witness_update_operation",
+        "witness_set_properties_operation",
+    }
+)
+"""Operations changing authorities or witness signing keys of accounts they refer to."""
+
+
+class AuthorityCache:
+    """
+    Authorities of accounts, signing keys of witnesses and keys used to sign transactions of given shape.
+
+    Shape of transaction consists of its operation types with account names they refer to (e.g. transfer from alice to
+    bob), so e.g. repeated transfers from the same account are signed with memoized keys, without any lookups. Keys are
+    memoized only after transaction signed with them is accepted by node (see `confirm_signing_keys`), so keys
+    insufficient e.g. because needed key wasn't imported yet aren't reused.
+
+    Cache is updated only with transactions observed by its wallet. Authorities of accounts referred by operations from
+    `AUTHORITY_CHANGING_OPERATIONS` are refetched, but changes made by other wallets aren't noticed, until `clear`.
+    """
+
+    def __init__(self) -> None:
+        self.__authorities: dict[str, wax_authorities] = {}
+        self.__witness_keys: dict[str, str] = {}
+        self.__signing_keys: dict[TransactionShape, list[str]] = {}
+        self.__unconfirmed_signing_keys: dict[TransactionShape, list[str]] = {}
+
+    def get_authorities(
+        self, account_names: list[str], retrieve: Callable[[list[str]], dict[str, wax_authorities]]
+    ) -> dict[str, wax_authorities]:
+        """Returns authorities of accounts, calling `retrieve` only for accounts, which aren't cached yet."""
+        if missing := [name for name in account_names if name not in self.__authorities]:
+            self.__authorities.update(retrieve(missing))
+        return {name: self.__authorities[name] for name in account_names if name in self.__authorities}
+
+    def get_witness_key(self, witness_name: str, retrieve: Callable[[str], str]) -> str:
+        if witness_name not in self.__witness_keys:
+            self.__witness_keys[witness_name] = retrieve(witness_name)
+        return self.__witness_keys[witness_name]
+
+    def get_signing_keys(self, transaction: Transaction, *, unconfirmed: bool = False) -> list[str] | None:
+        """
+        Returns keys, which signed accepted transaction of the same shape before, or None when they're unknown.
+
+        :param unconfirmed: If set, keys stored for transaction of the same shape, which wasn't accepted yet, are
+            returned too (e.g. when many transactions are signed before any of them is broadcast).
+        """
+        if (shape := self.__get_shape(transaction)) is None:
+            return None
+        keys = self.__signing_keys.get(shape)
+        if keys is None and unconfirmed:
+            keys = self.__unconfirmed_signing_keys.get(shape)
+        return keys
+
+    def store_signing_keys(self, transaction: Transaction, keys: list[str]) -> None:
+        """Stores keys used to sign transaction. They are memoized, when transaction is accepted by node."""
+        if keys and (shape := self.__get_shape(transaction)) is not None:
+            self.__unconfirmed_signing_keys[shape] = keys
+
+    def confirm_signing_keys(self, transaction: Transaction) -> None:
+        """Memoizes keys stored for transactions of given shape, as transaction signed with them was accepted."""
+        if (shape := self.__get_shape(transaction)) is not None and (
+            keys := self.__unconfirmed_signing_keys.pop(shape, None)
+        ) is not None:
+            self.__signing_keys[shape] = keys
+
+    def clear_signing_keys(self) -> None:
+        """Forgets keys of all transaction shapes, e.g. when new keys are imported."""
+        self.__signing_keys.clear()
+        self.__unconfirmed_signing_keys.clear()
+
+    def forget_signing_keys(self, transaction: Transaction) -> None:
+        """
+        Forgets keys used for transactions of given shape, e.g. when transaction signed with them was rejected.
+
+        Authorities and witness keys of accounts referred by transaction are forgotten too, as they might have been
+        changed by other wallets in the meantime, so keys are resolved from fresh data next time.
+        """
+        if (shape := self.__get_shape(transaction)) is not None:
+            self.__signing_keys.pop(shape, None)
+            self.__unconfirmed_signing_keys.pop(shape, None)
+        for operation in transaction.operations:
+            self.__forget_accounts_of(operation)
+
+    def observe(self, transaction: Transaction) -> None:
+        """Invalidates data of accounts, which authorities are changed by transaction broadcast by wallet."""
+        for operation in transaction.operations:
+            if operation.type_ not in AUTHORITY_CHANGING_OPERATIONS:
+                continue
+
+            self.__forget_accounts_of(operation)
+            self.clear_signing_keys()
+
+    def clear(self) -> None:
+        self.__authorities.clear()
+        self.__witness_keys.clear()
+        self.clear_signing_keys()
+
+    def __forget_accounts_of(self, operation: Any) -> None:
+        for _, value in self.__get_account_fields(operation.value):
+            for name in value if isinstance(value, tuple) else (value,):
+                self.__authorities.pop(name, None)
+                self.__witness_keys.pop(name, None)
+
+    @classmethod
+    def __get_shape(cls, transaction: Transaction) -> TransactionShape | None:
+        """Returns shape of transaction or None, if keys required by it depend on more than its shape."""
+        shape = []
+        for operation in transaction.operations:
+            if operation.type_ in AUTHORITY_CHANGING_OPERATIONS:
+                return None
+            shape.append((operation.type_, tuple(cls.__get_account_fields(operation.value))))
+        return tuple(shape)
+
+    @staticmethod
+    def __get_account_fields(operation: Any) -> Iterator[tuple[str, Any]]:
+        """Yields fields of operation holding account names (single or lists), e.g. `from` and `to` of transfer."""
+        for field_name in operation.__struct_fields__:
+            value = getattr(operation, field_name)
+            if isinstance(value, AccountName):
+                yield field_name, value
+            elif isinstance(value, list | tuple) and value and all(isinstance(item, AccountName) for item in value):
+                yield field_name, tuple(value)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+from typing import Final
+
+from test_tools.__private.wallet.constants import ACCOUNT_PER_TRANSACTION
+
+MIN_ACCOUNTS_PER_TRANSACTION: Final[int] = 1
+MAX_ACCOUNTS_PER_TRANSACTION: Final[int] = 4 * ACCOUNT_PER_TRANSACTION
+LATENCY_TOLERANCE: Final[float] = 3.0
+"""Broadcast is considered slow, when it takes more than `LATENCY_TOLERANCE` times longer than the fastest one."""
+DECREASE_FACTOR: Final[float] = 0.75
+INCREASE_FACTOR: Final[float] = 1.25
+
+MIN_IMPORT_KEYS_BATCH_SIZE: Final[int] = 1_000
+MAX_IMPORT_KEYS_BATCH_SIZE: Final[int] = 100_000
+IMPORT_KEYS_BATCH_DURATION: Final[float] = 2.0
+"""Import keys batches are sized to take about this number of seconds, long enough to hide request overhead."""
+
+# Rejections caused by size of transaction (too big transaction or too expensive in resource credits). They are
+# handled by making transactions smaller, other rejections by sending less transactions at once.
+SIZE_RELATED_REJECTION_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"size|too large|\bRC\b|resource credit|not_enough_rc", re.IGNORECASE
+)
+
+
+class AdaptiveBatchSizing:
+    """
+    Tunes number of accounts per transaction and number of transactions in flight during mass account creation.
+
+    Both values follow additive increase / multiplicative decrease scheme, driven by feedback from node:
+    - slow broadcasts and transactions which wait for inclusion longer than a block (blocks are full) lower number of
+      transactions in flight, fast broadcasts raise it,
+    - rejections of too big transactions (size or resource credits) make transactions smaller and limit their size
+      from now on, blocks including all transactions in time make transactions bigger (up to that limit).
+    """
+
+    def __init__(self, *, max_in_flight: int, max_in_flight_limit: int | None = None) -> None:
+        self.__accounts_per_transaction = ACCOUNT_PER_TRANSACTION
+        self.__accounts_per_transaction_limit = MAX_ACCOUNTS_PER_TRANSACTION
+        self.__max_in_flight = max_in_flight
+        self.__max_in_flight_limit = max_in_flight_limit or 4 * max_in_flight
+        self.__fastest_broadcast: float | None = None
+
+    @property
+    def accounts_per_transaction(self) -> int:
+        return self.__accounts_per_transaction
+
+    @property
+    def max_in_flight(self) -> int:
+        """Number of transactions, which can be signed, broadcast or waiting for inclusion at the same time."""
+        return self.__max_in_flight
+
+    def on_broadcast(self, latency: float) -> None:
+        """Called after each successful broadcast with time it took (in seconds, including signing)."""
+        if self.__fastest_broadcast is None or latency < self.__fastest_broadcast:
+            self.__fastest_broadcast = latency
+
+        if latency > LATENCY_TOLERANCE * self.__fastest_broadcast:
+            self.__decrease_in_flight()
+        else:
+            self.__max_in_flight = min(self.__max_in_flight + 1, self.__max_in_flight_limit)
+
+    def on_rejection(self, reason: str, number_of_accounts: int) -> bool:
+        """
+        Called when transaction creating `number_of_accounts` accounts was rejected by node.
+
+        :return: True if rejection was caused by size of transaction, so accounts should be sent in smaller ones.
+        """
+        if SIZE_RELATED_REJECTION_PATTERN.search(reason) is None:
+            self.__decrease_in_flight()
+            return False
+
+        self.__accounts_per_transaction_limit = min(
+            max(number_of_accounts // 2, MIN_ACCOUNTS_PER_TRANSACTION), self.__accounts_per_transaction_limit
+        )
+        self.__accounts_per_transaction = min(self.__accounts_per_transaction, self.__accounts_per_transaction_limit)
+        return True
+
+    def on_blocks_scanned(self, *, number_of_included: int, number_of_overdue: int) -> None:
+        """
+        Called after scan of new blocks.
+
+        :param number_of_included: Number of tracked transactions included in scanned blocks.
+        :param number_of_overdue: Number of transactions, which are still waiting for inclusion after whole block
+            interval.
+        """
+        if number_of_overdue > 0:
+            self.__decrease_in_flight()
+        elif number_of_included > 0:
+            self.__accounts_per_transaction = min(
+                max(int(self.__accounts_per_transaction * INCREASE_FACTOR), self.__accounts_per_transaction + 1),
+                self.__accounts_per_transaction_limit,
+            )
+
+    def __decrease_in_flight(self) -> None:
+        self.__max_in_flight = max(int(self.__max_in_flight * DECREASE_FACTOR), 1)
+
+
+def get_next_import_keys_batch_size(batch_size: int, duration: float) -> int:
+    """Returns size of next import keys batch, so it takes about `IMPORT_KEYS_BATCH_DURATION` seconds."""
+    if duration <= 0:
+        return min(batch_size * 2, MAX_IMPORT_KEYS_BATCH_SIZE)
+
+    scale = min(max(IMPORT_KEYS_BATCH_DURATION / duration, 0.5), 2.0)
+    return min(max(int(batch_size * scale), MIN_IMPORT_KEYS_BATCH_SIZE), MAX_IMPORT_KEYS_BATCH_SIZE)
@@ -32,6 +32,7 @@ HbdExchangeRateApiType = HbdExchangeRate | dict[str, str]
 
 AuthorityType = Literal["active", "owner", "posting"]
 TransactionSerializationTypes = Literal["hf26", "legacy"]
+SignerTypes = Literal["beekeeper", "local"]
 
 
 @dataclass
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import concurrent
 import concurrent.futures
+import math
+import multiprocessing
 import os
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, ClassVar, Final
 
 from loguru import logger
 
@@ -16,12 +20,13 @@ from schemas.fields.hive_int import HiveInt
 from schemas.operations.account_create_operation import AccountCreateOperation
 from test_tools.__private.account import Account
 from test_tools.__private.remote_node import RemoteNode
+from test_tools.__private.wallet.batch_sizing import AdaptiveBatchSizing, get_next_import_keys_batch_size
 from test_tools.__private.wallet.constants import (
     ACCOUNT_PER_TRANSACTION,
     MULTIPLE_IMPORT_KEYS_BATCH_SIZE,
     SimpleTransaction,
-    WalletResponseBase,
 )
+from test_tools.__private.wallet.inclusion_scanner import BLOCK_INTERVAL, InclusionScanner
 from test_tools.__private.wax_wrapper import (
     calculate_sig_digest,
     calculate_transaction_id,
@@ -30,247 +35,339 @@ from test_tools.__private.wax_wrapper import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
-    from beekeepy import Beekeeper, PackedSyncBeekeeper, UnlockedWallet
+    from beekeepy import Beekeeper, PackedSyncBeekeeper
     from beekeepy.interfaces import HttpUrl
 
     from schemas.fields.basic import PublicKey
-    from schemas.operations import Hf26Operations
+    from schemas.fields.hive_datetime import HiveDateTime
+    from test_tools.__private.account_set import AccountSet
     from test_tools.__private.node import Node
 
     AnyNode = Node | RemoteNode
 
+MAX_NUMBER_OF_RETRIES: Final[int] = 20
+TRANSACTION_EXPIRATION: Final[timedelta] = timedelta(minutes=5)
+"""Short expiration allows to detect and resend transactions dropped by node, without waiting long."""
+
 
 def get_authority(key: PublicKey | str) -> Authority:
     return Authority(weight_threshold=1, account_auths=[], key_auths=[(key, 1)])
 
 
-def generate_transaction_template(node: RemoteNode) -> SimpleTransaction:
-    gdpo = node.api.database.get_dynamic_global_properties()
-    block_id = gdpo.head_block_id
+@dataclass(frozen=True)
+class TransactionTemplate:
+    """Data shared by all transactions built in single block window. Passed to worker processes, so it's picklable."""
 
-    # set header
-    tapos_data = get_tapos_data(block_id)
-    ref_block_num = tapos_data.ref_block_num
-    ref_block_prefix = tapos_data.ref_block_prefix
+    ref_block_num: int
+    ref_block_prefix: int
+    expiration: HiveDateTime
+    account_creation_fee: int
 
-    assert ref_block_num >= 0, f"ref_block_num value `{ref_block_num}` is invalid`"
-    assert ref_block_prefix > 0, f"ref_block_prefix value `{ref_block_prefix}` is invalid`"
+    def create_transaction(self, accounts: AccountSet) -> SimpleTransaction:
+        transaction = SimpleTransaction(
+            ref_block_num=HiveInt(self.ref_block_num),
+            ref_block_prefix=HiveInt(self.ref_block_prefix),
+            expiration=self.expiration,
+            extensions=[],
+            signatures=[],
+            operations=[],
+        )
 
-    return SimpleTransaction(
-        ref_block_num=HiveInt(ref_block_num),
-        ref_block_prefix=HiveInt(ref_block_prefix),
-        expiration=gdpo.time + timedelta(seconds=1800),
-        extensions=[],
-        signatures=[],
-        operations=[],
-    )
+        for name, public_key in zip(accounts.names(), accounts.public_keys(), strict=True):
+            transaction.add_operation(
+                AccountCreateOperation(
+                    creator="initminer",
+                    new_account_name=name,
+                    json_metadata="{}",
+                    fee=AssetHive(AssetNaiAmount(self.account_creation_fee)),
+                    owner=get_authority(public_key),
+                    active=get_authority(public_key),
+                    posting=get_authority(public_key),
+                    memo_key=public_key,
+                )
+            )
+        return transaction
+
+
+class TransactionTemplateProvider:
+    """Fetches reference block and account creation fee at most once per block interval. Chain id is fetched once."""
+
+    def __init__(self, node: AnyNode) -> None:
+        self.__node = node
+        self.__chain_id = str(node.api.database.get_config().HIVE_CHAIN_ID)
+        self.__template: TransactionTemplate | None = None
+        self.__fetch_time = 0.0
+
+    def get(self) -> TransactionTemplate:
+        if self.__template is None or time.monotonic() - self.__fetch_time >= BLOCK_INTERVAL:
+            self.__template = self.__fetch()
+            self.__fetch_time = time.monotonic()
+        return self.__template
+
+    @property
+    def chain_id(self) -> str:
+        return self.__chain_id
+
+    def __fetch(self) -> TransactionTemplate:
+        gdpo = self.__node.api.database.get_dynamic_global_properties()
+        tapos_data = get_tapos_data(gdpo.head_block_id)
+        assert tapos_data.ref_block_num >= 0, f"ref_block_num value `{tapos_data.ref_block_num}` is invalid`"
+        assert tapos_data.ref_block_prefix > 0, f"ref_block_prefix value `{tapos_data.ref_block_prefix}` is invalid`"
+
+        return TransactionTemplate(
+            ref_block_num=tapos_data.ref_block_num,
+            ref_block_prefix=tapos_data.ref_block_prefix,
+            expiration=gdpo.time + TRANSACTION_EXPIRATION,
+            account_creation_fee=int(self.__node.api.wallet_bridge.get_chain_properties().account_creation_fee.amount),
+        )
 
 
-def sign_transaction(
-    node: RemoteNode, transaction: SimpleTransaction, beekeeper_wallet: UnlockedWallet
-) -> SimpleTransaction:
-    calculate_transaction_id(transaction)
-    node_config = node.api.database.get_config()
+class InclusionTracker:
+    """
+    Confirms inclusion of many broadcast transactions at once, by scanning new blocks with `block_api`.
 
-    sig_digest = calculate_sig_digest(transaction, node_config.HIVE_CHAIN_ID)
-    key_to_sign_with = beekeeper_wallet.import_key(private_key=Account("initminer").private_key)
+    Each scan needs one call for head block and one call per up to 1000 new blocks, regardless of number of tracked
+    transactions (see `InclusionScanner`).
+    """
 
-    time_before = datetime.now()
-    signature = beekeeper_wallet.sign_digest(sig_digest=sig_digest, key=key_to_sign_with)
-    logger.info(f"Sign digest time: {datetime.now() - time_before}")
+    def __init__(self, node: AnyNode) -> None:
+        self.__node = node
+        # Pending transactions with their accounts and number of scans done before they were tracked. Transaction can
+        # be included before it is tracked, so included ones are remembered.
+        self.__scanner: InclusionScanner[tuple[AccountSet, int]] = InclusionScanner(
+            next_block_number=node.api.database.get_dynamic_global_properties().head_block_number + 1,
+            remember_included=True,
+        )
+        self.__number_of_scans = 0
+        self.__number_of_included_by_last_scan = 0
+
+    @property
+    def number_of_included_by_last_scan(self) -> int:
+        return self.__number_of_included_by_last_scan
+
+    @property
+    def number_of_overdue(self) -> int:
+        """Number of transactions waiting for inclusion for whole interval between scans (e.g. blocks are full)."""
+        return sum(
+            1 for _, tracked_after_scan in self.__scanner.values() if tracked_after_scan < self.__number_of_scans - 1
+        )
 
-    transaction.signatures.append(signature)
+    def track(self, transaction_id: str, accounts: AccountSet, expiration: datetime) -> None:
+        self.__scanner.add(transaction_id, expiration, (accounts, self.__number_of_scans))
 
-    transaction.signatures = list(set(transaction.signatures))
-    validate_transaction(transaction)
+    def scan(self) -> list[AccountSet]:
+        """Forgets transactions included in new blocks. Returns accounts of transactions which expired meanwhile."""
+        self.__number_of_scans += 1
+        included, expired = self.__scanner.scan(self.__node)
+        self.__number_of_included_by_last_scan = len(included)
+        return [accounts for *_, (accounts, _) in expired]
 
-    return transaction
+    def __len__(self) -> int:
+        return len(self.__scanner)
 
 
-def prepare_transaction(
-    operations: list[Hf26Operations], node: RemoteNode, beekeeper_wallet: UnlockedWallet
-) -> WalletResponseBase:
-    transaction = generate_transaction_template(node)
+class SigningWorker:
+    """
+    State of worker process, which signs and broadcasts transactions creating accounts.
 
-    account_creation_fee = node.api.wallet_bridge.get_chain_properties().account_creation_fee
+    It's created once per process (as pool initializer), so beekeeper session, unlocked wallet, signing key and
+    connection to node are reused by all transactions handled by the worker. Workers receive only accounts and
+    transaction template of each transaction through queue of the pool. Session is closed with beekeeper.
+    """
 
-    for operation in operations:
-        if isinstance(operation, AccountCreateOperation):
-            operation.fee = account_creation_fee
-        transaction.add_operation(operation)
-    transaction = sign_transaction(node, transaction, beekeeper_wallet)
+    instance: ClassVar[SigningWorker | None] = None
 
-    return WalletResponseBase(
-        transaction_id=calculate_transaction_id(transaction),
-        ref_block_num=transaction.ref_block_num,
-        ref_block_prefix=transaction.ref_block_prefix,
-        expiration=transaction.expiration,
-        extensions=transaction.extensions,
-        signatures=transaction.signatures,
-        operations=transaction.operations,
-    )
+    def __init__(
+        self,
+        packed_beekeeper: PackedSyncBeekeeper,
+        node_address: HttpUrl,
+        beekeeper_wallet_name: str,
+        beekeeper_wallet_password: str,
+        chain_id: str,
+    ) -> None:
+        self.__beekeeper = packed_beekeeper.unpack()
+        self.__session = self.__beekeeper.create_session()
+        self.__wallet = self.__session.open_wallet(name=beekeeper_wallet_name).unlock(beekeeper_wallet_password)
+        self.__key = self.__wallet.import_key(private_key=Account("initminer").private_key)
+        self.__node = RemoteNode(http_endpoint=node_address)
+        self.__chain_id = chain_id
+
+    @staticmethod
+    def initialize(
+        packed_beekeeper: PackedSyncBeekeeper,
+        node_address: HttpUrl,
+        beekeeper_wallet_name: str,
+        beekeeper_wallet_password: str,
+        chain_id: str,
+    ) -> None:
+        SigningWorker.instance = SigningWorker(
+            packed_beekeeper, node_address, beekeeper_wallet_name, beekeeper_wallet_password, chain_id
+        )
 
+    @staticmethod
+    def sign_and_broadcast(accounts: AccountSet, template: TransactionTemplate) -> str:
+        """Broadcasts transaction without waiting for its inclusion and returns its id."""
+        assert SigningWorker.instance is not None, "Worker is not initialized"
+        return SigningWorker.instance.__sign_and_broadcast(accounts, template)
 
-def send_transaction(  # noqa: C901
-    accounts_: list[Account],
-    packed_beekeeper: PackedSyncBeekeeper,
-    node_address: HttpUrl,
-    beekeeper_wallet_name: str,
-    beekeeper_wallet_password: str,
-) -> None:
-    def retry_until_success(predicate: Callable[[], Any], *, fail_message: str, max_retries: int = 20) -> bool:
-        retries = 0
-        while retries <= max_retries:
-            try:
-                predicate()
-            except Exception as e:  # noqa: BLE001
-                logger.error(f"{fail_message} ; {e}")
-                retries += 1
-            else:
-                return True
-        return False
-
-    def ensure_accounts_exists() -> None:
-        listed_accounts = node.api.wallet_bridge.list_accounts(accounts_[0].name, 1)
-        logger.info(listed_accounts)
-        if accounts_[0].name in listed_accounts:
-            logger.debug(f"Accounts created: {accounts_range_message}")
-
-    def broadcast_transaction(
-        operations: list[Hf26Operations], node: RemoteNode, beekeeper_wallet: UnlockedWallet
-    ) -> bool:
-        def prepare_and_broadcast() -> None:
-            trx = prepare_transaction(operations, node, beekeeper_wallet)
-            with node.restore_settings():
-                node.settings.timeout = timedelta(hours=1)
-                node.api.wallet_bridge.broadcast_transaction_synchronous(trx)
-
-        return retry_until_success(
-            prepare_and_broadcast,
-            fail_message=f"Failed to send transaction: {accounts_range_message}",
-        )
+    def __sign_and_broadcast(self, accounts: AccountSet, template: TransactionTemplate) -> str:
+        transaction = template.create_transaction(accounts)
 
-    operations: list[Hf26Operations] = []
-    beekeeper = packed_beekeeper.unpack()
-    node = RemoteNode(http_endpoint=node_address)
-
-    accounts_range_message = f"{accounts_[0].name}..{accounts_[-1].name}"
-    for account in accounts_:
-        operation = AccountCreateOperation(
-            creator="initminer",
-            new_account_name=account.name,
-            json_metadata="{}",
-            fee=AssetHive(AssetNaiAmount(1)),
-            owner=get_authority(account.public_key),
-            active=get_authority(account.public_key),
-            posting=get_authority(account.public_key),
-            memo_key=account.public_key,
+        time_before = datetime.now()
+        signature = self.__wallet.sign_digest(
+            sig_digest=calculate_sig_digest(transaction, self.__chain_id), key=self.__key
         )
+        logger.info(f"Sign digest time: {datetime.now() - time_before}")
+
+        transaction.signatures.append(signature)
+        validate_transaction(transaction)
 
-        operations.append(operation)
+        self.__node.api.wallet_bridge.broadcast_transaction(transaction)
+        return calculate_transaction_id(transaction)
 
-    # Send transaction
+
+def import_keys_of(
+    accounts: AccountSet, beekeeper: Beekeeper, beekeeper_wallet_name: str, beekeeper_wallet_password: str
+) -> None:
     with beekeeper.create_session() as session:
         beekeeper_wallet = session.open_wallet(name=beekeeper_wallet_name)
         beekeeper_wallet = beekeeper_wallet.unlock(beekeeper_wallet_password)
-
-        while True:
-            if not broadcast_transaction(operations, node, beekeeper_wallet):
-                continue
-
-            if retry_until_success(
-                ensure_accounts_exists,
-                fail_message=f"Node ignored create accounts request of accounts {accounts_range_message}, requesting again...",
-                max_retries=5,
-            ):
-                return
-
-
-def create_accounts(
+        imported = 0
+        batch_size = MULTIPLE_IMPORT_KEYS_BATCH_SIZE
+        while imported < len(accounts):
+            batch = accounts[imported : imported + batch_size]
+            time1 = datetime.now()
+            beekeeper_wallet.import_keys(private_keys=list(batch.private_keys()))
+            time2 = datetime.now()
+            logger.info(f"Import time: {time2-time1}")
+            imported += len(batch)
+            batch_size = get_next_import_keys_batch_size(batch_size, (time2 - time1).total_seconds())
+
+
+def create_accounts(  # noqa: C901, PLR0915
     beekeeper: Beekeeper,
     node: AnyNode,
     beekeeper_wallet_name: str,
     beekeeper_wallet_password: str,
-    number_of_accounts: int,
+    accounts: AccountSet,
     import_keys: bool,
-    name_base: str = "account",
-    *,
-    secret: str = "secret",
-) -> list[Account]:
-    def run_in_thread_pool_executor(
-        predicate: Callable[..., Any],
-        iterable_args: list[Any],
-        packed_beekeeper: PackedSyncBeekeeper,
-        node_address: HttpUrl,
-        beekeeper_wallet_name: str,
-        beekeeper_wallet_password: str,
-        *,
-        max_threads: int = (os.cpu_count() or 24),
-    ) -> None:
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_threads) as executor:
-            futures: list[concurrent.futures.Future[Any]] = []
-            for args in iterable_args:
-                futures.append(
-                    executor.submit(
-                        predicate,
-                        args,
-                        packed_beekeeper,
-                        node_address,
-                        beekeeper_wallet_name,
-                        beekeeper_wallet_password,
-                    )
-                )
-
-            start = time.perf_counter()
-            while (
-                len((tasks := concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED))[0]) > 0
-            ):
-                task = tasks[0].pop()
-                futures.pop(futures.index(task))
-                logger.debug(f"Joined next item after {(time.perf_counter() - start) :.4f} seconds...")
-                start = time.perf_counter()
-
-                if (exc := task.exception()) is not None:
-                    logger.error(f"got {exc=}")
-                    raise exc
-
-    def split(
-        collection: list[Any], items_per_chunk: int, *, predicate: Callable[[Any], Any] = lambda x: x
-    ) -> list[Any]:
-        return [
-            [predicate(item) for item in collection[i : i + items_per_chunk]]
-            for i in range(0, len(collection), items_per_chunk)
-        ]
-
-    packed_beekeeper = beekeeper.pack()
-
-    accounts = Account.create_multiple(number_of_accounts, name_base, secret=secret)
-    run_in_thread_pool_executor(
-        send_transaction,
-        split(accounts, ACCOUNT_PER_TRANSACTION, predicate=lambda x: x.safe()),
-        packed_beekeeper,
-        node.http_endpoint,
-        beekeeper_wallet_name,
-        beekeeper_wallet_password,
-    )
-
-    with beekeeper.create_session() as session:
-        beekeeper_wallet = session.open_wallet(name=beekeeper_wallet_name)
-        beekeeper_wallet = beekeeper_wallet.unlock(beekeeper_wallet_password)
-        if import_keys:
-            keys: list[str] = []
-            for account in accounts:
-                keys.append(str(account.private_key))
-
-            num_keys = len(keys)
+) -> None:
+    """
+    Creates accounts in pipeline, in which all stages run at the same time.
+
+    Stages are:
+    - fetching of transaction template (reference block, fee, chain id) -- at most once per block interval,
+    - signing and non-blocking broadcasting of transactions -- by long-lived worker processes (see `SigningWorker`),
+    - confirming inclusion of transactions by scanning new blocks -- transactions which expired without inclusion or
+      which were rejected are sent again,
+    - importing keys of accounts to beekeeper -- in separate thread, as it doesn't depend on accounts being created.
+
+    Number of accounts per transaction and number of transactions in flight are tuned during creation, based on
+    broadcast latency, rejections and block fullness (see `AdaptiveBatchSizing`).
+    """
+
+    def describe(chunk: AccountSet) -> str:
+        return f"{chunk[0].name}..{chunk[-1].name}"
+
+    def was_created(chunk: AccountSet) -> bool:
+        first_account_name = next(chunk.names())
+        return first_account_name in node.api.wallet_bridge.list_accounts(first_account_name, 1)
+
+    max_workers = min(os.cpu_count() or 24, math.ceil(len(accounts) / ACCOUNT_PER_TRANSACTION))
+    batching = AdaptiveBatchSizing(max_in_flight=2 * max_workers)
+    templates = TransactionTemplateProvider(node)
+    tracker = InclusionTracker(node)
+    next_account_index = 0
+    queued: deque[AccountSet] = deque()  # accounts to send again
+    retries: dict[str, int] = {}
+
+    def has_accounts_to_send() -> bool:
+        return bool(queued) or next_account_index < len(accounts)
+
+    def take_accounts_to_send() -> AccountSet:
+        nonlocal next_account_index
+        if queued:
+            return queued.popleft()
+        chunk = accounts[next_account_index : next_account_index + batching.accounts_per_transaction]
+        next_account_index += len(chunk)
+        return chunk
+
+    def resend(chunk: AccountSet, reason: str) -> None:
+        first_account_name = next(chunk.names())
+        retries[first_account_name] = retries.get(first_account_name, 0) + 1
+        if retries[first_account_name] > MAX_NUMBER_OF_RETRIES:
+            raise RuntimeError(f"Failed to create accounts {describe(chunk)}: {reason}")
+        logger.error(f"{reason}, requesting accounts {describe(chunk)} again...")
+
+        if batching.on_rejection(reason, len(chunk)) and len(chunk) > 1:
+            queued.extend(chunk.chunks(math.ceil(len(chunk) / 2)))
+        else:
+            queued.append(chunk)
+
+    with (
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as importing_executor,
+        # Workers are spawned, because forking of multithreaded process (importing keys meanwhile) is unsafe.
+        concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=SigningWorker.initialize,
+            initargs=(
+                beekeeper.pack(),
+                node.http_endpoint,
+                beekeeper_wallet_name,
+                beekeeper_wallet_password,
+                templates.chain_id,
+            ),
+        ) as executor,
+    ):
+        importing = (
+            importing_executor.submit(
+                import_keys_of, accounts, beekeeper, beekeeper_wallet_name, beekeeper_wallet_password
+            )
+            if import_keys
+            else None
+        )
 
-            for i in range(0, num_keys, MULTIPLE_IMPORT_KEYS_BATCH_SIZE):
-                batch_keys = keys[i : i + MULTIPLE_IMPORT_KEYS_BATCH_SIZE]
-                time1 = datetime.now()
-                beekeeper_wallet.import_keys(private_keys=batch_keys)
-                time2 = datetime.now()
-                logger.info(f"Import time: {time2-time1}")
+        in_progress: dict[concurrent.futures.Future[str], tuple[AccountSet, TransactionTemplate, float]] = {}
+        next_scan_time = time.monotonic()
+        while has_accounts_to_send() or in_progress or len(tracker) > 0:
+            # Transactions waiting for inclusion are also in flight, as they load node the same way.
+            while has_accounts_to_send() and len(in_progress) + len(tracker) < batching.max_in_flight:
+                chunk = take_accounts_to_send()
+                template = templates.get()
+                future = executor.submit(SigningWorker.sign_and_broadcast, chunk, template)
+                in_progress[future] = (chunk, template, time.perf_counter())
+
+            timeout = max(next_scan_time - time.monotonic(), 0.0)
+            if not in_progress:
+                time.sleep(timeout)
+            done, _ = concurrent.futures.wait(
+                in_progress, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                chunk, template, submission_time = in_progress.pop(future)
+                if (exception := future.exception()) is None:
+                    batching.on_broadcast(time.perf_counter() - submission_time)
+                    tracker.track(future.result(), chunk, template.expiration)
+                elif was_created(chunk):  # e.g. response was lost, but transaction reached node
+                    logger.debug(f"Accounts created: {describe(chunk)}")
+                else:
+                    resend(chunk, f"Failed to send transaction ({exception})")
+
+            # Blocks are scanned once per block interval, not after each broadcast transaction.
+            if time.monotonic() >= next_scan_time:
+                next_scan_time = time.monotonic() + BLOCK_INTERVAL
+                for chunk in tracker.scan():
+                    if not was_created(chunk):
+                        resend(chunk, "Node ignored create accounts request")
+                batching.on_blocks_scanned(
+                    number_of_included=tracker.number_of_included_by_last_scan,
+                    number_of_overdue=tracker.number_of_overdue,
+                )
 
-    return accounts
+        logger.info(
+            f"Accounts created with {batching.accounts_per_transaction} accounts per transaction and "
+            f"{batching.max_in_flight} transactions in flight at the end"
+        )
+        if importing is not None:
+            importing.result()
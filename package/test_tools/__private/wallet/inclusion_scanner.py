@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, Generic, TypeAlias, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
+    from test_tools.__private.node import Node
+    from test_tools.__private.remote_node import RemoteNode
+
+    AnyNode: TypeAlias = Node | RemoteNode
+
+BLOCK_INTERVAL: Final[float] = 3.0
+MAX_BLOCKS_IN_SINGLE_SCAN: Final[int] = 1000  # limit of block_api.get_block_range
+
+T = TypeVar("T")
+
+
+class InclusionScanner(Generic[T]):
+    """
+    Transactions waiting for inclusion, confirmed all at once by scanning blocks produced since previous scan.
+
+    Each scan needs one call for head block and one call per up to 1000 new blocks, regardless of number of waiting
+    transactions. Scanner doesn't call node by itself, so it's shared by trackers for code with and without event loop
+    (see `scan` for sequence of calls made during single scan).
+
+    Data of waiting transaction (e.g. future resolved with its position in block) is stored as value of type `T`.
+    """
+
+    def __init__(self, *, next_block_number: int | None = None, remember_included: bool = False) -> None:
+        """
+        Creates scanner without waiting transactions.
+
+        :param next_block_number: First block to scan. When not set, it's taken from first added transaction.
+        :param remember_included: If set, transactions included in scanned blocks aren't added later, so they can be
+            added after being broadcast (and possibly included).
+        """
+        self.__pending: dict[str, tuple[datetime, T]] = {}
+        self.__next_block_number = next_block_number
+        self.__included: set[str] | None = set() if remember_included else None
+
+    @property
+    def next_block_number(self) -> int | None:
+        return self.__next_block_number
+
+    def add(self, transaction_id: str, expiration: datetime, value: T, *, head_block_number: int | None = None) -> None:
+        """
+        Starts waiting for transaction.
+
+        :param head_block_number: Number of head block known before transaction was broadcast (e.g. its TaPoS block).
+            Blocks from the next one are scanned, unless scanning started earlier. Required for first transaction,
+            when first block to scan is not known yet.
+        """
+        if self.__included is not None and transaction_id in self.__included:
+            return
+        if self.__next_block_number is None:
+            assert head_block_number is not None, "First block to scan is unknown"
+            self.__next_block_number = head_block_number + 1
+        self.__pending[transaction_id] = (expiration, value)
+
+    def remove(self, transaction_id: str) -> T | None:
+        """Stops waiting for transaction and returns its value (None, when transaction wasn't waiting)."""
+        entry = self.__pending.pop(transaction_id, None)
+        return None if entry is None else entry[1]
+
+    def remove_all(self) -> list[T]:
+        """Stops waiting for all transactions and forgets scanned blocks, so next added transaction starts scanning."""
+        values = [value for _, value in self.__pending.values()]
+        self.__pending.clear()
+        self.__next_block_number = None
+        return values
+
+    def get_block_range_to_scan(self, head_block_number: int) -> tuple[int, int] | None:
+        """Returns `starting_block_num` and `count` of next `get_block_range` call or None, if head block is scanned."""
+        if self.__next_block_number is None or self.__next_block_number > head_block_number:
+            return None
+        return self.__next_block_number, min(
+            MAX_BLOCKS_IN_SINGLE_SCAN, head_block_number - self.__next_block_number + 1
+        )
+
+    def add_scanned_blocks(self, blocks: Sequence[Any]) -> list[tuple[T, int, int]]:
+        """
+        Stops waiting for transactions included in blocks returned by `get_block_range`.
+
+        :return: Values of included transactions with number of block including transaction and its position there.
+        """
+        assert self.__next_block_number is not None, "Blocks to scan are unknown"
+        included = []
+        for block_number, block in enumerate(blocks, start=self.__next_block_number):
+            for transaction_number, transaction_id in enumerate(map(str, block.transaction_ids)):
+                if self.__included is not None:
+                    self.__included.add(transaction_id)
+                if (entry := self.__pending.pop(transaction_id, None)) is not None:
+                    included.append((entry[1], block_number, transaction_number))
+        self.__next_block_number += len(blocks)
+        return included
+
+    def pop_expired(self, head_block_time: datetime) -> list[tuple[str, datetime, T]]:
+        """
+        Stops waiting for transactions, which expired, and returns their ids, expiration times and values.
+
+        Transaction can't be included in block newer than its expiration, so it won't be included anymore, when head
+        block is scanned.
+        """
+        expired = [
+            transaction_id
+            for transaction_id, (expiration, _) in self.__pending.items()
+            if expiration <= head_block_time
+        ]
+        return [(transaction_id, *self.__pending.pop(transaction_id)) for transaction_id in expired]
+
+    def scan(self, node: AnyNode) -> tuple[list[tuple[T, int, int]], list[tuple[str, datetime, T]]]:
+        """Scans new blocks of synchronous node. Returns included transactions and expired ones (see methods above)."""
+        gdpo = node.api.database.get_dynamic_global_properties()
+        included = []
+        while (block_range := self.get_block_range_to_scan(gdpo.head_block_number)) is not None:
+            blocks = node.api.block.get_block_range(starting_block_num=block_range[0], count=block_range[1]).blocks
+            if not blocks:
+                break
+            included.extend(self.add_scanned_blocks(blocks))
+        return included, self.pop_expired(gdpo.time)
+
+    def values(self) -> list[T]:
+        return [value for _, value in self.__pending.values()]
+
+    def __len__(self) -> int:
+        return len(self.__pending)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from functools import cache
+from typing import TYPE_CHECKING, Final
+
+from test_tools.__private.wax_wrapper import calculate_public_key
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Parameters of secp256k1 curve
+P: Final[int] = 2**256 - 2**32 - 977
+N: Final[int] = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+G: Final[tuple[int, int]] = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+WINDOW_BITS: Final[int] = 8
+BASE58_ALPHABET: Final[str] = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+JacobianPoint = tuple[int, int, int]  # (0, 0, 0) is point at infinity
+
+
+class LocalSigner:
+    """
+    Signs digests in process, with private keys held in memory, instead of sending request to beekeeper for each key.
+
+    Intended for load tests with known (e.g. generated dev) keys. Signing isn't constant-time, so it mustn't be used
+    with keys, which need protection. Signatures are compact, recoverable and canonical, the same as ones made by
+    beekeeper (but with different nonces, so they are not identical).
+    """
+
+    def __init__(self, private_keys: Iterable[str] = ()) -> None:
+        self.__keys: dict[str, int] = {}
+        self.import_keys(private_keys)
+
+    def __contains__(self, public_key: object) -> bool:
+        return str(public_key) in self.__keys
+
+    @property
+    def public_keys(self) -> set[str]:
+        return set(self.__keys)
+
+    def import_keys(self, private_keys: Iterable[str]) -> list[str]:
+        """Imports keys given in WIF format and returns their public keys."""
+        public_keys = []
+        for wif in private_keys:
+            public_key = calculate_public_key(wif)
+            self.__keys[public_key] = decode_wif(wif)
+            public_keys.append(public_key)
+        return public_keys
+
+    def sign_digest(self, sig_digest: str, key: str) -> str:
+        """Signs hex encoded digest with private key corresponding to given public key."""
+        return sign_digest(bytes.fromhex(sig_digest), self.__keys[str(key)]).hex()
+
+
+def decode_wif(wif: str) -> int:
+    data = 0
+    for character in wif:
+        data = data * 58 + BASE58_ALPHABET.index(character)
+    decoded = data.to_bytes(37, "big")  # version byte, 32 bytes of key and 4 bytes of checksum
+    payload, checksum = decoded[:-4], decoded[-4:]
+    if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum or payload[0] != 0x80:  # noqa: PLR2004
+        raise ValueError("Invalid private key in WIF format")
+    return int.from_bytes(payload[1:], "big")
+
+
+def sign_digest(digest: bytes, private_key: int) -> bytes:
+    """Returns 65 bytes long compact signature (recovery header, r, s), which is canonical in Hive's terms."""
+    z = int.from_bytes(digest, "big")
+    for attempt in range(2**16):
+        k = __generate_nonce(digest, private_key, attempt)
+        x, y = __to_affine(__multiply_generator(k))
+        r = x % N
+        if r == 0 or x >= N:  # second case would need other recovery id encoding, so simply next nonce is used
+            continue
+        s = pow(k, -1, N) * (z + r * private_key) % N
+        if s == 0:
+            continue
+
+        recovery_id = y & 1
+        if s > N // 2:  # low S form (BIP 62)
+            s = N - s
+            recovery_id ^= 1
+
+        signature = bytes([27 + 4 + recovery_id]) + r.to_bytes(32, "big") + s.to_bytes(32, "big")
+        if __is_canonical(signature):
+            return signature
+    raise RuntimeError("Couldn't find canonical signature")
+
+
+def __is_canonical(signature: bytes) -> bool:
+    """Same rules as in `fc::ecc::public_key::is_canonical`, used by hived."""
+    return (
+        not signature[1] & 0x80
+        and not (signature[1] == 0 and not signature[2] & 0x80)
+        and not signature[33] & 0x80
+        and not (signature[33] == 0 and not signature[34] & 0x80)
+    )
+
+
+def __generate_nonce(digest: bytes, private_key: int, attempt: int) -> int:
+    """Deterministic nonce derived from private key and digest (like in RFC 6979), different for each attempt."""
+    key = private_key.to_bytes(32, "big")
+    counter = 0
+    while True:
+        data = digest + attempt.to_bytes(4, "big") + counter.to_bytes(4, "big")
+        k = int.from_bytes(hmac.new(key, data, hashlib.sha256).digest(), "big")
+        if 0 < k < N:
+            return k
+        counter += 1
+
+
+def __double(point: JacobianPoint) -> JacobianPoint:
+    x, y, z = point
+    if y == 0:
+        return 0, 0, 0
+    y_squared = y * y % P
+    s = 4 * x * y_squared % P
+    m = 3 * x * x % P
+    new_x = (m * m - 2 * s) % P
+    return new_x, (m * (s - new_x) - 8 * y_squared * y_squared) % P, 2 * y * z % P
+
+
+def __add_affine(point: JacobianPoint, other: tuple[int, int]) -> JacobianPoint:
+    """Adds affine point to point in Jacobian coordinates (mixed addition)."""
+    x, y, z = point
+    if z == 0:
+        return other[0], other[1], 1
+    z_squared = z * z % P
+    u = other[0] * z_squared % P
+    s = other[1] * z_squared * z % P
+    h = (u - x) % P
+    r = (s - y) % P
+    if h == 0:
+        return __double(point) if r == 0 else (0, 0, 0)
+    h_squared = h * h % P
+    h_cubed = h * h_squared % P
+    v = x * h_squared % P
+    new_x = (r * r - h_cubed - 2 * v) % P
+    return new_x, (r * (v - new_x) - y * h_cubed) % P, z * h % P
+
+
+def __to_affine(point: JacobianPoint) -> tuple[int, int]:
+    x, y, z = point
+    z_inverse = pow(z, -1, P)
+    z_inverse_squared = z_inverse * z_inverse % P
+    return x * z_inverse_squared % P, y * z_inverse_squared * z_inverse % P
+
+
+@cache
+def __get_generator_table() -> list[list[tuple[int, int]]]:
+    """Returns `table[window][digit] = digit * 2^(WINDOW_BITS * window) * G`, so `k * G` needs only additions."""
+    table = []
+    base: JacobianPoint = (G[0], G[1], 1)
+    for _ in range(256 // WINDOW_BITS):
+        row = [(0, 0)]
+        point: JacobianPoint = (0, 0, 0)
+        base_affine = __to_affine(base)
+        for _ in range(1, 2**WINDOW_BITS):
+            point = __add_affine(point, base_affine)
+            row.append(__to_affine(point))
+        table.append(row)
+        for _ in range(WINDOW_BITS):
+            base = __double(base)
+    return table
+
+
+def __multiply_generator(scalar: int) -> JacobianPoint:
+    table = __get_generator_table()
+    result: JacobianPoint = (0, 0, 0)
+    mask = 2**WINDOW_BITS - 1
+    for window in range(256 // WINDOW_BITS):
+        digit = (scalar >> (window * WINDOW_BITS)) & mask
+        if digit != 0:
+            result = __add_affine(result, table[window][digit])
+    return result
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, ClassVar, Final, TypeAlias
+
+from test_tools.__private.wallet.inclusion_scanner import BLOCK_INTERVAL
+from test_tools.__private.wax_wrapper import get_tapos_data
+
+if TYPE_CHECKING:
+    from schemas.fields.hive_datetime import HiveDateTime
+    from test_tools.__private.node import Node
+    from test_tools.__private.remote_node import RemoteNode
+
+    AnyNode: TypeAlias = Node | RemoteNode
+
+NODE_NOT_READY_DATETIME: Final[datetime] = datetime(
+    year=2016, month=1, day=1, hour=0, minute=0, second=0, tzinfo=timezone.utc
+)
+
+
+@dataclass(frozen=True)
+class TaposReference:
+    """Reference to head block, used by transactions for TaPoS (transactions as proof of stake)."""
+
+    ref_block_num: int
+    ref_block_prefix: int
+    head_block_number: int
+    head_block_time: HiveDateTime
+
+
+class TaposProvider:
+    """
+    Provides reference to head block for transactions, fetched from node at most once per block interval.
+
+    Single provider is shared by all wallets attached to the same node (see `for_node`), so building many transactions
+    in one block interval needs single `get_dynamic_global_properties` call, instead of one per transaction. Reference
+    is refetched earlier, when node is restarted or `refresh` is requested.
+
+    Reference can be up to one block interval old, so transactions built with it expire up to one block interval
+    earlier, than when head block is fetched for each of them. Cached reference doesn't follow blocks generated with
+    debug apis or time shifts, so it's used only when many transactions are built at once, and single transactions
+    are built with `refresh` requested.
+    """
+
+    __providers: ClassVar[weakref.WeakKeyDictionary[AnyNode, TaposProvider]] = weakref.WeakKeyDictionary()
+    __providers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, node: AnyNode) -> None:
+        self.__node = node
+        # With time acceleration blocks are produced more often, so reference gets outdated faster.
+        self.__refresh_interval = BLOCK_INTERVAL / getattr(node, "_time_speedup_rate", 1.0)
+        self.__reference: TaposReference | None = None
+        self.__fetch_time = 0.0
+        self.__run_id: int | None = None
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def for_node(cls, node: AnyNode) -> TaposProvider:
+        """Returns provider shared by all users of given node."""
+        with cls.__providers_lock:
+            if (provider := cls.__providers.get(node)) is None:
+                provider = cls.__providers[node] = cls(node)
+            return provider
+
+    def get(self, *, refresh: bool = False) -> TaposReference:
+        """
+        Returns reference to head block.
+
+        :param refresh: If set, reference is fetched from node, even if cached one is recent enough.
+        """
+        with self.__lock:
+            run_id = self.__node.get_run_id()
+            if (
+                refresh
+                or self.__reference is None
+                or self.__run_id != run_id
+                or time.monotonic() - self.__fetch_time >= self.__refresh_interval
+            ):
+                self.__reference = self.__fetch()
+                self.__fetch_time = time.monotonic()
+                self.__run_id = run_id
+            return self.__reference
+
+    def __fetch(self) -> TaposReference:
+        gdpo = self.__node.api.database.get_dynamic_global_properties()
+        while gdpo.time == NODE_NOT_READY_DATETIME:
+            self.__node.wait_number_of_blocks(1)
+            gdpo = self.__node.api.database.get_dynamic_global_properties()
+
+        tapos_data = get_tapos_data(gdpo.head_block_id)
+        assert tapos_data.ref_block_num >= 0, f"ref_block_num value `{tapos_data.ref_block_num}` is invalid`"
+
+        return TaposReference(
+            ref_block_num=tapos_data.ref_block_num,
+            ref_block_prefix=tapos_data.ref_block_prefix,
+            head_block_number=gdpo.head_block_number,
+            head_block_time=gdpo.time,
+        )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, TypeAlias
+
+from test_tools.__private import exceptions
+from test_tools.__private.wallet.inclusion_scanner import BLOCK_INTERVAL, InclusionScanner
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from test_tools.__private.node import Node
+    from test_tools.__private.remote_node import RemoteNode
+
+    AnyNode: TypeAlias = Node | RemoteNode
+
+
+class ThreadedInclusionWatcher:
+    """
+    Waits for inclusion of many transactions at once, with single thread scanning new blocks once per block interval.
+
+    Counterpart of `InclusionWatcher` for code without event loop, used by `Wallet` for transactions broadcast without
+    waiting. Each scan needs one call for head block and one call per up to 1000 new blocks, regardless of number of
+    watched transactions (see `InclusionScanner`), instead of `broadcast_transaction_synchronous` call holding thread for
+    each transaction. Thread runs only when there are watched transactions.
+    """
+
+    def __init__(self, node: AnyNode, *, scan_interval: float | None = None) -> None:
+        self.__node = node
+        # With time acceleration blocks are produced more often, so they are scanned more often too.
+        self.__scan_interval = (
+            scan_interval if scan_interval is not None else BLOCK_INTERVAL / getattr(node, "_time_speedup_rate", 1.0)
+        )
+        self.__scanner: InclusionScanner[Future[tuple[int, int]]] = InclusionScanner()
+        self.__thread: threading.Thread | None = None
+        self.__closed = threading.Event()
+        self.__lock = threading.Lock()
+
+    def watch(self, transaction_id: str, expiration: datetime, *, head_block_number: int) -> Future[tuple[int, int]]:
+        """
+        Starts waiting for transaction. Must be called before it is broadcast, so it can't be missed in scanned blocks.
+
+        :param head_block_number: Number of head block known before transaction was broadcast (e.g. its TaPoS block).
+        :return: Future resolved with number of block including transaction and its position in this block. Raises
+            `TransactionExpiredError` when transaction expires before being included.
+        """
+        future: Future[tuple[int, int]] = Future()
+        with self.__lock:
+            self.__scanner.add(transaction_id, expiration, future, head_block_number=head_block_number)
+            if self.__thread is None:
+                self.__closed.clear()
+                self.__thread = threading.Thread(target=self.__run, name="InclusionWatcher", daemon=True)
+                self.__thread.start()
+        return future
+
+    def forget(self, transaction_id: str) -> None:
+        """Stops waiting for transaction, e.g. when its broadcast failed."""
+        with self.__lock:
+            future = self.__scanner.remove(transaction_id)
+        if future is not None:
+            future.cancel()
+
+    def close(self) -> None:
+        with self.__lock:
+            thread = self.__thread
+            self.__closed.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self.__lock:
+            pending = self.__scanner.remove_all()
+        for future in pending:
+            future.cancel()
+
+    def __len__(self) -> int:
+        return len(self.__scanner)
+
+    def __run(self) -> None:
+        try:
+            while not self.__closed.wait(self.__scan_interval):
+                self.__scan()
+                with self.__lock:
+                    if len(self.__scanner) == 0:
+                        self.__stop()
+                        return
+        except Exception as error:  # noqa: BLE001
+            with self.__lock:
+                pending = self.__scanner.remove_all()
+                self.__stop()
+            for future in pending:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            with self.__lock:
+                self.__stop()
+
+    def __stop(self) -> None:
+        """
+        Marks thread as finished, so next watched transaction starts new one. Must be called with lock held.
+
+        Transactions still watched (when watcher is closed) are left to be cancelled by `close`.
+        """
+        self.__thread = None
+        if len(self.__scanner) == 0:
+            self.__scanner.remove_all()  # scanning starts again from head block of next watched transaction
+
+    def __scan(self) -> None:
+        # Node is called without lock held, so transactions can be watched meanwhile.
+        gdpo = self.__node.api.database.get_dynamic_global_properties()
+        resolved: list[tuple[Future[tuple[int, int]], tuple[int, int] | Exception]] = []
+        while True:
+            with self.__lock:
+                block_range = self.__scanner.get_block_range_to_scan(gdpo.head_block_number)
+            if block_range is None:
+                break
+            blocks = self.__node.api.block.get_block_range(
+                starting_block_num=block_range[0], count=block_range[1]
+            ).blocks
+            if not blocks:
+                break
+            with self.__lock:
+                included = self.__scanner.add_scanned_blocks(blocks)
+            resolved.extend(
+                (future, (block_number, transaction_number)) for future, block_number, transaction_number in included
+            )
+
+        with self.__lock:
+            for transaction_id, expiration, future in self.__scanner.pop_expired(gdpo.time):
+                error = exceptions.TransactionExpiredError(f"Transaction {transaction_id} expired at {expiration}")
+                resolved.append((future, error))
+
+        # Futures are resolved outside of lock, as their callbacks may watch other transactions.
+        for future, result in resolved:
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
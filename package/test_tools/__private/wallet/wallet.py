@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import concurrent.futures
+import os
 import shutil
 import warnings
-from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Final, get_args
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final, get_args, overload
 
 from beekeepy import Beekeeper
 from beekeepy.communication import StrictOverseer
@@ -13,22 +16,29 @@ from beekeepy.settings import InterfaceSettings as Settings
 from schemas.fields.basic import PublicKey
 from schemas.fields.hex import Hex
 from schemas.fields.hive_int import HiveInt
+from schemas.operations.account_create_operation import AccountCreateOperation
 from test_tools.__private import exceptions
 from test_tools.__private.account import Account
+from test_tools.__private.account_set import AccountSet
 from test_tools.__private.node import Node
 from test_tools.__private.remote_node import RemoteNode
 from test_tools.__private.scope import ScopedObject, context
 from test_tools.__private.user_handles.implementation import Implementation as UserHandleImplementation
+from test_tools.__private.wallet.authority_cache import AuthorityCache
 from test_tools.__private.wallet.constants import (
     DEFAULT_PASSWORD,
     AuthorityType,
+    SignerTypes,
     SimpleTransaction,
     TransactionSerializationTypes,
     WalletResponse,
     WalletResponseBase,
 )
-from test_tools.__private.wallet.create_accounts import create_accounts
+from test_tools.__private.wallet.create_accounts import create_accounts, get_authority
+from test_tools.__private.wallet.local_signer import LocalSigner
 from test_tools.__private.wallet.single_transaction_context import SingleTransactionContext
+from test_tools.__private.wallet.tapos_provider import NODE_NOT_READY_DATETIME, TaposProvider
+from test_tools.__private.wallet.threaded_inclusion_watcher import ThreadedInclusionWatcher
 from test_tools.__private.wallet.wallet_api import Api
 from test_tools.__private.wax_wrapper import (
     calculate_legacy_sig_digest,
@@ -37,7 +47,6 @@ from test_tools.__private.wax_wrapper import (
     calculate_transaction_id,
     collect_signing_keys,
     get_hive_protocol_config,
-    get_tapos_data,
     minimize_required_signatures,
     to_wax_authorities,
     validate_transaction,
@@ -46,20 +55,31 @@ from test_tools.__private.wax_wrapper import (
 from wax.helpy import Hf26Asset as Asset
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
     from pathlib import Path
 
     from beekeepy import Session, UnlockedWallet
 
     from schemas.operations import Hf26Operations
     from test_tools.__private.user_handles.handles.wallet_handle import WalletHandle
+    from test_tools.__private.wallet.tapos_provider import TaposReference
 
     AnyNode = Node | RemoteNode
 
 
+@dataclass(frozen=True)
+class _NodeRunInfo:
+    """Data, which doesn't change until connected node is restarted, so it's fetched once per node run."""
+
+    run_id: int
+    chain_id: Hex
+    node_type: str
+    protocol_config: dict[str, str]
+
+
 class Wallet(UserHandleImplementation, ScopedObject):
-    NODE_NOT_READY_DATETIME: Final[datetime] = datetime(
-        year=2016, month=1, day=1, hour=0, minute=0, second=0, tzinfo=timezone.utc
-    )
+    NODE_NOT_READY_DATETIME: Final[datetime] = NODE_NOT_READY_DATETIME
 
     def __init__(
         self,
@@ -68,6 +88,8 @@ class Wallet(UserHandleImplementation, ScopedObject):
         preconfigure: bool = True,
         chain_id: str = "default",
         transaction_serialization: TransactionSerializationTypes = "hf26",
+        signer: SignerTypes = "beekeeper",
+        validate_transactions: bool = True,
         handle: WalletHandle | None = None,
     ):
         super().__init__(handle=handle)
@@ -79,10 +101,19 @@ class Wallet(UserHandleImplementation, ScopedObject):
         assert self._transaction_serialization in get_args(
             TransactionSerializationTypes
         ), "Invalid transaction_serialization parameter value"
+        assert signer in get_args(SignerTypes), "Invalid signer parameter value"
+        # Keys are still imported to beekeeper, but transactions are signed in process, without request per signature.
+        self._local_signer: LocalSigner | None = LocalSigner() if signer == "local" else None
+        # Transactions are validated by node anyway, so local validation can be skipped to save time under load.
+        self._validate_transactions = validate_transactions
         self._use_authority: dict[str, AuthorityType] = {}
         self.__beekeeper: Beekeeper | None = None
         self.__beekeeper_session: Session | None = None
         self._beekeeper_wallet: UnlockedWallet | None = None
+        self.__keys_imported_before_run: set[str] = set()
+        self.__node_run_info: _NodeRunInfo | None = None
+        self._authority_cache = AuthorityCache()
+        self.__inclusion_watcher: ThreadedInclusionWatcher | None = None
         # Adjust transaction expiration based on node's time speedup rate.
         # With time acceleration, transactions expire faster in virtual time,
         # so we need proportionally longer expiration to maintain the same real-time window.
@@ -92,10 +123,9 @@ class Wallet(UserHandleImplementation, ScopedObject):
         self.__prepare_directory()
         self.run(preconfigure=preconfigure)
         if self.connected_node is not None:
-            node_version = self.connected_node.api.database.get_version().node_type
-            protocol_config = get_hive_protocol_config(self.__get_chain_id())
-
-            is_testnet_wax = protocol_config["IS_TEST_NET"]
+            node_run_info = self.__get_node_run_info()
+            node_version = node_run_info.node_type
+            is_testnet_wax = node_run_info.protocol_config["IS_TEST_NET"]
             if self._transaction_serialization == "legacy":
                 if node_version == "testnet" and is_testnet_wax == "false":
                     warnings.warn(
@@ -114,12 +144,29 @@ class Wallet(UserHandleImplementation, ScopedObject):
         return self.connected_node
 
     def __get_chain_id(self) -> Hex:
-        node_config = self._force_connected_node.api.database.get_config()
+        return self.__get_node_run_info().chain_id
+
+    def __get_node_run_info(self) -> _NodeRunInfo:
+        node = self._force_connected_node
+        run_id = node.get_run_id()
+        if self.__node_run_info is not None and self.__node_run_info.run_id == run_id:
+            return self.__node_run_info
+
         if self.__chain_id != "default":
             assert self.__chain_id.isdigit(), "Invalid chain_id value: it must be a digit string"
-            chain_id = self.__chain_id[:64]
-            return Hex(chain_id.ljust(64, "0"))
-        return node_config.HIVE_CHAIN_ID
+            chain_id = Hex(self.__chain_id[:64].ljust(64, "0"))
+        else:
+            chain_id = node.api.database.get_config().HIVE_CHAIN_ID
+
+        # State of blockchain may be different after restart (e.g. loaded from snapshot).
+        self._authority_cache.clear()
+        self.__node_run_info = _NodeRunInfo(
+            run_id=run_id,
+            chain_id=chain_id,
+            node_type=node.api.database.get_version().node_type,
+            protocol_config=get_hive_protocol_config(chain_id),
+        )
+        return self.__node_run_info
 
     def __prepare_directory(self) -> None:
         self.name: str
@@ -182,10 +229,15 @@ class Wallet(UserHandleImplementation, ScopedObject):
             self._beekeeper_wallet = self.__beekeeper_session.create_wallet(name=self.name, password=DEFAULT_PASSWORD)
             if preconfigure:
                 self._beekeeper_wallet.import_key(private_key=Account("initminer").private_key)
+                if self._local_signer is not None:
+                    self._local_signer.import_keys([Account("initminer").private_key])
         except ErrorInResponseError as exception:
             if f"Wallet with name: '{self.name}' already exists" in exception.error:
                 locked_wallet = self.__beekeeper_session.open_wallet(name=self.name)
                 self._beekeeper_wallet = locked_wallet.unlock(DEFAULT_PASSWORD)
+                if self._local_signer is not None:
+                    # Keys imported before reopening can't be loaded to local signer, so they're still used by beekeeper.
+                    self.__keys_imported_before_run = set(self._beekeeper_wallet.public_keys)
             else:
                 raise
 
@@ -197,12 +249,16 @@ class Wallet(UserHandleImplementation, ScopedObject):
         self.run()
 
     def close(self) -> None:
+        if self.__inclusion_watcher is not None:
+            self.__inclusion_watcher.close()
+            self.__inclusion_watcher = None
         if self.is_running():
             if self.__beekeeper is not None:
                 self.__beekeeper.teardown()
             self.__beekeeper = None
             self.__beekeeper_session = None
             self._beekeeper_wallet = None
+            self.__keys_imported_before_run = set()
 
     def create_account(
         self,
@@ -249,30 +305,66 @@ class Wallet(UserHandleImplementation, ScopedObject):
         self.api.import_key(account.private_key)
         return transaction.get_response()
 
+    @overload
+    def create_accounts(
+        self, number_of_accounts: int, name_base: str = ..., *, secret: str = ..., import_keys: bool = ...
+    ) -> list[Account]: ...
+
+    @overload
     def create_accounts(
-        self, number_of_accounts: int, name_base: str = "account", *, secret: str = "secret", import_keys: bool = True
-    ) -> list[Account]:
+        self, number_of_accounts: AccountSet, name_base: str = ..., *, secret: str = ..., import_keys: bool = ...
+    ) -> AccountSet: ...
+
+    def create_accounts(
+        self,
+        number_of_accounts: int | AccountSet,
+        name_base: str = "account",
+        *,
+        secret: str = "secret",
+        import_keys: bool = True,
+    ) -> list[Account] | AccountSet:
         assert self.__beekeeper is not None, "Beekeeper not exist"
+        if isinstance(number_of_accounts, AccountSet):
+            accounts = number_of_accounts
+        else:
+            accounts = AccountSet.create(number_of_accounts, name_base, secret=secret)
+
         max_num_of_accounts_in_single_transaction = 500
-        if number_of_accounts <= max_num_of_accounts_in_single_transaction:
-            accounts = Account.create_multiple(number_of_accounts, name_base, secret=secret)
+        if len(accounts) <= max_num_of_accounts_in_single_transaction:
+            fee = self._force_connected_node.api.wallet_bridge.get_chain_properties().account_creation_fee
             with self.in_single_transaction():
-                for account in accounts:
-                    self.api.create_account("initminer", account.name, "{}")
+                self.api._send(
+                    [
+                        AccountCreateOperation(
+                            creator="initminer",
+                            new_account_name=name,
+                            json_metadata="{}",
+                            fee=fee,
+                            owner=get_authority(public_key),
+                            active=get_authority(public_key),
+                            posting=get_authority(public_key),
+                            memo_key=public_key,
+                        )
+                        for name, public_key in zip(accounts.names(), accounts.public_keys(), strict=True)
+                    ],
+                    broadcast=None,
+                    blocking=True,
+                )
             if import_keys:
-                self.api.import_keys([account.private_key for account in accounts])
-            return accounts
-
-        return create_accounts(
-            beekeeper=self.__beekeeper,
-            node=self._force_connected_node,
-            beekeeper_wallet_name=self.name,
-            beekeeper_wallet_password=DEFAULT_PASSWORD,
-            number_of_accounts=number_of_accounts,
-            import_keys=import_keys,
-            name_base=name_base,
-            secret=secret,
-        )
+                self.api.import_keys(list(accounts.private_keys()))
+        else:
+            create_accounts(
+                beekeeper=self.__beekeeper,
+                node=self._force_connected_node,
+                beekeeper_wallet_name=self.name,
+                beekeeper_wallet_password=DEFAULT_PASSWORD,
+                accounts=accounts,
+                import_keys=import_keys,
+            )
+            if import_keys and self._local_signer is not None:
+                self._local_signer.import_keys(accounts.private_keys())
+
+        return accounts if isinstance(number_of_accounts, AccountSet) else list(accounts)
 
     def list_accounts(self) -> list[str]:
         next_account = ""
@@ -293,25 +385,15 @@ class Wallet(UserHandleImplementation, ScopedObject):
         self,
         node: AnyNode,
     ) -> SimpleTransaction:
-        gdpo = node.api.database.get_dynamic_global_properties()
-
-        while gdpo.time == self.NODE_NOT_READY_DATETIME:
-            node.wait_number_of_blocks(1)
-            gdpo = node.api.database.get_dynamic_global_properties()
-
-        block_id = gdpo.head_block_id
-
-        # set header
-        tapos_data = get_tapos_data(block_id)
-        ref_block_num = tapos_data.ref_block_num
-        ref_block_prefix = tapos_data.ref_block_prefix
-
-        assert ref_block_num >= 0, f"ref_block_num value `{ref_block_num}` is invalid`"
+        # Head block time changes abruptly e.g. after blocks generated with debug apis, so single transaction is built
+        # with fresh reference, to not expire before being broadcast.
+        return self.__create_transaction(TaposProvider.for_node(node).get(refresh=True))
 
+    def __create_transaction(self, reference: TaposReference) -> SimpleTransaction:
         return SimpleTransaction(
-            ref_block_num=HiveInt(ref_block_num),
-            ref_block_prefix=HiveInt(ref_block_prefix),
-            expiration=gdpo.time + self._transaction_expiration_offset,
+            ref_block_num=HiveInt(reference.ref_block_num),
+            ref_block_prefix=HiveInt(reference.ref_block_prefix),
+            expiration=reference.head_block_time + self._transaction_expiration_offset,
             extensions=[],
             signatures=[],
             operations=[],
@@ -328,23 +410,104 @@ class Wallet(UserHandleImplementation, ScopedObject):
 
         return self.broadcast_transaction(transaction, blocking, broadcast)
 
+    def build_many(
+        self, operations: Iterable[Hf26Operations], *, ops_per_tx: int = 1, max_workers: int | None = None
+    ) -> list[SimpleTransaction]:
+        assert ops_per_tx > 0, "ops_per_tx has to be positive"
+        operations = list(operations)
+        reference = TaposProvider.for_node(self._force_connected_node).get()
+        transactions = []
+        for first_operation in range(0, len(operations), ops_per_tx):
+            transaction = self.__create_transaction(reference)
+            for operation in operations[first_operation : first_operation + ops_per_tx]:
+                transaction.add_operation(operation)
+            transactions.append(transaction)
+
+        # Keys are determined sequentially, as after first transaction of given shape they are taken from cache.
+        sign_keys = [self.__get_sign_keys(transaction, reuse_unconfirmed=True) for transaction in transactions]
+        sig_digests = [self.calculate_sig_digest(transaction) for transaction in transactions]
+        if self._local_signer is not None:
+            # Local signer computes signatures in Python holding GIL, so threads would only add overhead.
+            return list(map(self.sign_transaction, transactions, sig_digests, sign_keys))
+
+        # Beekeeper signs each digest in separate request, so requests are sent concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.sign_transaction, transactions, sig_digests, sign_keys))
+
+    def submit_transaction(self, transaction: SimpleTransaction) -> Future[WalletResponse]:
+        transaction_id = self.__calculate_transaction_id(transaction)
+        if self.__inclusion_watcher is None:
+            self.__inclusion_watcher = ThreadedInclusionWatcher(self._force_connected_node)
+        watcher = self.__inclusion_watcher
+        inclusion = watcher.watch(
+            transaction_id,
+            transaction.expiration,
+            head_block_number=TaposProvider.for_node(self._force_connected_node).get().head_block_number,
+        )
+        try:
+            self.broadcast_transaction(transaction, blocking=False, broadcast=True, transaction_id=transaction_id)
+        except BaseException:
+            watcher.forget(transaction_id)
+            raise
+
+        response: Future[WalletResponse] = concurrent.futures.Future()
+
+        def resolve_response(inclusion: Future[tuple[int, int]]) -> None:
+            if inclusion.cancelled():
+                response.cancel()
+            elif (error := inclusion.exception()) is not None:
+                response.set_exception(error)
+            else:
+                block_num, transaction_num = inclusion.result()
+                response.set_result(
+                    WalletResponse(
+                        transaction_id=transaction_id,
+                        block_num=block_num,
+                        transaction_num=transaction_num,
+                        ref_block_num=transaction.ref_block_num,
+                        ref_block_prefix=transaction.ref_block_prefix,
+                        expiration=transaction.expiration,
+                        extensions=transaction.extensions,
+                        signatures=transaction.signatures,
+                        operations=transaction.operations,
+                    )
+                )
+
+        inclusion.add_done_callback(resolve_response)
+        return response
+
     def broadcast_transaction(
-        self, transaction: SimpleTransaction, blocking: bool, broadcast: bool
+        self, transaction: SimpleTransaction, blocking: bool, broadcast: bool, *, transaction_id: str | None = None
     ) -> WalletResponseBase | WalletResponse:
+        """
+        Broadcasts signed transaction, if `broadcast` is set, and returns response with its id.
+
+        :param transaction_id: Id of transaction, when already calculated, so it isn't calculated again.
+        """
+        if transaction_id is None:
+            transaction_id = self.__calculate_transaction_id(transaction)
+
         if broadcast:
-            if blocking:
-                with self._force_connected_node.restore_settings():
-                    self._force_connected_node.settings.timeout = timedelta(hours=1)
-                    broadcast_response = self._force_connected_node.api.wallet_bridge.broadcast_transaction_synchronous(
-                        transaction
-                    )
+            try:
+                if blocking:
+                    with self._force_connected_node.restore_settings():
+                        self._force_connected_node.settings.timeout = timedelta(hours=1)
+                        broadcast_response = (
+                            self._force_connected_node.api.wallet_bridge.broadcast_transaction_synchronous(transaction)
+                        )
+                else:
+                    self._force_connected_node.api.wallet_bridge.broadcast_transaction(transaction)
+            except ErrorInResponseError:
+                # Keys memoized for transactions of this shape could be wrong, e.g. determined before needed key was
+                # imported or from authorities changed by other wallet, so they are determined again next time.
+                self._authority_cache.forget_signing_keys(transaction)
+                raise
+            self._authority_cache.confirm_signing_keys(transaction)
+            self._authority_cache.observe(transaction)
 
+            if blocking:
                 return WalletResponse(
-                    transaction_id=(
-                        calculate_transaction_id(transaction)
-                        if self._transaction_serialization == "hf26"
-                        else calculate_legacy_transaction_id(transaction)
-                    ),
+                    transaction_id=transaction_id,
                     block_num=broadcast_response.block_num,
                     transaction_num=broadcast_response.trx_num,
                     rc_cost=broadcast_response.rc_cost,
@@ -355,14 +518,9 @@ class Wallet(UserHandleImplementation, ScopedObject):
                     signatures=transaction.signatures,
                     operations=transaction.operations,
                 )
-            self._force_connected_node.api.wallet_bridge.broadcast_transaction(transaction)
 
         return WalletResponseBase(
-            transaction_id=(
-                calculate_transaction_id(transaction)
-                if self._transaction_serialization == "hf26"
-                else calculate_legacy_transaction_id(transaction)
-            ),
+            transaction_id=transaction_id,
             ref_block_num=transaction.ref_block_num,
             ref_block_prefix=transaction.ref_block_prefix,
             expiration=transaction.expiration,
@@ -371,14 +529,32 @@ class Wallet(UserHandleImplementation, ScopedObject):
             operations=transaction.operations,
         )
 
+    def __calculate_transaction_id(self, transaction: SimpleTransaction) -> str:
+        return (
+            calculate_transaction_id(transaction)
+            if self._transaction_serialization == "hf26"
+            else calculate_legacy_transaction_id(transaction)
+        )
+
     def complex_transaction_sign(self, transaction: SimpleTransaction) -> SimpleTransaction:
         sig_digest = self.calculate_sig_digest(transaction)
-        sign_keys, retrived_authorities = self.import_required_keys(transaction)
-        signed_transaction = self.sign_transaction(transaction, sig_digest, sign_keys)
+        return self.sign_transaction(transaction, sig_digest, self.__get_sign_keys(transaction))
+
+    def __get_sign_keys(
+        self, transaction: SimpleTransaction, *, reuse_unconfirmed: bool = False
+    ) -> list[str] | list[Any]:
         if self._use_authority != {}:
-            return signed_transaction
-        reduced_sign_keys = self.reduce_signatures(signed_transaction, sign_keys, retrived_authorities)
-        return self.sign_transaction(transaction, sig_digest, reduced_sign_keys)
+            sign_keys, _ = self.import_required_keys(transaction)
+            return sign_keys
+
+        # Transactions of the same shape (e.g. transfers from the same account) are signed with the same keys, so keys
+        # are determined once and then transaction is signed only once, without any lookups.
+        reduced_sign_keys = self._authority_cache.get_signing_keys(transaction, unconfirmed=reuse_unconfirmed)
+        if reduced_sign_keys is None:
+            sign_keys, retrived_authorities = self.import_required_keys(transaction)
+            reduced_sign_keys = self.reduce_signatures(transaction, sign_keys, retrived_authorities)
+            self._authority_cache.store_signing_keys(transaction, reduced_sign_keys)
+        return reduced_sign_keys
 
     def calculate_sig_digest(self, transaction: SimpleTransaction) -> str:
         chain_id = self.__get_chain_id()
@@ -393,11 +569,15 @@ class Wallet(UserHandleImplementation, ScopedObject):
     ) -> SimpleTransaction:
         assert self._beekeeper_wallet is not None
         for key in keys_to_sign_with:
-            signature = self._beekeeper_wallet.sign_digest(sig_digest=sig_digest, key=key)
+            if self._local_signer is not None and key in self._local_signer:
+                signature = self._local_signer.sign_digest(sig_digest=sig_digest, key=key)
+            else:
+                signature = self._beekeeper_wallet.sign_digest(sig_digest=sig_digest, key=key)
             transaction.signatures.append(signature)
         transaction.signatures = list(set(transaction.signatures))
 
-        validate_transaction(transaction)
+        if self._validate_transactions:
+            validate_transaction(transaction)
         return transaction
 
     def reduce_signatures(
@@ -406,11 +586,14 @@ class Wallet(UserHandleImplementation, ScopedObject):
         keys_to_sign_with: list[PublicKey],
         retrived_authorities: dict[str, wax_authorities],
     ) -> list[str] | list[Any]:
-        def retrieve_witness_key(wittnes_name: str) -> str:
+        def fetch_witness_key(wittnes_name: str) -> str:
             get_witness = self._force_connected_node.api.wallet_bridge.get_witness(wittnes_name)
             assert get_witness is not None
             return get_witness.signing_key
 
+        def retrieve_witness_key(wittnes_name: str) -> str:
+            return self._authority_cache.get_witness_key(wittnes_name, fetch_witness_key)
+
         return minimize_required_signatures(
             transaction, self.__get_chain_id(), keys_to_sign_with, retrived_authorities, retrieve_witness_key
         )
@@ -420,9 +603,12 @@ class Wallet(UserHandleImplementation, ScopedObject):
     ) -> tuple[list[PublicKey], dict[str, wax_authorities]]:
         retrived_authorities: dict[str, wax_authorities] = {}
 
-        def retrieve_authorities(account_names: list[str]) -> dict[str, wax_authorities]:
+        def fetch_authorities(account_names: list[str]) -> dict[str, wax_authorities]:
             accounts = self._force_connected_node.api.wallet_bridge.get_accounts(account_names)
-            retrived_authoritity = {acc.name: to_wax_authorities(acc) for acc in accounts}
+            return {acc.name: to_wax_authorities(acc) for acc in accounts}
+
+        def retrieve_authorities(account_names: list[str]) -> dict[str, wax_authorities]:
+            retrived_authoritity = self._authority_cache.get_authorities(account_names, fetch_authorities)
             retrived_authorities.update(retrived_authoritity)
             return retrived_authoritity
 
@@ -434,8 +620,12 @@ class Wallet(UserHandleImplementation, ScopedObject):
             return [
                 getattr(authority_account.accounts[0], self._use_authority[account_name]).key_auths[0][0]
             ], retrived_authorities
-        imported_keys_in_beekeeper = set(self.beekeeper_wallet.public_keys)
-        sign_keys = list(set(keys_for_signing) & set(imported_keys_in_beekeeper))
+        imported_keys = (
+            self._local_signer.public_keys | self.__keys_imported_before_run
+            if self._local_signer is not None
+            else set(self.beekeeper_wallet.public_keys)
+        )
+        sign_keys = list(set(keys_for_signing) & imported_keys)
         validated_sign_keys = [PublicKey(key) for key in sign_keys]
         return validated_sign_keys, retrived_authorities
 
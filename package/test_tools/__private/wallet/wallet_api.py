@@ -1648,6 +1648,10 @@ class Api:
         :param only_result: This argument is no longer active and should not be provided.
         :return: The corresponding public key.
         """
+        if self.__wallet._local_signer is not None:
+            self.__wallet._local_signer.import_keys([wif_key])
+        # Keys of transactions signed before could be insufficient without imported key.
+        self.__wallet._authority_cache.clear_signing_keys()
         return self.__wallet.beekeeper_wallet.import_key(private_key=wif_key)
 
     @require_unlocked_wallet
@@ -1659,6 +1663,10 @@ class Api:
         :param wif_keys: A list of WIF-formatted private keys to import.
         :param only_result: This argument is no longer active and should not be provided.
         """
+        if self.__wallet._local_signer is not None:
+            self.__wallet._local_signer.import_keys(wif_keys)
+        # Keys of transactions signed before could be insufficient without imported key.
+        self.__wallet._authority_cache.clear_signing_keys()
         return self.__wallet.beekeeper_wallet.import_keys(private_keys=wif_keys)
 
     @warn_if_only_result_set()
@@ -9,7 +9,6 @@ from schemas.fields.hive_int import HiveInt
 
 # Import wrapped functions from wax public API (handles subclass conversions internally)
 from wax import calculate_legacy_sig_digest as wax_calculate_legacy_sig_digest
-from wax import calculate_public_key as wax_calculate_public_key
 from wax import calculate_sig_digest as wax_calculate_sig_digest
 from wax import create_wax_foundation
 from wax import encode_encrypted_memo as wax_encode_encrypted_memo
@@ -17,16 +16,21 @@ from wax import get_hive_protocol_config as wax_get_hive_protocol_config
 from wax import get_tapos_data as wax_get_tapos_data
 from wax._private.result_tools import (
     expose_result_as_python_string,
+    to_python_string,
     validate_wax_result,
 )
 
 # Import raw functions from cpp_python_bridge (no subclass handling needed for these)
 from wax.cpp_python_bridge import calculate_legacy_transaction_id as wax_calculate_legacy_transaction_id
+from wax.cpp_python_bridge import calculate_public_key as wax_calculate_public_key
 from wax.cpp_python_bridge import calculate_transaction_id as wax_calculate_transaction_id
 from wax.cpp_python_bridge import collect_signing_keys as wax_collect_signing_keys
 from wax.cpp_python_bridge import decode_encrypted_memo as wax_decode_encrypted_memo
+from wax.cpp_python_bridge import deserialize_transaction as wax_deserialize_transaction
 from wax.cpp_python_bridge import generate_password_based_private_key as wax_generate_password_based_private_key
+from wax.cpp_python_bridge import get_public_key_from_signature as wax_get_public_key_from_signature
 from wax.cpp_python_bridge import minimize_required_signatures as wax_minimize_required_signatures
+from wax.cpp_python_bridge import serialize_transaction as wax_serialize_transaction
 from wax.cpp_python_bridge import validate_transaction as wax_validate_transaction
 from wax.wax_result import (
     python_authorities,
@@ -35,7 +39,7 @@ from wax.wax_result import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from schemas.apis.wallet_bridge_api.fundaments_of_responses import Account as AccountSchema
     from schemas.fields.assets._base import AssetHbd
@@ -108,7 +112,7 @@ def to_wax_authorities(account_authorities: AccountSchema) -> wax_authorities:
 
 
 def calculate_public_key(wif: str) -> str:
-    result = wax_calculate_public_key(wif)
+    result = wax_calculate_public_key(wif.encode())
     validate_wax_result(result)
     return expose_result_as_python_string(result)
 
@@ -117,6 +121,58 @@ def get_tapos_data(head_block_id: str) -> python_ref_block_data:
     return wax_get_tapos_data(head_block_id)
 
 
+def get_public_key_from_signature(sig_digest: str, signature: str) -> str:
+    result = wax_get_public_key_from_signature(sig_digest.encode(), signature.encode())
+    validate_wax_result(result)
+    return expose_result_as_python_string(result)
+
+
+def serialize_transaction(transaction_json: str) -> str:
+    """
+    Serialize the given transaction (in hf26 json form) to its binary form.
+
+    Args:
+    ----
+    transaction_json: The transaction to serialize.
+
+    Returns:
+    -------
+    The serialized transaction as hex string.
+
+    Raises:
+    ------
+    WaxValidationError: If the transaction could not be serialized.
+
+    """
+    result = wax_serialize_transaction(transaction_json.encode())
+    validate_wax_result(result)
+    return expose_result_as_python_string(result)
+
+
+def deserialize_transaction(serialized_transaction: str) -> str:
+    """
+    Deserialize the given binary transaction to its hf26 json form.
+
+    Trailing bytes after the transaction are ignored, so it can be used to read transactions one by one from a buffer.
+
+    Args:
+    ----
+    serialized_transaction: The transaction to deserialize as hex string.
+
+    Returns:
+    -------
+    The deserialized transaction as json string.
+
+    Raises:
+    ------
+    WaxValidationError: If the transaction could not be deserialized.
+
+    """
+    result = wax_deserialize_transaction(serialized_transaction.encode())
+    validate_wax_result(result)
+    return expose_result_as_python_string(result)
+
+
 def validate_transaction(transaction: Transaction) -> None:
     """
     Validate the given transaction.
@@ -317,11 +373,29 @@ def generate_password_based_private_key(account: AccountNameApiType, role: str,
     """Generate a password based private key for the given account and role."""
     wax_result = wax_generate_password_based_private_key(account, role, password)
     return WaxPrivateKeyData(
-        wif_private_key=wax_result.wif_private_key,
-        associated_public_key=wax_result.associated_public_key,
+        wif_private_key=to_python_string(wax_result.wif_private_key),
+        associated_public_key=to_python_string(wax_result.associated_public_key),
     )
 
 
+def generate_dev_keys(secret: str, account_names: Iterable[str]) -> list[WaxPrivateKeyData]:
+    """
+    Generate keys of accounts in the same way as get_dev_key executable does.
+
+    Private key is derived from sha256 of `secret` concatenated with account name, just like password based keys are
+    derived from concatenation of account, role and password, so it is the password based key with empty role.
+
+    Args:
+        secret: Secret common for all accounts.
+        account_names: Names of accounts (ranges like `account-0:10` are not supported).
+
+    Returns:
+        Keys of accounts in order of `account_names`.
+
+    """
+    return [generate_password_based_private_key(secret, "", account_name) for account_name in account_names]
+
+
 def suggest_brain_key() -> IBrainKeyData:
     """Suggest a brain key."""
     wax_base_api = create_wax_foundation()
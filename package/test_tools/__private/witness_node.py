@@ -4,6 +4,7 @@ import warnings
 from typing import TYPE_CHECKING
 
 from test_tools.__private.account import Account
+from test_tools.__private.key_generator import KeyGenerator
 from test_tools.__private.preconfigured_node import PreconfiguredNode
 
 if TYPE_CHECKING:
@@ -37,6 +38,7 @@ class WitnessNode(PreconfiguredNode):
             )
             witnesses = []
 
+        KeyGenerator.generate_keys_for(witnesses)  # keys of all witnesses are generated at once and cached
         for witness in witnesses:
             self.__register_witness(witness)
 
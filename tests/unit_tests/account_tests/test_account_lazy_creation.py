@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 import test_tools as tt
 from test_tools.__private.exceptions import MissingPathToExecutableError
+from test_tools.__private.key_generator import KeyGenerator
 
 # Imported fixture is automatically used, so it's false positive.
 from tests.unit_tests.key_generation_tests.local_tools import (
@@ -19,9 +20,18 @@ def test_if_account_object_can_be_created_without_key_generator() -> None:
     # yet, so missing key generator executable is not a problem.
 
 
-def test_if_serialization_fails_due_to_missing_key_generator_executable() -> None:
+def test_if_keys_are_generated_without_key_generator_executable() -> None:
     account = tt.Account("example")
 
+    # By default keys are derived in process, so missing key generator executable is not a problem.
+    assert str(account.private_key).startswith("5")
+    assert str(account.public_key).startswith("STM")
+
+
+def test_if_serialization_fails_due_to_missing_key_generator_executable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(KeyGenerator, "backend", "get_dev_key")
+    account = tt.Account("example-with-executable")
+
     for key in ["private_key", "public_key"]:
         with pytest.raises(MissingPathToExecutableError):
             str(getattr(account, key))  # Run serialization, but it requires key generator, so should fail
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pickle
+from typing import Final
+
+import pytest
+import test_tools as tt
+
+NUMBER_OF_ACCOUNTS: Final[int] = 10
+CHUNK_SIZE: Final[int] = 4
+
+
+@pytest.fixture
+def accounts() -> tt.AccountSet:
+    return tt.AccountSet.create(NUMBER_OF_ACCOUNTS, "alice")
+
+
+def test_accounts_are_materialized_with_keys(accounts: tt.AccountSet) -> None:
+    expected = tt.Account.create_multiple(NUMBER_OF_ACCOUNTS, "alice")
+
+    assert len(accounts) == NUMBER_OF_ACCOUNTS
+    assert [account.name for account in accounts] == [account.name for account in expected]
+    assert accounts[-1].private_key == expected[-1].private_key
+    assert accounts[-1].public_key == expected[-1].public_key
+    assert list(accounts.private_keys()) == [str(account.private_key) for account in expected]
+
+
+def test_creating_from_accounts() -> None:
+    accounts = tt.AccountSet([tt.Account("alice"), tt.Account("bob")])
+
+    assert list(accounts.names()) == ["alice", "bob"]
+    assert accounts[1].public_key == tt.Account("bob").public_key
+
+
+def test_creating_from_accounts_with_different_secrets() -> None:
+    with pytest.raises(ValueError, match="secret"):
+        tt.AccountSet([tt.Account("alice"), tt.Account("bob", secret="other")])
+
+
+def test_slicing(accounts: tt.AccountSet) -> None:
+    sliced = accounts[2:6]
+
+    assert list(sliced.names()) == [f"alice-{index}" for index in range(2, 6)]
+    assert sliced[-1].name == "alice-5"
+    assert list(sliced[1:].names()) == [f"alice-{index}" for index in range(3, 6)]
+    assert list(accounts[::3].names()) == [f"alice-{index}" for index in range(0, NUMBER_OF_ACCOUNTS, 3)]
+    assert len(accounts[NUMBER_OF_ACCOUNTS:]) == 0
+    with pytest.raises(IndexError):
+        sliced[4]
+
+
+def test_splitting_into_chunks(accounts: tt.AccountSet) -> None:
+    chunks = list(accounts.chunks(CHUNK_SIZE))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert [name for chunk in chunks for name in chunk.names()] == list(accounts.names())
+
+
+def test_pickled_slice_holds_only_its_accounts(accounts: tt.AccountSet) -> None:
+    sliced = accounts[CHUNK_SIZE:]
+
+    unpickled = pickle.loads(pickle.dumps(sliced))
+
+    assert list(unpickled.public_keys()) == list(sliced.public_keys())
+    assert unpickled[0].name == f"alice-{CHUNK_SIZE}"
+    assert unpickled.get_size_in_bytes() < accounts.get_size_in_bytes()
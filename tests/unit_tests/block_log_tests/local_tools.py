@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+from typing import TYPE_CHECKING, Final
+
+import test_tools as tt
+from test_tools.__private.block_log_reader import BLOCK_ID_SIZE
+from test_tools.__private.wax_wrapper import serialize_transaction
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+GENESIS_TIME: Final[int] = 1_700_000_000
+ARTIFACTS_HEADER: Final[bytes] = bytes(64)
+WITNESS_SIGNATURE: Final[bytes] = bytes([32]) + hashlib.sha512(b"signature0").digest()
+TRANSACTION: Final[dict[str, object]] = {
+    "ref_block_num": 1,
+    "ref_block_prefix": 2,
+    "expiration": "2023-11-14T22:13:50",
+    "operations": [
+        {
+            "type": "transfer_operation",
+            "value": {
+                "from": "initminer",
+                "to": "alice",
+                "amount": {"amount": "1000", "precision": 3, "nai": "@@000000021"},
+                "memo": "memo",
+            },
+        }
+    ],
+    "extensions": [],
+    "signatures": [],
+}
+
+
+def serialize_block(block_number: int, previous: bytes, *, number_of_transactions: int) -> tuple[bytes, bytes]:
+    """Returns serialized block and its id."""
+    witness = b"initminer"
+    header = (
+        previous
+        + struct.pack("<I", GENESIS_TIME + block_number * 3)
+        + bytes([len(witness)])
+        + witness
+        + bytes(BLOCK_ID_SIZE)
+        + bytes([0])  # no extensions
+    )
+    signed_header = header + WITNESS_SIGNATURE
+    block_id = block_number.to_bytes(4, "big") + hashlib.sha224(signed_header).digest()[4:BLOCK_ID_SIZE]
+    transactions = bytes.fromhex(serialize_transaction(json.dumps(TRANSACTION))) * number_of_transactions
+    return signed_header + bytes([number_of_transactions]) + transactions, block_id
+
+
+def create_block_log(directory: Path, number_of_blocks: int, *, split: bool = False) -> tt.BlockLog:
+    """
+    Creates uncompressed block log with artifacts, without using hived or block_log_util.
+
+    In split mode parts are written with the same file names as hived does, but block numbers are preserved, so only
+    first part is created for small number of blocks.
+    """
+    block_file = directory / ("block_log_part.0001" if split else "block_log")
+    blocks = bytearray()
+    artifacts = bytearray(ARTIFACTS_HEADER)
+    previous = bytes(BLOCK_ID_SIZE)
+    for block_number in range(1, number_of_blocks + 1):
+        serialized_block, previous = serialize_block(block_number, previous, number_of_transactions=block_number % 3)
+        position = len(blocks)
+        blocks += serialized_block + struct.pack("<Q", position)
+        artifacts += struct.pack("<Q", position) + previous
+
+    block_file.write_bytes(blocks)
+    tt.BlockLog.get_artifacts_file(block_file).write_bytes(artifacts)
+    return tt.BlockLog(directory, "split" if split else "monolithic")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, get_args
+
+import pytest
+from test_tools.__private.utilities.file_copying import CopyStrategy, copy_file_prefix
+
+from tests.unit_tests.block_log_tests.local_tools import create_block_log
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NUMBER_OF_BLOCKS: Final[int] = 10
+
+
+@pytest.mark.parametrize("copy_strategy", get_args(CopyStrategy))
+def test_copying_block_log(tmp_path: Path, copy_strategy: CopyStrategy) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    destination = tmp_path / "copy"
+    destination.mkdir()
+
+    copied = block_log.copy_to(destination, artifacts="required", copy_strategy=copy_strategy)
+
+    for source_file, copied_file in zip(
+        [*block_log.block_files, *block_log.artifact_files], [*copied.block_files, *copied.artifact_files], strict=True
+    ):
+        assert copied_file.read_bytes() == source_file.read_bytes()
+        assert copied_file.samefile(source_file) is (copy_strategy == "hardlink")
+
+
+def test_modification_of_cloned_block_log_does_not_affect_source(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    source_content = block_log.block_files[0].read_bytes()
+    destination = tmp_path / "copy"
+    destination.mkdir()
+
+    copied = block_log.copy_to(destination, copy_strategy="auto")
+    with copied.block_files[0].open("ab") as file:
+        file.write(b"modification")
+
+    assert block_log.block_files[0].read_bytes() == source_content
+
+
+def test_copying_over_hardlinked_block_log_does_not_affect_source(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    source_content = block_log.block_files[0].read_bytes()
+    destination = tmp_path / "copy"
+    destination.mkdir()
+    block_log.copy_to(destination, copy_strategy="hardlink")
+
+    other_directory = tmp_path / "other"
+    other_directory.mkdir()
+    other_block_log = create_block_log(other_directory, NUMBER_OF_BLOCKS * 2)
+    other_block_log.copy_to(destination, copy_strategy="copy")
+
+    assert block_log.block_files[0].read_bytes() == source_content
+
+
+def test_copying_with_unsupported_strategy(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    with pytest.raises(ValueError, match="copy_strategy"):
+        block_log.copy_to(tmp_path / "copy", copy_strategy="symlink")  # type: ignore[arg-type]
+
+
+def test_copying_file_prefix(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    source_content = block_log.block_files[0].read_bytes()
+    destination = tmp_path / "prefix"
+
+    copy_file_prefix(block_log.block_files[0], destination, len(source_content) // 2)
+
+    assert destination.read_bytes() == source_content[: len(source_content) // 2]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private import block_log_reader
+from test_tools.__private.block_log_reader import (
+    ARTIFACT_CHUNK_SIZE,
+    BLOCK_ID_SIZE,
+    COMPRESSED_FLAG,
+    BlockLogFileReader,
+    decode_signed_block,
+)
+
+from tests.unit_tests.block_log_tests.local_tools import GENESIS_TIME, create_block_log, serialize_block
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NUMBER_OF_BLOCKS: Final[int] = 10
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_reading_head_block_number(tmp_path: Path, split: bool) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS, split=split)
+
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_reading_block(tmp_path: Path, split: bool) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS, split=split)
+
+    block = block_log.get_block(5)
+
+    assert block.block_id == block_log.get_block_ids(5)
+    assert block.previous == block_log.get_block_ids(4)
+    assert block.witness == "initminer"
+    assert int(block.timestamp.timestamp()) == GENESIS_TIME + 5 * 3
+    assert len(block.transactions) == 5 % 3
+    assert block.transactions[0].operations[0].value.to == "alice"
+
+
+def test_compressed_block_is_read_by_block_log_util_without_zstandard(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    artifacts_file = tt.BlockLog.get_artifacts_file(block_log.block_files[0])
+    artifacts = bytearray(artifacts_file.read_bytes())
+    chunk_of_fifth_block = len(artifacts) - (NUMBER_OF_BLOCKS - 4) * ARTIFACT_CHUNK_SIZE
+    position = int.from_bytes(artifacts[chunk_of_fifth_block : chunk_of_fifth_block + 8], "little")
+    artifacts[chunk_of_fifth_block : chunk_of_fifth_block + 8] = (position | COMPRESSED_FLAG).to_bytes(8, "little")
+    artifacts_file.write_bytes(artifacts)
+
+    monkeypatch.setattr(block_log_reader, "zstandard", None)
+    read_by_block_log_util: list[int] = []
+    monkeypatch.setattr(
+        tt.BlockLog,
+        "_BlockLog__get_block_using_block_log_util",
+        lambda _, __, block_number: read_by_block_log_util.append(block_number),
+    )
+
+    block_log.get_block(4)
+    block_log.get_block(5)
+    list(block_log.iter_blocks(4, 7))
+
+    assert read_by_block_log_util == [5, 5]
+
+
+def test_reading_head_block_time(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    assert int(block_log.get_head_block_time().timestamp()) == GENESIS_TIME + NUMBER_OF_BLOCKS * 3
+
+
+def test_reading_block_out_of_range(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    with pytest.raises(tt.exceptions.BlockLogUtilError):
+        block_log.get_block(11)
+
+
+def test_block_with_transaction_not_deserializable_by_wax_is_unsupported() -> None:
+    serialized_block, block_id = serialize_block(1, bytes(BLOCK_ID_SIZE), number_of_transactions=0)
+    serialized_block = serialized_block[:-1] + bytes([1]) + b"\xff" * 40  # single transaction with invalid content
+
+    with pytest.raises(tt.exceptions.UnsupportedBlockLogFormatError):
+        decode_signed_block(serialized_block, block_id.hex())
+
+
+def test_reading_block_range_from_single_file(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    block_file = block_log.block_files[0]
+
+    with BlockLogFileReader(block_file, tt.BlockLog.get_artifacts_file(block_file)) as reader:
+        block_ids = [block["block_id"] for block in reader.iter_blocks(3, 7)]
+
+    assert block_ids == [block_log.get_block_ids(block_number) for block_number in range(3, 7)]
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_iterating_over_blocks(tmp_path: Path, split: bool) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS, split=split)
+
+    block_ids = [block.block_id for block in block_log.iter_blocks(3)]
+
+    assert block_ids == [block_log.get_block_ids(block_number) for block_number in range(3, NUMBER_OF_BLOCKS + 1)]
+
+
+def test_getting_block_range(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    blocks = block_log.get_block_range(2, 5)
+
+    assert [block.block_id for block in blocks] == [block_log.get_block_ids(number) for number in range(2, 5)]
+    assert all(current.previous == previous.block_id for previous, current in zip(blocks, blocks[1:], strict=False))
+
+
+def test_index_invalidation_after_block_log_modification(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS
+
+    create_block_log(tmp_path, NUMBER_OF_BLOCKS * 2)
+
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS * 2
+    assert block_log.get_block(NUMBER_OF_BLOCKS * 2).block_id == block_log.get_block_ids(NUMBER_OF_BLOCKS * 2)
+
+
+def test_index_invalidation_after_modification_within_the_same_mtime(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS
+    block_file_stat = block_log.block_files[0].stat()
+
+    create_block_log(tmp_path, NUMBER_OF_BLOCKS * 2)
+    os.utime(block_log.block_files[0], ns=(block_file_stat.st_atime_ns, block_file_stat.st_mtime_ns))
+
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS * 2
+
+
+def test_reading_after_closing(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    block_id = block_log.get_block_ids(5)
+
+    block_log.close()
+
+    assert block_log.get_block(5).block_id == block_id
+
+
+def test_parallel_artifacts_generation_skips_up_to_date_artifacts(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    block_log.generate_artifacts(parallel=True)  # would fail, if block_log_util was run
+
+
+@pytest.mark.parametrize("outdated_by", ["truncation", "appended_blocks"])
+def test_parallel_artifacts_generation_regenerates_outdated_artifacts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, outdated_by: str
+) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    artifacts_file = tt.BlockLog.get_artifacts_file(block_log.block_files[0])
+    if outdated_by == "truncation":
+        artifacts_file.write_bytes(artifacts_file.read_bytes()[:-ARTIFACT_CHUNK_SIZE])
+    else:
+        artifacts = artifacts_file.read_bytes()
+        create_block_log(tmp_path, NUMBER_OF_BLOCKS * 2)
+        artifacts_file.write_bytes(artifacts)  # mtime of artifacts is newer than of block log, but content is stale
+
+    regenerated: list[Path] = []
+    monkeypatch.setattr(tt.BlockLog, "_BlockLog__generate_artifacts_for", lambda _, file: regenerated.append(file))
+
+    block_log.generate_artifacts(parallel=True)
+
+    assert regenerated == block_log.block_files
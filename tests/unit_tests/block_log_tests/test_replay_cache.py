@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import pytest
+import test_tools as tt
+from beekeepy.interfaces import HttpUrl
+
+from tests.unit_tests.block_log_tests.local_tools import create_block_log
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+NUMBER_OF_BLOCKS: Final[int] = 10
+BUILD_COMMIT_HASH: Final[str] = "0123456789abcdef"
+
+
+@pytest.fixture
+def cache_directory(tmp_path: Path) -> Iterator[Path]:
+    previous_directory = tt.replay_cache.get_directory()
+    tt.replay_cache.set_directory(tmp_path / "cache")
+    yield tmp_path / "cache"
+    tt.replay_cache.set_directory(previous_directory)
+
+
+def calculate_key(block_log: tt.BlockLog, config: tt.NodeConfig, arguments: tt.NodeArguments) -> str:
+    return tt.replay_cache.calculate_key(
+        block_log=block_log, snapshot=None, build_commit_hash=BUILD_COMMIT_HASH, config=config, arguments=arguments
+    )
+
+
+def test_key_does_not_depend_on_endpoints(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+
+    first_key = calculate_key(
+        block_log, tt.NodeConfig(webserver_http_endpoint=HttpUrl("0.0.0.0:1234")), tt.NodeArguments()
+    )
+    second_key = calculate_key(
+        block_log, tt.NodeConfig(webserver_http_endpoint=HttpUrl("0.0.0.0:5678")), tt.NodeArguments()
+    )
+
+    assert first_key == second_key
+
+
+def test_key_depends_on_replay_inputs(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    key = calculate_key(block_log, tt.NodeConfig(), tt.NodeArguments())
+
+    assert key != calculate_key(block_log, tt.NodeConfig(), tt.NodeArguments(stop_at_block=5))
+    assert key != calculate_key(block_log, tt.NodeConfig(plugin=["account_by_key"]), tt.NodeArguments())
+
+    other_directory = tmp_path / "other"
+    other_directory.mkdir()
+    other_block_log = create_block_log(other_directory, NUMBER_OF_BLOCKS + 1)
+    assert key != calculate_key(other_block_log, tt.NodeConfig(), tt.NodeArguments())
+
+
+@pytest.mark.usefixtures("cache_directory")
+def test_restoring_stored_state(tmp_path: Path) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS)
+    key = calculate_key(block_log, tt.NodeConfig(), tt.NodeArguments())
+    replaying_node_directory = tmp_path / "replaying_node"
+    (replaying_node_directory / "blockchain").mkdir(parents=True)
+    block_log.copy_to(replaying_node_directory / "blockchain", artifacts="required")
+    (replaying_node_directory / "blockchain" / "shared_memory.bin").write_bytes(b"state")
+    restoring_node_directory = tmp_path / "restoring_node"
+
+    assert not tt.replay_cache.restore(key, restoring_node_directory, "auto")
+    tt.replay_cache.store(key, replaying_node_directory)
+
+    assert tt.replay_cache.restore(key, restoring_node_directory, "auto")
+    assert (restoring_node_directory / "blockchain" / "shared_memory.bin").read_bytes() == b"state"
+    assert tt.BlockLog(restoring_node_directory / "blockchain").get_head_block_number() == NUMBER_OF_BLOCKS
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private.block_log_reader import ARTIFACT_CHUNK_SIZE
+
+from tests.unit_tests.block_log_tests.local_tools import ARTIFACTS_HEADER, create_block_log
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NUMBER_OF_BLOCKS: Final[int] = 10
+TRUNCATED_HEAD_BLOCK_NUMBER: Final[int] = 6
+
+
+@pytest.fixture
+def regenerated_artifacts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """
+    Replaces block_log_util artifacts generation, which isn't available in unit tests.
+
+    Generated artifacts are a prefix of artifacts of untruncated block log created in `tmp_path`, so they are correct
+    only for block logs truncated to `TRUNCATED_HEAD_BLOCK_NUMBER`.
+    """
+    regenerated: list[Path] = []
+
+    def generate_artifacts_for(block_log: tt.BlockLog, block_file: Path) -> None:
+        regenerated.append(block_file)
+        source_artifacts = tt.BlockLog.get_artifacts_file(tmp_path / block_file.name).read_bytes()
+        block_log.get_artifacts_file(block_file).write_bytes(
+            source_artifacts[: len(ARTIFACTS_HEADER) + TRUNCATED_HEAD_BLOCK_NUMBER * ARTIFACT_CHUNK_SIZE]
+        )
+
+    monkeypatch.setattr(tt.BlockLog, "_BlockLog__generate_artifacts_for", generate_artifacts_for)
+    return regenerated
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_truncating_block_log(tmp_path: Path, regenerated_artifacts: list[Path], split: bool) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS, split=split)
+    block_ids = [block_log.get_block_ids(number) for number in range(1, TRUNCATED_HEAD_BLOCK_NUMBER + 1)]
+
+    truncated = block_log.truncate(tmp_path / "truncated", TRUNCATED_HEAD_BLOCK_NUMBER)
+
+    assert regenerated_artifacts == truncated.block_files
+    assert [file.name for file in truncated.block_files] == [file.name for file in block_log.block_files]
+    assert truncated.get_head_block_number() == TRUNCATED_HEAD_BLOCK_NUMBER
+    assert [block.block_id for block in truncated.get_block_range(1, TRUNCATED_HEAD_BLOCK_NUMBER + 1)] == block_ids
+    assert block_log.get_head_block_number() == NUMBER_OF_BLOCKS
+
+
+def test_truncating_split_block_log_removes_later_parts_from_output_directory(
+    tmp_path: Path, regenerated_artifacts: list[Path]
+) -> None:
+    block_log = create_block_log(tmp_path, NUMBER_OF_BLOCKS, split=True)
+    output_directory = tmp_path / "truncated"
+    output_directory.mkdir()
+    stale_part = output_directory / "block_log_part.0002"
+    stale_part.write_bytes(b"stale")
+    tt.BlockLog.get_artifacts_file(stale_part).write_bytes(b"stale")
+
+    truncated = block_log.truncate(output_directory, TRUNCATED_HEAD_BLOCK_NUMBER)
+
+    assert regenerated_artifacts == truncated.block_files
+    assert not stale_part.exists()
+    assert not tt.BlockLog.get_artifacts_file(stale_part).exists()
+    assert truncated.get_head_block_number() == TRUNCATED_HEAD_BLOCK_NUMBER
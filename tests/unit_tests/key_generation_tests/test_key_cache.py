@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import sys
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from test_tools.__private.key_cache import KeyCache
+from test_tools.__private.key_generator import INITMINER_KEYS, KeyGenerator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+NUMBER_OF_ACCOUNTS: Final[int] = 20
+CACHE_SIZE: Final[int] = 2
+
+# Returns the same keys for each account and records each run, so number of key generator runs can be checked.
+FAKE_KEY_GENERATOR: Final[str] = f"""#!{sys.executable}
+import json, pathlib, sys, time
+secret, names = sys.argv[1], []
+for argument in sys.argv[2:]:
+    prefix, _, suffix = argument.rpartition("-")
+    if ":" in suffix:
+        start, stop = suffix.split(":")
+        names.extend(f"{{prefix}}-{{index}}" for index in range(int(start), int(stop)))
+    else:
+        names.append(argument)
+with (pathlib.Path(__file__).parent / "runs").open("a") as runs:
+    runs.write(json.dumps(names) + "\\n")
+time.sleep(0.1)
+print(json.dumps([
+    {{"account_name": name, "private_key": "{INITMINER_KEYS[0]}", "public_key": "{INITMINER_KEYS[1]}"}}
+    for name in names
+]))
+"""
+
+
+@pytest.fixture
+def fake_key_generator(tmp_path: Path) -> Path:
+    executable = tmp_path / "get_dev_key"
+    executable.write_text(FAKE_KEY_GENERATOR)
+    executable.chmod(0o755)
+    return executable
+
+
+@pytest.fixture(autouse=True)
+def empty_key_cache() -> Iterator[None]:
+    KeyGenerator.cache.clear()
+    yield
+    KeyGenerator.cache.clear()
+
+
+def get_runs(fake_key_generator: Path) -> list[list[str]]:
+    runs_file = fake_key_generator.parent / "runs"
+    return [json.loads(line) for line in runs_file.read_text().splitlines()] if runs_file.exists() else []
+
+
+def test_least_recently_used_keys_are_evicted() -> None:
+    cache = KeyCache(max_size=CACHE_SIZE)
+    cache.put("secret", [("alice", ("alice-private", "alice-public")), ("bob", ("bob-private", "bob-public"))])
+    cache.get("secret", "alice")
+
+    cache.put("secret", [("carol", ("carol-private", "carol-public"))])
+
+    assert cache.get("secret", "bob") is None
+    assert cache.get("secret", "alice") == ("alice-private", "alice-public")
+    assert len(cache) == CACHE_SIZE
+
+
+def test_keys_are_read_from_database(tmp_path: Path) -> None:
+    KeyCache(database=tmp_path / "keys.sqlite3").put("secret", [("alice", ("alice-private", "alice-public"))])
+
+    assert KeyCache(database=tmp_path / "keys.sqlite3").get("secret", "alice") == ("alice-private", "alice-public")
+    assert KeyCache(database=tmp_path / "keys.sqlite3").get("other-secret", "alice") is None
+
+
+def test_keys_are_generated_once(fake_key_generator: Path) -> None:
+    first = KeyGenerator.generate_keys_for(["alice", "bob"], executable_path=fake_key_generator)
+    second = KeyGenerator.generate_keys_for(["bob", "alice"], executable_path=fake_key_generator)
+
+    assert [item.account_name for item in first] == ["alice", "bob"]
+    assert [item.account_name for item in second] == ["bob", "alice"]
+    assert get_runs(fake_key_generator) == [["alice", "bob"]]
+
+
+def test_concurrent_lookups_are_coalesced(fake_key_generator: Path) -> None:
+    account_names = [f"account-{index}" for index in range(NUMBER_OF_ACCOUNTS)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUMBER_OF_ACCOUNTS) as executor:
+        items = list(
+            executor.map(
+                lambda name: KeyGenerator.generate_keys_for([name], executable_path=fake_key_generator)[0],
+                account_names,
+            )
+        )
+
+    assert [item.account_name for item in items] == account_names
+    assert len(get_runs(fake_key_generator)) < NUMBER_OF_ACCOUNTS
+    assert sorted(name for run in get_runs(fake_key_generator) for name in run) == sorted(account_names)
+
+
+def test_derived_keys_are_the_same_as_generated_by_get_dev_key() -> None:
+    # Initminer keys are generated by hived from "init_key" in the same way as get_dev_key does.
+    (item,) = KeyGenerator.generate_keys_for(["key"], secret="init_")
+
+    assert (str(item.private_key), str(item.public_key)) == INITMINER_KEYS
+
+
+def test_deriving_keys_of_account_range() -> None:
+    items = KeyGenerator.generate_keys("account", number_of_accounts=NUMBER_OF_ACCOUNTS)
+
+    assert [item.account_name for item in items] == [f"account-{index}" for index in range(NUMBER_OF_ACCOUNTS)]
+    assert items[1] == KeyGenerator.generate_keys("account-1")[0]
+
+
+def test_generating_keys_in_parallel() -> None:
+    stream = KeyGenerator.generate_keys_in_parallel(
+        "account", number_of_accounts=NUMBER_OF_ACCOUNTS, max_workers=2, chunk_size=3
+    )
+
+    assert list(stream) == KeyGenerator.generate_keys("account", number_of_accounts=NUMBER_OF_ACCOUNTS)
+
+
+def test_generating_keys_in_parallel_with_executable(fake_key_generator: Path) -> None:
+    stream = KeyGenerator.generate_keys_in_parallel(
+        "account",
+        number_of_accounts=NUMBER_OF_ACCOUNTS,
+        max_workers=2,
+        chunk_size=3,
+        executable_path=fake_key_generator,
+    )
+
+    assert next(stream).account_name == "account-0"
+    assert [item.account_name for item in stream] == [f"account-{index}" for index in range(1, NUMBER_OF_ACCOUNTS)]
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import test_tools as tt
+
+from tests.unit_tests.block_log_tests.local_tools import create_block_log
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def create_snapshot(node_directory: Path, files: dict[str, bytes], *, name: str = "snapshot") -> tt.Snapshot:
+    """Creates snapshot in the same layout as node does, filled with given files, without using hived."""
+    block_log_directory = node_directory / "blockchain"
+    block_log_directory.mkdir(parents=True, exist_ok=True)
+    block_log = create_block_log(block_log_directory, 3)
+
+    snapshot_path = node_directory / "snapshot" / name
+    for file, content in files.items():
+        (snapshot_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (snapshot_path / file).write_bytes(content)
+    return tt.Snapshot(snapshot_path, block_log)
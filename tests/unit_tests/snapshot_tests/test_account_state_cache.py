@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private import account_state_cache, init_node
+
+from tests.unit_tests.snapshot_tests.local_tools import create_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+BUILD_COMMIT_HASH: Final[str] = "0123456789abcdef"
+NUMBER_OF_ACCOUNTS: Final[int] = 100_000
+NUMBER_OF_CACHED_ACCOUNTS: Final[int] = 10
+
+
+def calculate_key(**overridden: Any) -> str:
+    parameters: dict[str, Any] = {
+        "number_of_accounts": NUMBER_OF_ACCOUNTS,
+        "name_base": "account",
+        "secret": "secret",
+        "hives": tt.Asset.Test(10),
+        "hbds": None,
+        "vests": None,
+        "alternate_chain_specs": None,
+        "build_commit_hash": BUILD_COMMIT_HASH,
+    }
+    parameters.update(overridden)
+    return tt.account_state_cache.calculate_key(**parameters)
+
+
+def test_key_of_identical_requests_is_the_same() -> None:
+    assert calculate_key() == calculate_key(hives=tt.Asset.Test(10))
+
+
+def test_key_depends_on_parameters_and_build() -> None:
+    key = calculate_key()
+
+    assert key != calculate_key(number_of_accounts=NUMBER_OF_ACCOUNTS + 1)
+    assert key != calculate_key(name_base="other")
+    assert key != calculate_key(secret="other")
+    assert key != calculate_key(hives=tt.Asset.Test(20))
+    assert key != calculate_key(vests=tt.Asset.Test(10))
+    assert key != calculate_key(build_commit_hash="fedcba9876543210")
+    assert key != calculate_key(
+        alternate_chain_specs=tt.AlternateChainSpecs(
+            genesis_time=1, hardfork_schedule=[tt.HardforkSchedule(hardfork=28, block_num=1)]
+        )
+    )
+
+
+@pytest.fixture
+def cache_directory(tmp_path: Path) -> Iterator[Path]:
+    previous_directory = tt.account_state_cache.get_directory()
+    tt.account_state_cache.set_directory(tmp_path / "cache")
+    yield tmp_path / "cache"
+    tt.account_state_cache.set_directory(previous_directory)
+
+
+@pytest.fixture
+def disabled_cache() -> Iterator[None]:
+    previous_directory = tt.account_state_cache.get_directory()
+    tt.account_state_cache.set_directory(None)
+    yield
+    tt.account_state_cache.set_directory(previous_directory)
+
+
+@pytest.fixture
+def created_nodes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[SimpleNamespace]:
+    """Replaces init node, which creates accounts, with fake one dumping snapshot without running hived."""
+    nodes: list[SimpleNamespace] = []
+
+    def create_node(*, network: None) -> SimpleNamespace:
+        assert network is None
+        directory = tmp_path / f"node-{len(nodes)}"
+        node = SimpleNamespace(
+            created_accounts=[],
+            dump_snapshot=lambda *, name, **_: create_snapshot(directory, {"state.bin": b"accounts"}, name=name),
+        )
+        nodes.append(node)
+        return node
+
+    monkeypatch.setattr(init_node, "InitNode", create_node)
+    monkeypatch.setattr(account_state_cache, "__get_build_commit_hash", lambda: BUILD_COMMIT_HASH)
+    monkeypatch.setattr(
+        account_state_cache, "__create_accounts", lambda node, accounts, **_: node.created_accounts.append(accounts)
+    )
+    return nodes
+
+
+@pytest.mark.usefixtures("cache_directory")
+def test_preloaded_accounts_are_taken_from_cache(created_nodes: list[SimpleNamespace]) -> None:
+    stored = tt.account_state_cache.preload_accounts(NUMBER_OF_CACHED_ACCOUNTS, hives=tt.Asset.Test(10))
+    assert len(created_nodes) == 1
+    assert list(created_nodes[0].created_accounts[0].names()) == list(stored.accounts.names())
+
+    restored = tt.account_state_cache.preload_accounts(NUMBER_OF_CACHED_ACCOUNTS, hives=tt.Asset.Test(10))
+
+    assert len(created_nodes) == 1, "node was created, despite of cache hit"
+    assert list(restored.accounts.names()) == list(stored.accounts.names())
+    assert restored.snapshot.name == stored.snapshot.name
+    assert (restored.snapshot.get_path() / "state.bin").read_bytes() == b"accounts"
+    assert restored.snapshot.get_path() != stored.snapshot.get_path()
+
+
+@pytest.mark.usefixtures("disabled_cache")
+def test_accounts_are_created_each_time_without_cache(created_nodes: list[SimpleNamespace]) -> None:
+    tt.account_state_cache.preload_accounts(NUMBER_OF_CACHED_ACCOUNTS)
+    tt.account_state_cache.preload_accounts(NUMBER_OF_CACHED_ACCOUNTS)
+
+    assert len(created_nodes) == 2  # noqa: PLR2004
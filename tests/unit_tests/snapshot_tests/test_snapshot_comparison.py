@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Final
+
+from test_tools.__private import snapshot
+from test_tools.__private.utilities.file_hashing import hash_file
+
+from tests.unit_tests.snapshot_tests.local_tools import create_snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+SNAPSHOT_FILES: Final[dict[str, bytes]] = {
+    "indices/accounts/000001.sst": b"accounts",
+    "indices/comments/000002.sst": b"comments",
+    "snapshot-manifest/MANIFEST-000001": b"manifest",
+}
+
+
+def test_comparing_same_snapshots(tmp_path: Path) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", SNAPSHOT_FILES)
+
+    assert first == second
+
+
+def test_comparing_snapshots_with_different_size_of_files(tmp_path: Path) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", {**SNAPSHOT_FILES, "indices/accounts/000001.sst": b"alice"})
+
+    assert first != second
+    assert not first.manifest_path.exists()  # detected without hashing
+
+
+def test_comparing_snapshots_with_different_content_of_files(tmp_path: Path) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", {**SNAPSHOT_FILES, "indices/accounts/000001.sst": b"ACCOUNTS"})
+
+    assert first != second
+
+
+def test_comparing_snapshots_stops_at_first_different_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", {**SNAPSHOT_FILES, "indices/accounts/000001.sst": b"ACCOUNTS"})
+    hashed: list[Path] = []
+
+    def hash_and_record(path: Path) -> str:
+        hashed.append(path)
+        return hash_file(path)
+
+    monkeypatch.setattr(snapshot, "hash_file", hash_and_record)
+
+    assert first != second
+    assert [path.name for path in hashed] == ["000001.sst", "000001.sst"]
+
+
+def test_comparison_reuses_digests_from_manifest(tmp_path: Path) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", SNAPSHOT_FILES)
+    first.get_file_digests()
+
+    # Content changes without change of size and modification time, so digest is taken from manifest.
+    first_file = first.get_path() / "indices/comments/000002.sst"
+    stat = first_file.stat()
+    first_file.write_bytes(b"COMMENTS")
+    os.utime(first_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert first == second
+    assert second.get_file_digests("*.sst") == first.get_file_digests("*.sst")
+
+
+def test_comparing_snapshots_ignores_files_other_than_sst(tmp_path: Path) -> None:
+    first = create_snapshot(tmp_path / "first", SNAPSHOT_FILES)
+    second = create_snapshot(tmp_path / "second", {**SNAPSHOT_FILES, "snapshot-manifest/MANIFEST-000001": b"other"})
+
+    assert first == second
+
+
+def test_digests_are_cached_in_manifest(tmp_path: Path) -> None:
+    golden = create_snapshot(tmp_path / "golden", SNAPSHOT_FILES)
+    golden_file = golden.get_path() / "indices/accounts/000001.sst"
+    digests = golden.get_file_digests()
+
+    # Content changes without change of size and modification time, so digest is taken from manifest.
+    stat = golden_file.stat()
+    golden_file.write_bytes(b"ACCOUNTS")
+    os.utime(golden_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert golden.manifest_path.exists()
+    assert golden.get_file_digests() == digests
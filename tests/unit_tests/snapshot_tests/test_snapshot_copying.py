@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import test_tools as tt
+
+from tests.unit_tests.snapshot_tests.local_tools import create_snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SNAPSHOT_FILES: Final[dict[str, bytes]] = {
+    "indices/accounts/000001.sst": b"accounts",
+    "indices/comments/000002.sst": b"comments",
+    "snapshot-manifest/MANIFEST-000001": b"manifest",
+}
+
+
+def test_copying_snapshot(tmp_path: Path) -> None:
+    snapshot = create_snapshot(tmp_path / "source", SNAPSHOT_FILES)
+    node_directory = tmp_path / "node"
+    node_directory.mkdir()
+
+    snapshot.copy_to(node_directory, copy_strategy="copy")
+
+    copied = tt.Snapshot(node_directory / "snapshot" / snapshot.name, tt.BlockLog(node_directory / "blockchain"))
+    assert copied.get_file_digests() == snapshot.get_file_digests()
+
+
+def test_copying_only_changed_files_of_newer_snapshot(tmp_path: Path) -> None:
+    node_directory = tmp_path / "node"
+    node_directory.mkdir()
+    create_snapshot(tmp_path / "older", SNAPSHOT_FILES).copy_to(node_directory, copy_strategy="copy")
+    destination = node_directory / "snapshot" / "snapshot"
+    unchanged_inode = (destination / "indices/accounts/000001.sst").stat().st_ino
+
+    newer = create_snapshot(
+        tmp_path / "newer",
+        {
+            "indices/accounts/000001.sst": b"accounts",
+            "indices/comments/000003.sst": b"new comments",
+            "snapshot-manifest/MANIFEST-000001": b"new manifest",
+        },
+    )
+    newer.copy_to(node_directory, copy_strategy="copy")
+
+    assert (destination / "indices/accounts/000001.sst").stat().st_ino == unchanged_inode
+    assert not (destination / "indices/comments/000002.sst").exists()
+    assert (destination / "indices/comments/000003.sst").read_bytes() == b"new comments"
+    assert (destination / "snapshot-manifest/MANIFEST-000001").read_bytes() == b"new manifest"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Final
+
+START_TIME: Final[datetime] = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BLOCK_INTERVAL: Final[timedelta] = timedelta(seconds=3)
+CHAIN_ID: Final[str] = "18dcf0a285365fc58b71f18b3d3fec954aa0c141c44e4e5cb4cf777b9eab274e"
+
+
+class FakeNode:
+    """
+    Node with blockchain extended by test, exposing only apis used by wallet to build and track transactions.
+
+    Blocks are produced explicitly with `produce_block` or, if `produce_block_on_head_request` is set, each head block
+    request produces block with all transactions added to `broadcast` since previous one. Restart of node is simulated
+    by incrementing `run_id`. Calls of apis, which results are cached by wallet, are counted.
+    """
+
+    def __init__(self, *, produce_block_on_head_request: bool = False) -> None:
+        self.blocks: list[list[str]] = [[]]
+        self.broadcast: list[str] = []
+        self.run_id = 1
+        self.number_of_dgpo_calls = 0
+        self.number_of_get_config_calls = 0
+        self.number_of_get_version_calls = 0
+        self.number_of_block_range_calls = 0
+        self.__produce_block_on_head_request = produce_block_on_head_request
+        self.api = SimpleNamespace(
+            database=SimpleNamespace(
+                get_config=self.__get_config,
+                get_version=self.__get_version,
+                get_dynamic_global_properties=self._get_dynamic_global_properties,
+            ),
+            block=SimpleNamespace(get_block_range=self._get_block_range),
+        )
+
+    @property
+    def head_block_number(self) -> int:
+        return len(self.blocks)
+
+    @property
+    def head_block_time(self) -> datetime:
+        return START_TIME + self.head_block_number * BLOCK_INTERVAL
+
+    def get_run_id(self) -> int:
+        return self.run_id
+
+    def produce_block(self, *transaction_ids: str) -> None:
+        self.blocks.append(list(transaction_ids))
+
+    def expiring_after(self, number_of_blocks: int) -> datetime:
+        """Returns expiration time of transaction, which expires `number_of_blocks` after current head block."""
+        return START_TIME + (self.head_block_number + number_of_blocks) * BLOCK_INTERVAL
+
+    def __get_config(self) -> Any:
+        self.number_of_get_config_calls += 1
+        return SimpleNamespace(HIVE_CHAIN_ID=CHAIN_ID)
+
+    def __get_version(self) -> Any:
+        self.number_of_get_version_calls += 1
+        return SimpleNamespace(node_type="testnet")
+
+    def _get_dynamic_global_properties(self) -> Any:
+        self.number_of_dgpo_calls += 1
+        if self.__produce_block_on_head_request:
+            self.produce_block(*self.broadcast)
+            self.broadcast = []
+        return SimpleNamespace(
+            head_block_number=self.head_block_number,
+            head_block_id=f"{self.head_block_number:08x}12345678{'0' * 24}".encode(),
+            time=self.head_block_time,
+        )
+
+    def _get_block_range(self, *, starting_block_num: int, count: int) -> Any:
+        self.number_of_block_range_calls += 1
+        blocks = self.blocks[starting_block_num - 1 : starting_block_num - 1 + count]
+        return SimpleNamespace(blocks=[SimpleNamespace(transaction_ids=ids) for ids in blocks])
+
+
+class FakeAsyncNode(FakeNode):
+    """The same as `FakeNode`, but with apis of asynchronous node."""
+
+    def __init__(self, *, produce_block_on_head_request: bool = False) -> None:
+        super().__init__(produce_block_on_head_request=produce_block_on_head_request)
+        self.api = SimpleNamespace(
+            database=SimpleNamespace(get_dynamic_global_properties=self.__get_dynamic_global_properties),
+            block=SimpleNamespace(get_block_range=self.__get_block_range),
+        )
+
+    async def __get_dynamic_global_properties(self) -> Any:
+        return self._get_dynamic_global_properties()
+
+    async def __get_block_range(self, *, starting_block_num: int, count: int) -> Any:
+        return self._get_block_range(starting_block_num=starting_block_num, count=count)
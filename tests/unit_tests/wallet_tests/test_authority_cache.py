@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from test_tools.__private.wallet.authority_cache import AuthorityCache
+from test_tools.__private.wallet.constants import SimpleTransaction
+
+from schemas.operations import AccountUpdate2Operation, TransferOperation
+
+if TYPE_CHECKING:
+    from schemas.operations import Hf26Operations
+
+
+def create_transaction(*operations: Hf26Operations) -> SimpleTransaction:
+    transaction = SimpleTransaction(
+        ref_block_num=0,
+        ref_block_prefix=0,
+        expiration="2024-01-01T00:00:00",
+        extensions=[],
+        signatures=[],
+        operations=[],
+    )
+    for operation in operations:
+        transaction.add_operation(operation)
+    return transaction
+
+
+def create_transfer(from_: str, to: str, memo: str = "") -> TransferOperation:
+    return TransferOperation(
+        from_=from_, to=to, amount={"amount": "1", "precision": 3, "nai": "@@000000021"}, memo=memo
+    )
+
+
+def store_confirmed_signing_keys(cache: AuthorityCache, transaction: SimpleTransaction, keys: list[str]) -> None:
+    cache.store_signing_keys(transaction, keys)
+    cache.confirm_signing_keys(transaction)
+
+
+def test_signing_keys_are_reused_for_transactions_of_the_same_shape() -> None:
+    cache = AuthorityCache()
+    store_confirmed_signing_keys(cache, create_transaction(create_transfer("alice", "bob", "first")), ["key"])
+
+    assert cache.get_signing_keys(create_transaction(create_transfer("alice", "bob", "second"))) == ["key"]
+    assert cache.get_signing_keys(create_transaction(create_transfer("bob", "alice"))) is None
+
+
+def test_signing_keys_are_reused_only_after_transaction_is_accepted() -> None:
+    cache = AuthorityCache()
+    transfer = create_transaction(create_transfer("alice", "bob"))
+    cache.store_signing_keys(transfer, ["key"])
+
+    assert cache.get_signing_keys(transfer) is None
+    assert cache.get_signing_keys(transfer, unconfirmed=True) == ["key"]
+
+    cache.confirm_signing_keys(transfer)
+
+    assert cache.get_signing_keys(transfer) == ["key"]
+
+
+def test_empty_signing_keys_are_not_stored() -> None:
+    cache = AuthorityCache()
+    transfer = create_transaction(create_transfer("alice", "bob"))
+
+    store_confirmed_signing_keys(cache, transfer, [])
+
+    assert cache.get_signing_keys(transfer, unconfirmed=True) is None
+
+
+def test_signing_keys_are_forgotten_when_keys_are_imported() -> None:
+    cache = AuthorityCache()
+    confirmed = create_transaction(create_transfer("alice", "bob"))
+    unconfirmed = create_transaction(create_transfer("bob", "alice"))
+    store_confirmed_signing_keys(cache, confirmed, ["key"])
+    cache.store_signing_keys(unconfirmed, ["key"])
+
+    cache.clear_signing_keys()
+
+    assert cache.get_signing_keys(confirmed) is None
+    assert cache.get_signing_keys(unconfirmed, unconfirmed=True) is None
+
+
+def test_authorities_are_retrieved_only_once() -> None:
+    cache = AuthorityCache()
+    retrieved: list[list[str]] = []
+
+    def retrieve(names: list[str]) -> dict[str, str]:
+        retrieved.append(names)
+        return {name: f"{name}-authority" for name in names}
+
+    cache.get_authorities(["alice"], retrieve)  # type: ignore[arg-type]
+    authorities = cache.get_authorities(["alice", "bob"], retrieve)  # type: ignore[arg-type]
+
+    assert authorities == {"alice": "alice-authority", "bob": "bob-authority"}
+    assert retrieved == [["alice"], ["bob"]]
+
+
+def test_authority_change_invalidates_cache() -> None:
+    cache = AuthorityCache()
+    transfer = create_transaction(create_transfer("alice", "bob"))
+    store_confirmed_signing_keys(cache, transfer, ["key"])
+    cache.get_authorities(["alice", "bob"], lambda names: {name: "authority" for name in names})  # type: ignore[misc]
+
+    cache.observe(
+        create_transaction(AccountUpdate2Operation(account="alice", json_metadata="", posting_json_metadata=""))
+    )
+
+    assert cache.get_signing_keys(transfer) is None
+    retrieved: list[list[str]] = []
+    cache.get_authorities(["alice", "bob"], lambda names: retrieved.append(names) or {})  # type: ignore[func-returns-value]
+    assert retrieved == [["alice"]]
+
+
+def test_authorities_are_retrieved_again_after_rejection_of_transaction() -> None:
+    cache = AuthorityCache()
+    transfer = create_transaction(create_transfer("alice", "bob"))
+    store_confirmed_signing_keys(cache, transfer, ["key"])
+    cache.get_authorities(["alice", "bob", "carol"], lambda names: {name: "authority" for name in names})  # type: ignore[misc]
+    cache.get_witness_key("alice", lambda _: "witness-key")
+
+    cache.forget_signing_keys(transfer)
+
+    assert cache.get_signing_keys(transfer) is None
+    retrieved: list[list[str]] = []
+    cache.get_authorities(["alice", "bob", "carol"], lambda names: retrieved.append(names) or {})  # type: ignore[func-returns-value]
+    assert retrieved == [["alice", "bob"]]
+    assert cache.get_witness_key("alice", lambda _: "new-witness-key") == "new-witness-key"
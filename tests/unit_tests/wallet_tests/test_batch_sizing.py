@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import Final
+
+from test_tools.__private.wallet.batch_sizing import (
+    MAX_IMPORT_KEYS_BATCH_SIZE,
+    AdaptiveBatchSizing,
+    get_next_import_keys_batch_size,
+)
+from test_tools.__private.wallet.constants import ACCOUNT_PER_TRANSACTION
+
+MAX_IN_FLIGHT: Final[int] = 8
+FAST_BROADCAST: Final[float] = 0.1
+SLOW_BROADCAST: Final[float] = 1.0
+IMPORT_KEYS_BATCH_SIZE: Final[int] = 10_000
+
+
+def test_fast_broadcasts_increase_number_of_transactions_in_flight() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+
+    batching.on_broadcast(FAST_BROADCAST)
+    batching.on_broadcast(FAST_BROADCAST)
+
+    assert batching.max_in_flight == MAX_IN_FLIGHT + 2
+
+
+def test_slow_broadcast_decreases_number_of_transactions_in_flight() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+    batching.on_broadcast(FAST_BROADCAST)
+
+    batching.on_broadcast(SLOW_BROADCAST)
+
+    assert batching.max_in_flight < MAX_IN_FLIGHT
+
+
+def test_size_rejection_limits_transaction_size() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+
+    assert batching.on_rejection("Transaction size exceeds limit", ACCOUNT_PER_TRANSACTION)
+    assert batching.accounts_per_transaction == ACCOUNT_PER_TRANSACTION // 2
+
+    for _ in range(10):
+        batching.on_blocks_scanned(number_of_included=1, number_of_overdue=0)
+    assert batching.accounts_per_transaction == ACCOUNT_PER_TRANSACTION // 2
+
+
+def test_other_rejection_decreases_number_of_transactions_in_flight() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+
+    assert not batching.on_rejection("Duplicate transaction check failed", ACCOUNT_PER_TRANSACTION)
+    assert batching.accounts_per_transaction == ACCOUNT_PER_TRANSACTION
+    assert batching.max_in_flight < MAX_IN_FLIGHT
+
+
+def test_blocks_including_transactions_in_time_increase_transaction_size() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+
+    batching.on_blocks_scanned(number_of_included=1, number_of_overdue=0)
+
+    assert batching.accounts_per_transaction > ACCOUNT_PER_TRANSACTION
+
+
+def test_full_blocks_decrease_number_of_transactions_in_flight() -> None:
+    batching = AdaptiveBatchSizing(max_in_flight=MAX_IN_FLIGHT)
+
+    batching.on_blocks_scanned(number_of_included=1, number_of_overdue=1)
+
+    assert batching.accounts_per_transaction == ACCOUNT_PER_TRANSACTION
+    assert batching.max_in_flight < MAX_IN_FLIGHT
+
+
+def test_import_keys_batch_size_follows_import_duration() -> None:
+    assert get_next_import_keys_batch_size(IMPORT_KEYS_BATCH_SIZE, 1.0) > IMPORT_KEYS_BATCH_SIZE
+    assert get_next_import_keys_batch_size(IMPORT_KEYS_BATCH_SIZE, 10.0) < IMPORT_KEYS_BATCH_SIZE
+    assert get_next_import_keys_batch_size(MAX_IMPORT_KEYS_BATCH_SIZE, 0.1) == MAX_IMPORT_KEYS_BATCH_SIZE
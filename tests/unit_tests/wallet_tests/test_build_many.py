@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private.wallet import wallet
+
+from schemas.operations import TransferOperation
+from tests.unit_tests.wallet_tests.local_tools import FakeNode
+from wax.cpp_python_bridge import get_public_key_from_signature
+
+if TYPE_CHECKING:
+    from test_tools.__private.wallet.constants import SimpleTransaction
+
+SENDERS: Final[tuple[tt.Account, ...]] = (tt.Account("alice"), tt.Account("bob"))
+NUMBER_OF_OPERATIONS: Final[int] = 10
+
+
+class FakeWax:
+    """Replaces wax functions used by wallet to resolve keys and calculate digests, records their calls."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.key_resolutions: list[str] = []
+        self.sig_digests: list[str] = []
+        monkeypatch.setattr(wallet, "get_hive_protocol_config", lambda _: {"IS_TEST_NET": "true"})
+        monkeypatch.setattr(wallet, "collect_signing_keys", self.__collect_signing_keys)
+        monkeypatch.setattr(wallet, "minimize_required_signatures", lambda _, __, keys, *___: keys)
+        monkeypatch.setattr(wallet, "calculate_sig_digest", self.__calculate_sig_digest)
+
+    def __collect_signing_keys(self, transaction: SimpleTransaction, _: Any) -> list[str]:
+        sender = transaction.operations[0].value.from_
+        self.key_resolutions.append(sender)
+        return [str(tt.Account(sender).public_key)]
+
+    def __calculate_sig_digest(self, transaction: SimpleTransaction, chain_id: str) -> str:
+        digest = hashlib.sha256(chain_id.encode() + transaction.json().encode()).hexdigest()
+        self.sig_digests.append(digest)
+        return digest
+
+
+@pytest.fixture
+def fake_wax(monkeypatch: pytest.MonkeyPatch) -> FakeWax:
+    return FakeWax(monkeypatch)
+
+
+@pytest.fixture
+def node() -> FakeNode:
+    return FakeNode()
+
+
+@pytest.fixture
+def validate_transactions() -> bool:
+    return False
+
+
+@pytest.fixture
+def tested_wallet(
+    monkeypatch: pytest.MonkeyPatch,
+    node: FakeNode,
+    fake_wax: FakeWax,  # noqa: ARG001
+    validate_transactions: bool,
+) -> wallet.Wallet:
+    """Wallet signing locally, without beekeeper."""
+    monkeypatch.setattr(wallet.Wallet, "run", lambda *_, **__: None)
+    tested_wallet = wallet.Wallet(
+        attach_to=node,  # type: ignore[arg-type]
+        signer="local",
+        validate_transactions=validate_transactions,
+    )
+    tested_wallet._beekeeper_wallet = SimpleNamespace()  # type: ignore[assignment]
+    assert tested_wallet._local_signer is not None
+    tested_wallet._local_signer.import_keys(str(account.private_key) for account in SENDERS)
+    return tested_wallet
+
+
+def create_transfers(number_of_transfers: int) -> list[TransferOperation]:
+    return [
+        TransferOperation(
+            from_=SENDERS[number % len(SENDERS)].name,
+            to="initminer",
+            amount=tt.Asset.Test(1),
+            memo=str(number),
+        )
+        for number in range(number_of_transfers)
+    ]
+
+
+@pytest.mark.parametrize("ops_per_tx", [1, 3, NUMBER_OF_OPERATIONS])
+def test_operations_are_split_into_transactions(tested_wallet: wallet.Wallet, ops_per_tx: int) -> None:
+    operations = create_transfers(NUMBER_OF_OPERATIONS)
+
+    transactions = tested_wallet.build_many(operations, ops_per_tx=ops_per_tx)
+
+    assert [len(transaction.operations) for transaction in transactions] == [
+        min(ops_per_tx, NUMBER_OF_OPERATIONS - first) for first in range(0, NUMBER_OF_OPERATIONS, ops_per_tx)
+    ]
+    assert [operation.value.memo for transaction in transactions for operation in transaction.operations] == [
+        operation.memo for operation in operations
+    ]
+
+
+def test_reference_block_is_fetched_once(tested_wallet: wallet.Wallet, node: FakeNode) -> None:
+    transactions = tested_wallet.build_many(create_transfers(NUMBER_OF_OPERATIONS))
+
+    assert node.number_of_dgpo_calls == 1
+    assert {transaction.ref_block_num for transaction in transactions} == {node.head_block_number}
+    assert len({transaction.expiration for transaction in transactions}) == 1
+
+
+def test_keys_are_resolved_once_per_transaction_shape(tested_wallet: wallet.Wallet, fake_wax: FakeWax) -> None:
+    tested_wallet.build_many(create_transfers(NUMBER_OF_OPERATIONS))
+
+    assert sorted(fake_wax.key_resolutions) == sorted(account.name for account in SENDERS)
+
+
+def test_transactions_are_signed_with_keys_of_senders(tested_wallet: wallet.Wallet, fake_wax: FakeWax) -> None:
+    transactions = tested_wallet.build_many(create_transfers(NUMBER_OF_OPERATIONS))
+
+    for transaction, sig_digest in zip(transactions, fake_wax.sig_digests, strict=True):
+        assert len(transaction.signatures) == 1
+        signing_key = get_public_key_from_signature(sig_digest.encode(), str(transaction.signatures[0]).encode())
+        assert signing_key.result.decode() == tt.Account(transaction.operations[0].value.from_).public_key
+
+
+def test_keys_are_resolved_again_after_import_of_missing_key(tested_wallet: wallet.Wallet, fake_wax: FakeWax) -> None:
+    transfer = TransferOperation(from_="carol", to="initminer", amount=tt.Asset.Test(1), memo="")
+    [unsigned] = tested_wallet.build_many([transfer])
+    assert tested_wallet._local_signer is not None
+    tested_wallet._local_signer.import_keys([str(tt.Account("carol").private_key)])
+
+    [signed] = tested_wallet.build_many([transfer])
+
+    assert fake_wax.key_resolutions == ["carol", "carol"]
+    assert len(unsigned.signatures) == 0
+    assert len(signed.signatures) == 1
+
+
+def test_local_signer_signs_without_threads(tested_wallet: wallet.Wallet, monkeypatch: pytest.MonkeyPatch) -> None:
+    signing_threads: set[int] = set()
+    sign_transaction = tested_wallet.sign_transaction
+
+    def sign_and_record_thread(*args: Any) -> SimpleTransaction:
+        signing_threads.add(threading.get_ident())
+        return sign_transaction(*args)
+
+    monkeypatch.setattr(tested_wallet, "sign_transaction", sign_and_record_thread)
+
+    tested_wallet.build_many(create_transfers(NUMBER_OF_OPERATIONS))
+
+    assert signing_threads == {threading.get_ident()}
+
+
+@pytest.mark.parametrize("validate_transactions", [True, False])
+def test_signed_transactions_are_validated_unless_disabled(
+    tested_wallet: wallet.Wallet, monkeypatch: pytest.MonkeyPatch, validate_transactions: bool
+) -> None:
+    validated: list[SimpleTransaction] = []
+    monkeypatch.setattr(wallet, "validate_transaction", validated.append)
+
+    transactions = tested_wallet.build_many(create_transfers(NUMBER_OF_OPERATIONS))
+
+    assert validated == (transactions if validate_transactions else [])
+
+
+def test_id_of_submitted_transaction_is_calculated_once(
+    tested_wallet: wallet.Wallet, node: FakeNode, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calculated: list[SimpleTransaction] = []
+
+    def calculate_transaction_id(transaction: SimpleTransaction) -> str:
+        calculated.append(transaction)
+        return f"trx-{len(calculated)}"
+
+    monkeypatch.setattr(wallet, "calculate_transaction_id", calculate_transaction_id)
+    node.api.wallet_bridge = SimpleNamespace(
+        broadcast_transaction=lambda transaction: node.broadcast.append(transaction)
+    )
+    [transaction] = tested_wallet.build_many(create_transfers(1))
+
+    tested_wallet.submit_transaction(transaction)
+    tested_wallet.close()
+
+    assert calculated == [transaction]
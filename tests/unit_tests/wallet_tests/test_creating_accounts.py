@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+import test_tools as tt
+
+
+@pytest.mark.requires_hived_executables
+@pytest.mark.parametrize("number_of_accounts", [10, 501])  # created in single transaction and in bulk
+def test_created_accounts_have_keys_of_account_set(node: tt.InitNode, number_of_accounts: int) -> None:
+    wallet = tt.Wallet(attach_to=node)
+    accounts = tt.AccountSet.create(number_of_accounts, "alice", secret="not-default-secret")
+
+    wallet.create_accounts(accounts)
+
+    created = node.api.database.find_accounts(accounts=list(accounts.names())).accounts
+    for account, public_key in zip(created, accounts.public_keys(), strict=True):
+        for authority in (account.owner, account.active, account.posting):
+            assert [str(key) for key, _ in authority.key_auths] == [public_key]
+        assert str(account.memo_key) == public_key
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import test_tools as tt
+from test_tools.__private.wallet.create_accounts import InclusionTracker
+
+from tests.unit_tests.wallet_tests.local_tools import FakeNode
+
+
+def create_tracker(node: FakeNode) -> InclusionTracker:
+    return InclusionTracker(node)  # type: ignore[arg-type]
+
+
+def test_included_transactions_are_confirmed_with_single_scan() -> None:
+    node = FakeNode()
+    tracker = create_tracker(node)
+    accounts = tt.AccountSet([tt.Account("alice")])
+    for index in range(3):
+        tracker.track(f"trx-{index}", accounts, node.expiring_after(10))
+
+    node.produce_block("trx-0", "other")
+    node.produce_block("trx-1", "trx-2")
+
+    assert tracker.scan() == []
+    assert len(tracker) == 0
+    assert node.number_of_block_range_calls == 1
+
+
+def test_transaction_included_before_being_tracked_is_confirmed() -> None:
+    node = FakeNode()
+    tracker = create_tracker(node)
+    node.produce_block("trx")
+    tracker.scan()
+
+    tracker.track("trx", tt.AccountSet(), node.expiring_after(10))
+
+    assert len(tracker) == 0
+
+
+def test_expired_transactions_are_returned() -> None:
+    node = FakeNode()
+    tracker = create_tracker(node)
+    accounts = tt.AccountSet([tt.Account("alice")])
+    tracker.track("included", tt.AccountSet(), node.expiring_after(2))
+    tracker.track("lost", accounts, node.expiring_after(2))
+
+    node.produce_block("included")
+    assert tracker.scan() == []
+
+    node.produce_block()
+    assert tracker.scan() == [accounts]
+    assert len(tracker) == 0
+
+
+def test_transactions_waiting_longer_than_scan_interval_are_overdue() -> None:
+    node = FakeNode()
+    tracker = create_tracker(node)
+    tracker.track("waiting", tt.AccountSet(), node.expiring_after(10))
+    tracker.scan()
+    tracker.track("new", tt.AccountSet(), node.expiring_after(10))
+
+    assert tracker.number_of_overdue == 0
+
+    node.produce_block("new")
+    tracker.scan()
+
+    assert tracker.number_of_included_by_last_scan == 1
+    assert tracker.number_of_overdue == 1
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private.wallet.async_wallet import InclusionWatcher
+
+from tests.unit_tests.wallet_tests.local_tools import START_TIME, FakeAsyncNode
+
+NUMBER_OF_TRANSACTIONS: Final[int] = 300
+
+
+def create_watcher(node: FakeAsyncNode) -> InclusionWatcher:
+    return InclusionWatcher(node, scan_interval=0)  # type: ignore[arg-type]
+
+
+def test_many_transactions_are_confirmed_with_single_scan() -> None:
+    node = FakeAsyncNode(produce_block_on_head_request=True)
+
+    async def send_all() -> list[tuple[int, int]]:
+        watcher = create_watcher(node)
+        expiration = START_TIME + timedelta(hours=1)
+        futures = []
+        for index in range(NUMBER_OF_TRANSACTIONS):
+            futures.append(watcher.watch(f"trx-{index}", expiration, head_block_number=len(node.blocks)))
+            node.broadcast.append(f"trx-{index}")
+        return await asyncio.gather(*futures)
+
+    positions = asyncio.run(send_all())
+
+    assert positions == [(2, index) for index in range(NUMBER_OF_TRANSACTIONS)]
+    assert node.number_of_block_range_calls == 1
+
+
+def test_expired_transaction_raises() -> None:
+    node = FakeAsyncNode(produce_block_on_head_request=True)
+
+    async def send_lost_transaction() -> None:
+        watcher = create_watcher(node)
+        await watcher.watch("lost", START_TIME, head_block_number=len(node.blocks))
+
+    with pytest.raises(tt.exceptions.TransactionExpiredError):
+        asyncio.run(send_lost_transaction())
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private.wallet.local_signer import LocalSigner, decode_wif
+from test_tools.__private.wallet.wallet import Wallet
+
+from wax.cpp_python_bridge import get_public_key_from_signature
+
+INITMINER_PRIVATE_KEY: Final[str] = "5JNHfZYKGaomSFvd4NUdQ9qMcEAC43kujbfjueTHpVapX1Kzq2n"
+INITMINER_PUBLIC_KEY: Final[str] = "STM6LLegbAgLAy28EHrffBVuANFWcFgmqRMW13wBmTExqFE9SCkg4"
+
+
+def test_imported_key_is_available_by_its_public_key() -> None:
+    signer = LocalSigner([INITMINER_PRIVATE_KEY])
+
+    assert signer.public_keys == {INITMINER_PUBLIC_KEY}
+    assert INITMINER_PUBLIC_KEY in signer
+
+
+@pytest.mark.parametrize("message", [b"", b"transaction", b"another transaction"])
+def test_signature_is_canonical_and_recovers_to_signing_key(message: bytes) -> None:
+    signer = LocalSigner([INITMINER_PRIVATE_KEY])
+    digest = hashlib.sha256(message).hexdigest()
+
+    signature = signer.sign_digest(digest, INITMINER_PUBLIC_KEY)
+
+    assert len(bytes.fromhex(signature)) == 65  # noqa: PLR2004
+    assert get_public_key_from_signature(digest.encode(), signature.encode()).result.decode() == INITMINER_PUBLIC_KEY
+
+
+def test_private_key_with_invalid_checksum_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Invalid private key"):
+        decode_wif(INITMINER_PRIVATE_KEY[:-1] + "3")
+
+
+@pytest.mark.requires_hived_executables
+def test_transactions_are_signed_locally_by_wallet(node: tt.InitNode) -> None:
+    wallet = tt.Wallet(attach_to=node, signer="local")
+    wallet.create_account("alice", hives=tt.Asset.Test(10))
+
+    wallet.api.transfer("alice", "initminer", tt.Asset.Test(1), "memo")
+    wallet.restart()
+    wallet.api.transfer("alice", "initminer", tt.Asset.Test(1), "memo")
+
+    assert node.api.database.find_accounts(accounts=["alice"]).accounts[0].balance == tt.Asset.Test(8)
+
+
+@pytest.mark.requires_hived_executables
+def test_keys_of_reopened_beekeeper_wallet_are_used_by_wallet_with_local_signer(node: tt.InitNode) -> None:
+    wallet = Wallet(attach_to=node, signer="local")
+    alice = tt.Account("alice")
+    wallet.api.create_account_with_keys("initminer", alice.name, "{}", *[alice.public_key] * 4)
+    wallet.api.transfer("initminer", alice.name, tt.Asset.Test(10), "memo")
+    wallet.beekeeper_wallet.import_key(private_key=alice.private_key)  # not known by local signer
+
+    wallet.restart()
+    wallet.api.transfer(alice.name, "initminer", tt.Asset.Test(1), "memo")
+
+    assert node.api.database.find_accounts(accounts=[alice.name]).accounts[0].balance == tt.Asset.Test(9)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+from test_tools.__private.wallet import wallet
+
+from tests.unit_tests.wallet_tests.local_tools import CHAIN_ID, FakeNode
+
+
+@pytest.fixture
+def wallet_without_beekeeper(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(wallet.Wallet, "run", lambda *_, **__: None)
+    monkeypatch.setattr(wallet, "get_hive_protocol_config", lambda _: {"IS_TEST_NET": "true"})
+
+
+@pytest.mark.usefixtures("wallet_without_beekeeper")
+def test_node_run_info_is_fetched_once_per_node_run() -> None:
+    node = FakeNode()
+    tested_wallet = wallet.Wallet(attach_to=node)  # type: ignore[arg-type]
+
+    chain_ids = [tested_wallet._Wallet__get_chain_id() for _ in range(10)]  # type: ignore[attr-defined]
+
+    assert chain_ids == [CHAIN_ID] * 10
+    assert node.number_of_get_config_calls == 1
+    assert node.number_of_get_version_calls == 1
+
+
+@pytest.mark.usefixtures("wallet_without_beekeeper")
+def test_node_run_info_is_fetched_again_after_node_restart() -> None:
+    node = FakeNode()
+    tested_wallet = wallet.Wallet(attach_to=node)  # type: ignore[arg-type]
+
+    node.run_id += 1
+    tested_wallet._Wallet__get_chain_id()  # type: ignore[attr-defined]
+    tested_wallet._Wallet__get_chain_id()  # type: ignore[attr-defined]
+
+    assert node.number_of_get_config_calls == 2  # noqa: PLR2004
+    assert node.number_of_get_version_calls == 2  # noqa: PLR2004
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from test_tools.__private.wallet import wallet
+from test_tools.__private.wallet.tapos_provider import TaposProvider
+
+from tests.unit_tests.wallet_tests.local_tools import FakeNode
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_reference_is_fetched_once_per_block_interval_for_all_users_of_node() -> None:
+    node = FakeNode()
+
+    references = [TaposProvider.for_node(node).get() for _ in range(100)]  # type: ignore[arg-type]
+
+    assert node.number_of_dgpo_calls == 1
+    assert references[0].ref_block_num == node.head_block_number
+    assert references[0].head_block_time == node.head_block_time
+
+
+def test_reference_is_refetched_after_node_restart_and_on_request() -> None:
+    node = FakeNode()
+    provider = TaposProvider(node)  # type: ignore[arg-type]
+    provider.get()
+
+    node.run_id += 1
+    provider.get()
+    provider.get(refresh=True)
+    provider.get()
+
+    assert node.number_of_dgpo_calls == 3  # noqa: PLR2004
+
+
+def test_single_transaction_expires_after_head_block_generated_in_the_meantime(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(wallet.Wallet, "run", lambda *_, **__: None)
+    monkeypatch.setattr(wallet, "get_hive_protocol_config", lambda _: {"IS_TEST_NET": "true"})
+    node = FakeNode()
+    tested_wallet = wallet.Wallet(attach_to=node)  # type: ignore[arg-type]
+    tested_wallet._Wallet__generate_transaction_template(node)  # type: ignore[attr-defined]
+
+    for _ in range(20):  # e.g. with debug_generate_blocks
+        node.produce_block()
+    transaction = tested_wallet._Wallet__generate_transaction_template(node)  # type: ignore[attr-defined]
+
+    assert transaction.expiration > node.head_block_time
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Final
+
+import pytest
+import test_tools as tt
+from test_tools.__private.wallet.threaded_inclusion_watcher import ThreadedInclusionWatcher
+
+from tests.unit_tests.wallet_tests.local_tools import START_TIME, FakeNode
+
+NUMBER_OF_TRANSACTIONS: Final[int] = 1000
+
+
+def test_many_transactions_are_confirmed_with_single_scan() -> None:
+    node = FakeNode(produce_block_on_head_request=True)
+    watcher = ThreadedInclusionWatcher(node, scan_interval=0.1)  # type: ignore[arg-type]
+    expiration = START_TIME + timedelta(hours=1)
+
+    futures = []
+    for index in range(NUMBER_OF_TRANSACTIONS):
+        futures.append(watcher.watch(f"trx-{index}", expiration, head_block_number=len(node.blocks)))
+        node.broadcast.append(f"trx-{index}")
+
+    assert [future.result(timeout=10) for future in futures] == [(2, index) for index in range(NUMBER_OF_TRANSACTIONS)]
+    assert node.number_of_block_range_calls == 1
+    assert len(watcher) == 0
+
+
+def test_expired_transaction_raises() -> None:
+    node = FakeNode(produce_block_on_head_request=True)
+    watcher = ThreadedInclusionWatcher(node, scan_interval=0)  # type: ignore[arg-type]
+
+    future = watcher.watch("lost", START_TIME, head_block_number=len(node.blocks))
+
+    with pytest.raises(tt.exceptions.TransactionExpiredError):
+        future.result(timeout=10)